@@ -0,0 +1,384 @@
+#------------------------- SCALE BENCHMARK --------------------------------------------------
+# Times the hot path of every role on synthetic databases of several sizes.
+#
+# For each size a dataset is generated once with generate_dataset.py (cached under
+# --work) and measured in a fresh process started in its project root, because the
+# role modules open Cinema/Database relative to the working directory. Each
+# operation is run once cold, with the table cache dropped, then repeated warm for
+# --seconds. Reported per operation:
+#   ops_per_sec, p50_ms, p99_ms  warm latency
+#   cold_ms                      first call, reading the tables it needs
+#   opens_per_op                 files opened per warm call
+#   peak_kb                      memory allocated at the peak of a cold call (tracemalloc)
+# plus the peak RSS of the whole process per size. The large size keeps 5M
+# bookings in memory and needs several GB of RAM.
+#
+# Results are saved as JSON. compare checks a run against a saved baseline and
+# exits with status 1 if an operation's median latency or peak memory grew by more
+# than the tolerance, or it opens more files, so it can gate a change. p99 and cold
+# times come from few samples and are shown but not gated. The committed
+# bench_baseline.json was measured on one machine; record your own before comparing.
+#
+# Run from the project root:
+#   python Cinema/Code/bench_scale.py run [--sizes small medium large] [--durability none] [--json results.json]
+#   python Cinema/Code/bench_scale.py compare Cinema/Code/bench_baseline.json results.json [--tolerance 0.5]
+import argparse
+import builtins
+import contextlib
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from generate_dataset import PRESETS, generate
+from storage import DURABILITY_ENV, DURABILITY_MODES, durability_from_environment
+
+DATABASE_DIR = os.path.join("Cinema", "Database")
+DATASET_MARKER = ".generated"
+SAMPLES = 1000
+# Latency and peak memory below these floors are too small to compare reliably.
+MIN_COMPARED_MS = 0.05
+MIN_COMPARED_KB = 64
+
+_opens = [0]
+
+
+def _count_opens(event, args):
+    if event == "open":
+        _opens[0] += 1
+
+
+def dataset_root(work, size, seed):
+    """
+    Generates the dataset for a size unless it is already cached.
+
+    Args:
+        work (str): Directory holding the cached datasets.
+        size (str): Name of a generate_dataset preset.
+        seed (int): Random seed.
+
+    Returns:
+        str: Project root whose Cinema/Database holds the dataset.
+    """
+    root = os.path.join(work, f'{size}-seed{seed}')
+    database_dir = os.path.join(root, DATABASE_DIR)
+    marker = os.path.join(database_dir, DATASET_MARKER)
+    if not os.path.exists(marker):
+        os.makedirs(database_dir, exist_ok=True)
+        print(f'Generating {size} dataset in {root} ...', file=sys.stderr)
+        generate(database_dir, seed, *PRESETS[size])
+        with open(marker, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"size": size, "seed": seed}))
+    return root
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, round(fraction * (len(sorted_values) - 1)))]
+
+
+def drop_table_cache():
+    from storage import invalidate_table
+    for name in os.listdir(DATABASE_DIR):
+        invalidate_table(os.path.join(DATABASE_DIR, name))
+
+
+def time_operation(operation, seconds, min_runs):
+    """
+    Measures one operation cold, warm and under tracemalloc.
+
+    Args:
+        operation (callable): The operation, called without arguments.
+        seconds (float): Time to spend on warm runs.
+        min_runs (int): Fewest warm runs, however long they take.
+
+    Returns:
+        dict: The measurements.
+    """
+    drop_table_cache()
+    start = time.perf_counter()
+    operation()
+    cold = time.perf_counter() - start
+
+    latencies = []
+    opens = _opens[0]
+    deadline = time.perf_counter() + seconds
+    while len(latencies) < min_runs or time.perf_counter() < deadline:
+        start = time.perf_counter()
+        operation()
+        latencies.append(time.perf_counter() - start)
+    opens = _opens[0] - opens
+
+    drop_table_cache()
+    tracemalloc.start()
+    operation()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "runs": len(latencies),
+        "ops_per_sec": round(len(latencies) / sum(latencies), 1),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 4),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 4),
+        "cold_ms": round(cold * 1000, 3),
+        "opens_per_op": round(opens / len(latencies), 2),
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+@contextlib.contextmanager
+def scripted_menu(answers):
+    """
+    Answers a menu's input() prompts from a list and discards what it prints.
+
+    Args:
+        answers (list): Answers in prompt order; the list is replayed from the start on every call.
+
+    Yields:
+        callable: Call before each run to rewind the answers.
+    """
+    import role_manager
+    position = [0]
+
+    def answer(prompt=""):
+        position[0] += 1
+        return answers[(position[0] - 1) % len(answers)]
+
+    def rewind():
+        position[0] = 0
+
+    saved = builtins.input, role_manager.clear_terminal
+    builtins.input, role_manager.clear_terminal = answer, lambda: None
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            yield rewind
+    finally:
+        builtins.input, role_manager.clear_terminal = saved
+
+
+def operations(counter_dir):
+    """
+    Builds the benchmarked operations over the dataset in the working directory.
+
+    Each operation cycles through SAMPLES IDs drawn with a fixed seed, so runs are comparable.
+
+    Args:
+        counter_dir (str): Scratch directory for the ID counter, so the dataset is left unchanged.
+
+    Returns:
+        list: (name, callable, scripted answers or None) for every operation.
+    """
+    import role_manager
+    import role_customer
+    from storage import load_table, split_line
+    from ids import next_id
+
+    rng = random.Random(0)
+    showtimes = load_table(role_customer.SHOW_FILE).rows()
+    movies = load_table(role_customer.MOVIE_FILE)
+    sampled_showtimes = [rng.choice(showtimes) for _ in range(SAMPLES)]
+    movie_lines = [line for line in movies.lines[1:] if line.strip()]
+    movie_ids = [row[0] for row in movies.rows()]
+    counter = os.path.join(counter_dir, "COUNTER_customer_id.txt")
+
+    def cycle(values):
+        position = [0]
+
+        def take():
+            position[0] = (position[0] + 1) % len(values)
+            return values[position[0]]
+        return take
+
+    next_showtime = cycle(sampled_showtimes)
+    next_line = cycle(movie_lines)
+    next_slot = cycle([(showtime[3], rng.randrange(9 * 60, 21 * 60, 5)) for showtime in sampled_showtimes])
+
+    def lookup_entry():
+        role_manager.lookup_entry(role_customer.SHOW_FILE, next_showtime()[0])
+
+    def conflict_scan():
+        date, start = next_slot()
+        parsed_start = datetime.strptime(f'{date} {start // 60:02}{start % 60:02}', "%d-%m-%Y %H%M")
+        role_manager.free_auditoriums(date, parsed_start, role_manager.round_time(parsed_start + timedelta(minutes=125)))
+
+    def seat_map():
+        showtime = next_showtime()
+        role_customer.print_seat_map(showtime[2], role_customer.seats_taken_for_show(showtime[0]), role_customer.load_auditorium_seats())
+
+    return [
+        ("lookup_entry", lookup_entry, None),
+        ("split_line", lambda: split_line(next_line()), None),
+        ("seats_taken_for_show", lambda: role_customer.seats_taken_for_show(next_showtime()[0]), None),
+        ("view_booking_reports", role_manager.view_booking_reports, ["Y", rng.choice(movie_ids), ""]),
+        ("view_revenue_summary", role_manager.view_revenue_summary, [""]),
+        ("add_showtime_conflict_scan", conflict_scan, None),
+        ("load_auditorium_seats+print_seat_map", seat_map, [""]),
+        ("next_id", lambda: next_id(counter, "C", 4, seed_file=role_customer.CUSTOMER_FILE), None),
+    ]
+
+
+def measure(seconds, min_runs):
+    """
+    Measures every operation on the dataset in the working directory.
+
+    Args:
+        seconds (float): Time to spend on warm runs of each operation.
+        min_runs (int): Fewest warm runs of each operation.
+
+    Returns:
+        dict: Maps each operation name to its measurements, plus "process" with the peak RSS.
+    """
+    os.environ.pop("CINEMA_SERVER", None)
+    sys.addaudithook(_count_opens)
+    results = {}
+    with tempfile.TemporaryDirectory() as counter_dir:
+        for name, operation, answers in operations(counter_dir):
+            if answers is None:
+                results[name] = time_operation(operation, seconds, min_runs)
+                continue
+            with scripted_menu(answers) as rewind:
+                def run():
+                    rewind()
+                    operation()
+                results[name] = time_operation(run, seconds, min_runs)
+    try:
+        import resource
+        results["process"] = {"max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}
+    except ImportError:
+        results["process"] = {}
+    return results
+
+
+def run(args):
+    sizes = {}
+    environment = dict(os.environ, **{DURABILITY_ENV: args.durability})
+    for size in args.sizes:
+        root = dataset_root(args.work, size, args.seed)
+        print(f'Measuring {size} ...', file=sys.stderr)
+        output = subprocess.run([sys.executable, os.path.abspath(__file__), "measure", "--seconds", str(args.seconds), "--min-runs", str(args.min_runs)],
+                                cwd=root, env=environment, check=True, stdout=subprocess.PIPE, text=True).stdout
+        sizes[size] = json.loads(output.strip().splitlines()[-1])
+        print_size(size, sizes[size])
+    report = {
+        "created": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "seed": args.seed,
+        "durability": args.durability,
+        "sizes": sizes,
+    }
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        print(f'Saved results to {args.json}')
+
+
+def print_size(size, results):
+    print(f'\n{size.upper()} ({", ".join(str(n) for n in PRESETS[size])} auditoriums/movies/showtimes/bookings/customers)')
+    print(f'{"operation":38}{"ops/sec":>12}{"p50 ms":>10}{"p99 ms":>10}{"cold ms":>11}{"opens":>8}{"peak KB":>11}')
+    for name, result in results.items():
+        if name != "process":
+            print(f'{name:38}{result["ops_per_sec"]:>12,.0f}{result["p50_ms"]:>10.3f}{result["p99_ms"]:>10.3f}'
+                  f'{result["cold_ms"]:>11.1f}{result["opens_per_op"]:>8.2f}{result["peak_kb"]:>11,.0f}')
+    if results.get("process"):
+        print(f'peak RSS: {results["process"]["max_rss_kb"] / 1024:,.0f} MB')
+
+
+def regressions(baseline, current, tolerance):
+    """
+    Compares two result files.
+
+    Args:
+        baseline (dict): The saved baseline.
+        current (dict): The new results.
+        tolerance (float): Allowed relative slowdown or growth, e.g. 0.25 for 25%.
+
+    Returns:
+        list: One message per regression.
+    """
+    found = []
+    for size, operations_results in current["sizes"].items():
+        for name, result in operations_results.items():
+            before = baseline.get("sizes", {}).get(size, {}).get(name)
+            if name == "process" or before is None:
+                continue
+            checks = [
+                ("p50_ms", before["p50_ms"], result["p50_ms"], MIN_COMPARED_MS),
+                ("peak_kb", before["peak_kb"], result["peak_kb"], MIN_COMPARED_KB),
+            ]
+            for metric, old, new, floor in checks:
+                if new > max(old, floor) * (1 + tolerance):
+                    found.append(f'{size} {name}: {metric} {old:g} -> {new:g} (+{(new / max(old, floor) - 1) * 100:.0f}%)')
+            if result["opens_per_op"] > before["opens_per_op"] + 0.01:
+                found.append(f'{size} {name}: opens_per_op {before["opens_per_op"]:g} -> {result["opens_per_op"]:g}')
+    return found
+
+
+def compare(args):
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(args.results, "r", encoding="utf-8") as f:
+        current = json.load(f)
+    for size, results in current["sizes"].items():
+        before = baseline["sizes"].get(size, {})
+        print(f'\n{size.upper()}')
+        print(f'{"operation":38}{"base ops/sec":>14}{"ops/sec":>12}{"change":>9}')
+        for name, result in results.items():
+            if name != "process" and name in before:
+                change = result["ops_per_sec"] / before[name]["ops_per_sec"] - 1
+                print(f'{name:38}{before[name]["ops_per_sec"]:>14,.0f}{result["ops_per_sec"]:>12,.0f}{change * 100:>+8.0f}%')
+    found = regressions(baseline, current, args.tolerance)
+    print()
+    if found:
+        print(f'{len(found)} regression(s) beyond {args.tolerance * 100:.0f}%:')
+        for message in found:
+            print("  " + message)
+        sys.exit(1)
+    print(f'No regressions beyond {args.tolerance * 100:.0f}%.')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark every role's hot path on synthetic databases of several sizes.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="generate the datasets if needed and measure them")
+    run_parser.add_argument("--sizes", nargs="+", choices=sorted(PRESETS), default=["small", "medium"], help="dataset sizes (default small medium)")
+    run_parser.add_argument("--seed", type=int, default=1, help="dataset seed (default 1)")
+    run_parser.add_argument("--work", default=os.path.join(tempfile.gettempdir(), "cinema-bench"), help="directory caching the generated datasets")
+    run_parser.add_argument("--seconds", type=float, default=1.0, help="time spent on warm runs of each operation (default 1)")
+    run_parser.add_argument("--min-runs", type=int, default=5, help="fewest warm runs of each operation (default 5)")
+    run_parser.add_argument("--durability", choices=DURABILITY_MODES, help=f'fsync mode for the writes measured (default ${DURABILITY_ENV} or "close")')
+    run_parser.add_argument("--json", help="file to save the results to")
+
+    compare_parser = commands.add_parser("compare", help="check saved results against a baseline")
+    compare_parser.add_argument("baseline", help="baseline results file")
+    compare_parser.add_argument("results", help="new results file")
+    compare_parser.add_argument("--tolerance", type=float, default=0.5, help="allowed relative growth of p50 latency and peak memory (default 0.5)")
+
+    measure_parser = commands.add_parser("measure", help="measure the dataset in the working directory and print JSON (used by run)")
+    measure_parser.add_argument("--seconds", type=float, default=1.0)
+    measure_parser.add_argument("--min-runs", type=int, default=5)
+
+    args = parser.parse_args()
+    try:
+        durability = durability_from_environment()
+    except ValueError as e:
+        parser.error(str(e))
+    if args.command == "run":
+        args.durability = args.durability or durability
+        run(args)
+    elif args.command == "compare":
+        compare(args)
+    else:
+        json.dump(measure(args.seconds, args.min_runs), sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
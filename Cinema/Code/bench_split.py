@@ -0,0 +1,83 @@
+#------------------------- SPLIT BENCHMARK --------------------------------------------------
+# Micro-benchmark of the field splitter on movie_listings.txt rows, which carry
+# long quoted descriptions and cast lists. Compares the old character-by-character
+# loop with storage.split_line and prints rows per second for each.
+#
+# Run from the project root:
+#   python Cinema/Code/bench_split.py [--rows N]
+import argparse
+import time
+
+from storage import split_line
+
+MOVIE_FILE = "Cinema/Database/movie_listings.txt"
+
+
+def split_line_loop(line):
+    """
+    The original splitter, kept here as the baseline.
+
+    Args:
+        line (str): The line to be split.
+
+    Returns:
+        list: A list of the fields that makes up the line.
+    """
+    fields = []
+    placeholder = ''
+    in_quotes = False
+    for char in line:
+        if char == '"':
+            in_quotes = not in_quotes
+            placeholder += char
+        elif char == ',' and not in_quotes:
+            fields.append(placeholder.strip())
+            placeholder = ''
+        else:
+            placeholder += char
+    if placeholder:
+        fields.append(placeholder.strip())
+    return [i.strip('"') for i in fields]
+
+
+def rows_per_second(split, lines, rows):
+    """
+    Times a splitter over the sample lines, repeated until rows lines were split.
+
+    Args:
+        split (callable): The splitter.
+        lines (list): Sample lines.
+        rows (int): Number of lines to split.
+
+    Returns:
+        float: Lines split per second.
+    """
+    repeats = rows // len(lines) + 1
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for line in lines:
+            split(line)
+    return repeats * len(lines) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the field splitter on movie listing rows.")
+    parser.add_argument("--rows", type=int, default=200000, help="number of rows to split per splitter")
+    args = parser.parse_args()
+
+    with open(MOVIE_FILE, "r", encoding="utf-8") as f:
+        lines = [line for line in f.readlines()[1:] if line.strip()]
+    for line in lines:
+        if split_line(line) != split_line_loop(line):
+            raise SystemExit(f'Splitters disagree on: {line!r}')
+
+    average = sum(len(line) for line in lines) / len(lines)
+    print(f'{len(lines)} movie rows, {average:.0f} characters on average, {args.rows} rows per splitter')
+    before = rows_per_second(split_line_loop, lines, args.rows)
+    after = rows_per_second(split_line, lines, args.rows)
+    print(f'character loop: {before:12,.0f} rows/sec')
+    print(f'split_line:     {after:12,.0f} rows/sec  ({after / before:.1f}x)')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#------------------------- BOOKING CLIENT --------------------------------------------------
+# Terminal side of the booking server (see booking_server.py).
+#
+# BookingClient has the same methods as services.BookingService and raises the
+# same errors, so the clerk and customer menus work unchanged against either.
+# open_booking_service picks one: if CINEMA_SERVER is set, e.g.
+#   CINEMA_SERVER=unix:Cinema/Database/booking.sock
+#   CINEMA_SERVER=127.0.0.1:8765
+# the terminal becomes a client of that server, otherwise it works on the files
+# directly as before.
+import json
+import os
+import socket
+
+from services import BookingService, default_holder
+from protocol import SERVER_ENV, parse_address, decode_value, decode_error, dump
+
+
+class BookingClient:
+    """
+    Connection to a booking server, opened on first use and reopened after a failure.
+
+    A request that fails in transit is not retried, so a booking is never sent twice.
+
+    Attributes:
+        address (str): "unix:PATH" or "HOST:PORT".
+        timeout (float): Seconds to wait for the server.
+        holder (str): Name of this terminal, sent with every request that involves seat holds.
+    """
+
+    def __init__(self, address, timeout=10.0, holder=None):
+        self.address = address
+        self.timeout = timeout
+        self.holder = holder or default_holder()
+        self.sock = None
+        self.stream = None
+
+    def connect(self):
+        kind, target = parse_address(self.address)
+        if kind == "unix":
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(target)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+        self.stream = sock.makefile("rb")
+
+    def close(self):
+        if self.sock is not None:
+            self.stream.close()
+            self.sock.close()
+        self.sock = self.stream = None
+
+    def call(self, op, **args):
+        """
+        Sends one request and waits for its response.
+
+        Args:
+            op (str): Name of the BookingService method.
+            **args: Its keyword arguments.
+
+        Returns:
+            Any: The method's result.
+
+        Raises:
+            ServiceError: The error the method raised on the server.
+            OSError: If the server cannot be reached, or the file error the method raised on the server.
+        """
+        if self.sock is None:
+            self.connect()
+        try:
+            self.sock.sendall(dump({"op": op, "args": args}))
+            line = self.stream.readline()
+        except OSError:
+            self.close()
+            raise
+        if not line:
+            self.close()
+            raise ConnectionError(f'Booking server at {self.address} closed the connection.')
+        response = json.loads(line)
+        if not response.get("ok"):
+            raise decode_error(response)
+        return decode_value(response.get("result"))
+
+    def showtime(self, showtime_id):
+        return self.call("showtime", showtime_id=showtime_id)
+
+    def taken_seats(self, showtime_id, holder=None):
+        return self.call("taken_seats", showtime_id=showtime_id, holder=holder or self.holder)
+
+    def check_seats(self, showtime_id, seats, holder=None):
+        return self.call("check_seats", showtime_id=showtime_id, seats=seats, holder=holder or self.holder)
+
+    def hold(self, showtime_id, seats, holder=None):
+        return self.call("hold", showtime_id=showtime_id, seats=seats, holder=holder or self.holder)
+
+    def release(self, showtime_id, holder=None):
+        return self.call("release", showtime_id=showtime_id, holder=holder or self.holder)
+
+    def quote(self, showtime_id, seats, normal, discounted=0, holder=None):
+        return self.call("quote", showtime_id=showtime_id, seats=seats, normal=normal, discounted=discounted, holder=holder or self.holder)
+
+    def book(self, showtime_id, customer_id, seats, normal, discounted=0, holder=None):
+        return self.call("book", showtime_id=showtime_id, customer_id=customer_id, seats=seats, normal=normal, discounted=discounted,
+                         holder=holder or self.holder)
+
+    def get(self, booking_id):
+        return self.call("get", booking_id=booking_id)
+
+    def bookings_for(self, customer_id):
+        return self.call("bookings_for", customer_id=customer_id)
+
+    def cancel(self, booking_id, customer_id=None):
+        return self.call("cancel", booking_id=booking_id, customer_id=customer_id)
+
+    def revenue(self):
+        return self.call("revenue")
+
+
+def open_booking_service(database_dir):
+    """
+    Chooses where a terminal's bookings go.
+
+    Args:
+        database_dir (str): Directory holding the database files, used when no server is configured.
+
+    Returns:
+        BookingClient or BookingService: A client of the server named by CINEMA_SERVER, or a local service.
+    """
+    address = os.environ.get(SERVER_ENV, "").strip()
+    if address:
+        return BookingClient(address)
+    return BookingService(database_dir)
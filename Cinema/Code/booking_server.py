@@ -0,0 +1,151 @@
+#------------------------- BOOKING SERVER --------------------------------------------------
+# Local asyncio server that owns the booking tables for every clerk and kiosk terminal.
+#
+# Terminals started with CINEMA_SERVER set (see booking_client.py) send their
+# booking operations here instead of checking seats and appending to the files
+# themselves. The server keeps the tables and seat indexes in memory and runs the
+# operations one at a time, in the order they arrive, on a single worker thread, so
+# the seat check and the append of one booking can never interleave with another
+# terminal's. Operations work on in-memory indexes and take microseconds, so one
+# worker serves dozens of terminals. The files stay the source of truth: they are
+# appended to as before, so reports, the manager role and a restarted server see
+# every booking. Other processes may still write them; while one holds a file lock
+# (the manager role, or a compaction) the worker waits for it, but the event loop
+# keeps accepting terminals and reading their requests.
+#
+# Run from the project root:
+#   python Cinema/Code/booking_server.py [--listen unix:Cinema/Database/booking.sock | --listen 127.0.0.1:8765]
+import argparse
+import asyncio
+import json
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+
+from services import BookingService, ServiceError, DATABASE_DIR
+from storage import durability_from_environment
+from protocol import OPERATIONS, DEFAULT_PORT, parse_address, encode_value, encode_error, dump
+
+
+class BookingServer:
+    """
+    Dispatches protocol requests to a BookingService.
+
+    Attributes:
+        service (BookingService): The service doing the work.
+        clients (int): Number of connected terminals.
+        requests (int): Number of requests handled.
+        worker (ThreadPoolExecutor): The single thread every request runs on.
+    """
+
+    def __init__(self, service):
+        self.service = service
+        self.clients = 0
+        self.requests = 0
+        self.worker = ThreadPoolExecutor(max_workers=1)
+
+    def handle_request(self, request):
+        """
+        Runs one request.
+
+        Args:
+            request (dict): The decoded request line.
+
+        Returns:
+            dict: The response.
+        """
+        self.requests += 1
+        if not isinstance(request, dict):
+            request = {}
+        op = request.get("op")
+        args = request.get("args") or {}
+        if op not in OPERATIONS or not isinstance(args, dict):
+            return {"ok": False, "error": "InvalidRequestError", "message": f'Unknown operation "{op}".'}
+        try:
+            result = getattr(self.service, op)(**args)
+        except (ServiceError, OSError) as e:
+            return encode_error(e)
+        except Exception as e:
+            # Arguments of the wrong type fail inside the service (a number where seat IDs
+            # belong raises AttributeError); answer them rather than drop the connection.
+            return {"ok": False, "error": "InvalidRequestError", "message": f'Bad arguments for "{op}": {e}'}
+        return {"ok": True, "result": encode_value(result)}
+
+    async def serve_client(self, reader, writer):
+        """
+        Answers the requests of one terminal until it disconnects.
+
+        Args:
+            reader (asyncio.StreamReader): Incoming request lines.
+            writer (asyncio.StreamWriter): Outgoing response lines.
+
+        Returns:
+            None
+        """
+        self.clients += 1
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    response = {"ok": False, "error": "InvalidRequestError", "message": "Request is not valid JSON."}
+                else:
+                    response = await asyncio.get_running_loop().run_in_executor(self.worker, self.handle_request, request)
+                writer.write(dump(response))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.clients -= 1
+            writer.close()
+
+
+async def serve(address, service):
+    """
+    Listens on an address and serves terminals until cancelled.
+
+    Args:
+        address (str): "unix:PATH" or "HOST:PORT".
+        service (BookingService): The service doing the work.
+
+    Returns:
+        None
+    """
+    server = BookingServer(service)
+    kind, target = parse_address(address)
+    if kind == "unix":
+        # A socket file left behind by a server that was killed would make the bind fail.
+        if os.path.exists(target) and stat.S_ISSOCK(os.stat(target).st_mode):
+            os.remove(target)
+        listener = await asyncio.start_unix_server(server.serve_client, path=target)
+    else:
+        listener = await asyncio.start_server(server.serve_client, host=target[0], port=target[1])
+    print(f'Booking server listening on {address}')
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        server.worker.shutdown(wait=False)
+
+
+def main():
+    default = "unix:" + os.path.join(DATABASE_DIR, "booking.sock") if hasattr(asyncio, "start_unix_server") else f'127.0.0.1:{DEFAULT_PORT}'
+    parser = argparse.ArgumentParser(description="Serve bookings to clerk and customer terminals started with CINEMA_SERVER set.")
+    parser.add_argument("--listen", default=default, help=f'unix:PATH or HOST:PORT (default {default})')
+    parser.add_argument("--database", default=DATABASE_DIR, help=f'directory holding the table files (default {DATABASE_DIR})')
+    args = parser.parse_args()
+    try:
+        durability_from_environment()
+    except ValueError as e:
+        parser.error(str(e))
+    try:
+        asyncio.run(serve(args.listen, BookingService(args.database)))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+#------------------------- BOOKINGS --------------------------------------------------
+# Append-only booking log with a per-showtime seat-occupancy index.
+#
+# Rows follow the movie_bookings.txt header:
+#   booking_id, showtime_id, customer_id, seat_ids, normal_discounted_tickets
+# A cancellation does not rewrite the file. It appends a tombstone line
+#   CANCELLED, booking_id
+# which cancels every earlier row with that booking ID. Once enough of the file is
+# dead (cancelled rows plus their tombstones), a background compaction rewrites it
+# with only the live bookings.
+#
+# The seat index is built in one pass when the bookings file is loaded and is kept
+# up to date on every booking appended or cancelled through this module, or by
+# another process (only the appended lines are read, see storage.py), so seat
+# availability checks cost the same however many bookings exist. Occupied seats
+# are stored as bitmasks (see seating.py).
+#
+# Booking and cancelling also keep the running revenue aggregates in
+# revenue_summary.txt, and the amounts each booking added to them in
+# booking_revenue.txt, up to date (see revenue.py).
+import os
+import threading
+
+from storage import Table, load_table, append_row, rewrite_table
+from seating import seat_mask
+from revenue import revenue_paths, load_ledger, record_revenue, rebuild_revenue, keep_priced
+from locking import file_lock
+
+TOMBSTONE = "CANCELLED"
+COMPACT_RATIO = 0.3
+
+_lock = threading.RLock()
+
+
+def split_seats(seats_text):
+    """
+    Splits a seat_ids field into individual seat IDs.
+
+    Args:
+        seats_text (str): Seat IDs separated by "|".
+
+    Returns:
+        list: Non-empty seat IDs.
+    """
+    return [seat.strip() for seat in seats_text.split("|") if seat.strip() != ""]
+
+
+class BookingTable(Table):
+    """
+    Booking log that indexes live bookings and occupied seats by showtime.
+
+    Rows are only ever appended; update_row and remove_row are not used on this table.
+
+    Attributes:
+        live (dict): Maps a booking ID to the positions of its live rows.
+        by_showtime (dict): Maps a showtime ID to the positions of its live rows.
+        seats (dict): Maps a showtime ID to the bitmask of seats booked for it.
+        dead (int): Number of cancelled rows and tombstones in the file.
+    """
+
+    def __init__(self, filename):
+        super().__init__(filename)
+        self.live = {}
+        self.by_showtime = {}
+        self.seats = {}
+        self.dead = 0
+        for position in range(1, len(self.records)):
+            self.apply(position)
+
+    def apply(self, position):
+        """
+        Adds the row at a position to the live indexes, or applies it as a tombstone.
+
+        Args:
+            position (int): Position of the row in records.
+
+        Returns:
+            None
+        """
+        record = self.records[position]
+        if record[0] == TOMBSTONE:
+            self.dead += 1
+            if len(record) > 1:
+                self.kill(record[1])
+            return
+        if len(record) < 4:
+            return
+        self.live.setdefault(record[0], []).append(position)
+        self.by_showtime.setdefault(record[1], []).append(position)
+        self.seats[record[1]] = self.seats.get(record[1], 0) | seat_mask(split_seats(record[3]))
+
+    def kill(self, booking_id):
+        """
+        Marks every live row of a booking as cancelled and frees its seats.
+
+        Args:
+            booking_id (str): ID of the booking.
+
+        Returns:
+            None
+        """
+        positions = self.live.pop(booking_id, [])
+        for position in positions:
+            self.dead += 1
+            showtime_id = self.records[position][1]
+            remaining = [p for p in self.by_showtime[showtime_id] if p != position]
+            taken = 0
+            for p in remaining:
+                taken |= seat_mask(split_seats(self.records[p][3]))
+            if remaining:
+                self.by_showtime[showtime_id] = remaining
+                self.seats[showtime_id] = taken
+            else:
+                del self.by_showtime[showtime_id]
+                self.seats.pop(showtime_id, None)
+
+    def added(self, record):
+        self.apply(len(self.records) - 1)
+
+    def get(self, entry_id):
+        positions = self.live.get(entry_id)
+        if not positions:
+            return None
+        return list(self.records[positions[0]])
+
+    def rows(self):
+        positions = sorted(p for ps in self.live.values() for p in ps)
+        return [list(self.records[p]) for p in positions]
+
+    def dead_ratio(self):
+        """
+        Calculates the share of data lines that are cancelled rows or tombstones.
+
+        Returns:
+            float: Ratio between 0 and 1.
+        """
+        total = len(self.records) - 1
+        return self.dead / total if total > 0 else 0.0
+
+    def compact(self):
+        """
+        Drops cancelled rows and tombstones from memory and writes the live rows back to the file.
+
+        Returns:
+            None
+        """
+        keep = [0] + sorted(p for ps in self.live.values() for p in ps)
+        self.lines = [self.lines[p] for p in keep]
+        self.records = [self.records[p] for p in keep]
+        if self.lines and not self.lines[-1].endswith("\n"):
+            self.lines[-1] += "\n"
+        self.reindex()
+        self.live = {}
+        self.by_showtime = {}
+        self.seats = {}
+        self.dead = 0
+        for position in range(1, len(self.records)):
+            self.apply(position)
+        rewrite_table(self)
+
+
+def load_bookings(filename):
+    """
+    Retrieves the in-memory booking table, reading the file only if it changed since it was cached.
+
+    Args:
+        filename (str): Path to the bookings file.
+
+    Returns:
+        BookingTable: The cached booking table.
+
+    Raises:
+        FileNotFoundError: If the bookings file does not exist.
+    """
+    with _lock:
+        return load_table(filename, BookingTable)
+
+
+def seats_taken(filename, showtime_id):
+    """
+    Retrieves the seats already booked for a showtime.
+
+    Args:
+        filename (str): Path to the bookings file.
+        showtime_id (str): ID of the showtime.
+
+    Returns:
+        int: Bitmask of booked seats, 0 if the bookings file does not exist.
+    """
+    try:
+        table = load_bookings(filename)
+    except FileNotFoundError:
+        return 0
+    return table.seats.get(showtime_id, 0)
+
+
+def add_booking(filename, booking_id, showtime_id, customer_id, seat_ids, tickets_text):
+    """
+    Appends a booking to the bookings file and marks its seats as taken.
+
+    Args:
+        filename (str): Path to the bookings file.
+        booking_id (str): ID of the new booking.
+        showtime_id (str): ID of the booked showtime.
+        customer_id (str): ID of the customer.
+        seat_ids (list): Seat IDs booked.
+        tickets_text (str): Normal and discounted ticket counts formatted as normal|discounted.
+
+    Returns:
+        None
+
+    Raises:
+        FileNotFoundError: If the bookings file does not exist.
+    """
+    record = [booking_id, showtime_id, customer_id, "|".join(seat_ids), tickets_text]
+    with _lock:
+        append_row(filename, ", ".join(record), BookingTable)
+        _track_revenue(filename, record, 1)
+
+
+def cancel_booking_entry(filename, booking_id):
+    """
+    Cancels a booking by appending a tombstone, and starts a compaction in the background if the file has too many dead lines.
+
+    Args:
+        filename (str): Path to the bookings file.
+        booking_id (str): ID of the booking to be cancelled.
+
+    Returns:
+        None
+
+    Raises:
+        FileNotFoundError: If the bookings file does not exist.
+    """
+    with _lock:
+        table = load_table(filename, BookingTable)
+        cancelled = [list(table.records[position]) for position in table.live.get(booking_id, [])]
+        append_row(filename, f'{TOMBSTONE}, {booking_id}', BookingTable)
+        for booking in cancelled:
+            _track_revenue(filename, booking, -1)
+        needs_compaction = load_table(filename, BookingTable).dead_ratio() >= COMPACT_RATIO
+    if needs_compaction:
+        threading.Thread(target=compact_bookings, args=(filename,)).start()
+
+
+def compact_bookings(filename):
+    """
+    Rewrites the bookings file without cancelled rows and tombstones.
+
+    Holds the bookings file lock, so no other process appends a booking that the rewrite would drop.
+
+    Args:
+        filename (str): Path to the bookings file.
+
+    Returns:
+        None
+    """
+    if not os.path.exists(filename):
+        return
+    with file_lock(filename), _lock:
+        try:
+            table = load_table(filename, BookingTable)
+        except FileNotFoundError:
+            return
+        if table.dead:
+            table.compact()
+            keep_priced(revenue_paths(filename)[2], table.live)
+
+
+def _track_revenue(filename, booking, sign):
+    revenue_file, showtimes_file, priced_file = revenue_paths(filename)
+    try:
+        if os.path.exists(revenue_file):
+            record_revenue(revenue_file, showtimes_file, priced_file, booking, sign)
+        else:
+            rebuild_revenue(revenue_file, showtimes_file, priced_file, load_table(filename, BookingTable).rows())
+    except OSError:
+        # The booking itself is already saved; rebuild_revenue_summary repairs the aggregates.
+        pass
+
+
+def revenue_summary(filename):
+    """
+    Retrieves the running revenue aggregates for a bookings file, building them from the bookings the first time.
+
+    Args:
+        filename (str): Path to the bookings file.
+
+    Returns:
+        RevenueLedger: The aggregates; ledger.get("total") gives the overall totals.
+
+    Raises:
+        FileNotFoundError: If the bookings file does not exist.
+    """
+    revenue_file = revenue_paths(filename)[0]
+    if not os.path.exists(revenue_file):
+        rebuild_revenue_summary(filename)
+    return load_ledger(revenue_file)
+
+
+def rebuild_revenue_summary(filename):
+    """
+    Recalculates the revenue aggregates from the live bookings at the prices they were booked at and saves them.
+
+    Holds the bookings file lock, so no booking is made while the booking revenue file is rewritten.
+
+    Args:
+        filename (str): Path to the bookings file.
+
+    Returns:
+        list: (scope, key, previous aggregate, rebuilt aggregate) for every key whose running aggregate did not match.
+
+    Raises:
+        FileNotFoundError: If the bookings file does not exist.
+    """
+    revenue_file, showtimes_file, priced_file = revenue_paths(filename)
+    with file_lock(filename), _lock:
+        return rebuild_revenue(revenue_file, showtimes_file, priced_file, load_bookings(filename).rows())
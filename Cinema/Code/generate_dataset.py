@@ -0,0 +1,351 @@
+#------------------------- DATASET GENERATOR --------------------------------------------------
+# Writes a synthetic multiplex database in the formats the loaders read, for
+# performance work at realistic scale.
+#
+# Every table in Cinema/Database is generated from one seeded random.Random, so the
+# same seed and sizes always give byte-identical files. The tables are consistent
+# with each other:
+#   - showtimes reference existing movies and auditoriums, never overlap within
+#     BUFFER_MINUTES in an auditorium, and are priced from the auditorium and
+#     discount policy the way the manager menu prices them
+#   - bookings reference existing showtimes and customers, only use seats that
+#     exist in the auditorium, never sell a seat twice, and only carry discounted
+#     tickets for showtimes with a discount; a share of them is cancelled with
+#     tombstone lines
+#   - revenue_summary.txt, booking_revenue.txt and the COUNTER files match the
+#     generated rows
+#
+# Run from the project root, e.g. for the full multiplex scale:
+#   python Cinema/Code/generate_dataset.py --out /tmp/multiplex/Cinema/Database --preset large
+# then start the program from /tmp/multiplex to use it.
+import argparse
+import os
+from array import array
+import random
+from datetime import datetime, timedelta
+
+from storage import lint_item
+from schedule import BUFFER_MINUTES
+from seating import ROW_LETTERS, ROW_STRIDE
+from revenue import RevenueLedger, PRICED_HEADER, booking_amounts, priced_line
+from maintenance import ISSUES_HEADER, TIMESTAMP_FORMAT, UNDER_MAINTENANCE
+
+# (auditoriums, movies, showtimes, bookings, customers)
+PRESETS = {
+    "small": (8, 20, 500, 10000, 1000),
+    "medium": (20, 100, 20000, 500000, 20000),
+    "large": (50, 500, 200000, 5000000, 100000),
+}
+AUDITORIUM_TYPES = [("2D", 24.00), ("2D", 24.50), ("IMAX", 35.00), ("4DX", 42.00), ("Indulge", 85.00)]
+GENRES = ["Action", "Animation", "Comedy", "Drama", "Horror", "Romance", "Sports", "Thriller", "Sci-Fi", "Fantasy"]
+CLASSIFICATIONS = ["U", "P12", "13", "16", "18+", "18SG", "18SX"]
+LANGUAGES = ["English", "Bahasa Melayu", "Chinese", "Tamil", "Japanese", "Korean", "Hindi"]
+WORDS = ["night", "river", "storm", "city", "last", "silent", "golden", "broken", "dream", "empire", "shadow", "summer",
+         "journey", "heart", "fire", "castle", "return", "hidden", "wild", "secret"]
+FIRST_NAMES = ["Aisyah", "John", "Raj", "Lim", "Siti", "Ahmad", "Mei", "Arjun", "Nurul", "Daniel", "Priya", "Wei"]
+LAST_NAMES = ["Rahman", "Tan", "Kumar", "Wong", "Ismail", "Lee", "Singh", "Abdullah", "Chong", "Nair"]
+EQUIPMENT = ["Air Conditioning", "Audio", "Projector"]
+FIRST_START = 9 * 60
+LAST_END = 23 * 60 + 55
+
+
+def title(rng, words):
+    return " ".join(rng.choice(WORDS).capitalize() for _ in range(words))
+
+
+def row_line(fields):
+    return ", ".join(lint_item(field) for field in fields) + "\n"
+
+
+class DatasetGenerator:
+    """
+    Generates every table from one seeded random number generator.
+
+    Attributes:
+        out (str): Directory the tables are written to.
+        rng (random.Random): The seeded generator.
+        start_date (datetime.datetime): First showtime date.
+        auditoriums (list): (auditorium ID, rows, columns, normal price) of every auditorium.
+        movies (list): (movie ID, running time, eligible for discount) of every movie.
+        discounts (list): Fields of every discount policy.
+        showtimes (list): Fields of every showtime.
+        counters (dict): Maps an item type to the next free ID number.
+    """
+
+    def __init__(self, out, seed, start_date):
+        self.out = out
+        self.rng = random.Random(seed)
+        self.start_date = start_date
+        self.auditoriums = []
+        self.movies = []
+        self.discounts = []
+        self.showtimes = []
+        self.counters = {}
+
+    def write(self, name, lines):
+        with open(os.path.join(self.out, name), "w", encoding="utf-8", newline="\n") as f:
+            f.writelines(lines)
+
+    def generate_auditoriums(self, count):
+        lines = ["auditorium_id, auditorium_type, auditorium_capacity, auditorium_rows, auditorium_columns, default_normal_price\n"]
+        for number in range(1, count + 1):
+            auditorium_type, price = self.rng.choice(AUDITORIUM_TYPES)
+            rows = self.rng.randint(4, 14) if auditorium_type != "Indulge" else 4
+            columns = self.rng.randint(12, 24) if auditorium_type != "Indulge" else 8
+            auditorium_id = f'AUD{number:02}'
+            self.auditoriums.append((auditorium_id, rows, columns, price))
+            lines.append(row_line([auditorium_id, auditorium_type, rows * columns, rows, columns, f'{price:.2f}']))
+        self.write("auditorium_info.txt", lines)
+
+    def generate_sitting(self):
+        lines = []
+        for auditorium_id, rows, columns, _ in self.auditoriums:
+            lines.append(f'{auditorium_id}\n')
+            for row in range(rows):
+                seats = []
+                for column in range(1, columns + 1):
+                    seats.append(f'{ROW_LETTERS[row]}{column:02}:[O]  ')
+                    if column in (2, columns - 2) and 2 < columns - 2:
+                        seats.append("     ")
+                lines.append("".join(seats) + "\n")
+            lines.append("\n\n")
+        self.write("auditorium_sitting.txt", lines)
+
+    def generate_discounts(self):
+        self.discounts = [["D01", "No discount available", "fixed", "0.00", "", "No discount available for this showtime."],
+                          ["D02", "Students/kids/seniors/OKU", "percentage", "", "0.10", "10% off for students, kids, senior citizens, and OKU."],
+                          ["D03", "Wednesdays", "percentage", "", "0.50", "50% off on Wednesdays."],
+                          ["D04", "Member Fixed", "fixed", "5.00", "", "RM5 off for members."],
+                          ["D05", "Early Bird", "percentage", "", "0.20", "20% off for showtimes before noon."]]
+        lines = ["discount_id, discount_name, discount_type, discount_amount, discount_rate, discount_policies\n"]
+        lines += [row_line(discount) for discount in self.discounts]
+        self.write("discount_policies.txt", lines)
+
+    def generate_movies(self, count):
+        lines = ["movie_id, movie_name, release_date, running_time, genre, classification, spoken_language, subtitle_language, directors, casts, description, eligibility_for_discount\n"]
+        for number in range(1, count + 1):
+            movie_id = f'M{number:03}'
+            running_time = self.rng.randint(80, 190)
+            eligible = self.rng.random() < 0.6
+            release = self.start_date - timedelta(days=self.rng.randint(0, 120))
+            self.movies.append((movie_id, running_time, eligible))
+            lines.append(row_line([
+                movie_id,
+                title(self.rng, self.rng.randint(1, 4)),
+                release.strftime("%d-%m-%Y"),
+                running_time,
+                self.rng.choice(GENRES),
+                self.rng.choice(CLASSIFICATIONS),
+                self.rng.choice(LANGUAGES),
+                self.rng.sample(LANGUAGES, self.rng.randint(1, 3)),
+                [f'{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)}' for _ in range(self.rng.randint(1, 2))],
+                [f'{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)}' for _ in range(self.rng.randint(3, 8))],
+                f'A {self.rng.choice(WORDS)} story of {self.rng.choice(WORDS)}, {self.rng.choice(WORDS)} and {self.rng.choice(WORDS)} {title(self.rng, 2).lower()}.',
+                "Y" if eligible else "N",
+            ]))
+        self.write("movie_listings.txt", lines)
+        self.counters["movie"] = count + 1
+
+    def discounted_price(self, discount, normal_price):
+        if discount[2] == "fixed":
+            return f'{round(normal_price - float(discount[3]), 2):.2f}'
+        return f'{round(normal_price * (1 - float(discount[4])), 2):.2f}'
+
+    def generate_showtimes(self, count):
+        """
+        Fills each auditorium's day from FIRST_START to LAST_END with back-to-back showtimes, day after day, until count are made.
+        """
+        lines = ["showtime_id, movie_id, auditorium_id, date, start_time, end_time, normal_price, discounted_price, discount_id\n"]
+        day = 0
+        while len(self.showtimes) < count:
+            date = (self.start_date + timedelta(days=day)).strftime("%d-%m-%Y")
+            for auditorium_id, _, _, normal_price in self.auditoriums:
+                start = FIRST_START + 5 * self.rng.randint(0, 6)
+                while len(self.showtimes) < count:
+                    movie_id, running_time, eligible = self.rng.choice(self.movies)
+                    end = start + running_time
+                    end += (5 - end % 5) % 5
+                    if end > LAST_END:
+                        break
+                    discounted_price = discount_id = ""
+                    if eligible:
+                        discount = self.rng.choice(self.discounts[1:])
+                        discount_id = discount[0]
+                        discounted_price = self.discounted_price(discount, normal_price)
+                    showtime = [f'ST{len(self.showtimes) + 1:04}', movie_id, auditorium_id, date, f'{start // 60:02}{start % 60:02}',
+                                f'{end // 60:02}{end % 60:02}', f'{normal_price:.2f}', discounted_price, discount_id]
+                    self.showtimes.append(showtime)
+                    lines.append(row_line(showtime))
+                    start = end + 2 * BUFFER_MINUTES + 5 * self.rng.randint(0, 3)
+            day += 1
+        self.write("movie_showtimes.txt", lines)
+        self.counters["showtime"] = count + 1
+
+    def generate_customers(self, count):
+        lines = ["customer_id, name, phone, email, password\n"]
+        for number in range(1, count + 1):
+            first, last = self.rng.choice(FIRST_NAMES), self.rng.choice(LAST_NAMES)
+            lines.append(row_line([f'C{number:04}', f'{first} {last}', f'601{self.rng.randint(0, 99999999):08}',
+                                   f'{first.lower()}.{last.lower()}{number}@example.com', f'pw{self.rng.randint(1000, 9999)}']))
+        self.write("customer.txt", lines)
+        self.counters["customer"] = count + 1
+
+    def generate_bookings(self, count, customers, cancel_rate):
+        """
+        Books runs of 1-4 adjacent free seats in random showtimes, cancelling about cancel_rate of them.
+
+        Rows are streamed to the file, then the live bookings' amounts to booking_revenue.txt; revenue is summed per showtime
+        and spread to the other scopes at the end.
+        """
+        rng = self.rng
+        showtimes = self.showtimes
+        layouts = {auditorium_id: (rows, columns) for auditorium_id, rows, columns, _ in self.auditoriums}
+        taken = [0] * len(showtimes)
+        tickets = [[0, 0] for _ in showtimes]
+        # Number, showtime index and ticket counts of every live booking, kept as typed arrays to stay small at millions of rows.
+        live = [array("l") for _ in range(4)]
+        number = 0
+        attempts = 0
+        with open(os.path.join(self.out, "movie_bookings.txt"), "w", encoding="utf-8", newline="\n") as f:
+            f.write("booking_id, showtime_id, customer_id, seat_ids, normal_discounted_tickets\n")
+            lines = []
+            while number < count and attempts < count * 20:
+                attempts += 1
+                index = rng.randrange(len(showtimes))
+                showtime = showtimes[index]
+                rows, columns = layouts[showtime[2]]
+                size = rng.randint(1, 4)
+                row = rng.randrange(rows)
+                column = rng.randint(1, columns - size + 1)
+                mask = ((1 << size) - 1) << (row * ROW_STRIDE + column - 1)
+                if taken[index] & mask:
+                    continue
+                taken[index] |= mask
+                number += 1
+                discounted = rng.randint(0, size) if showtime[8] and rng.random() < 0.3 else 0
+                seats = "|".join(f'{ROW_LETTERS[row]}{c:02}' for c in range(column, column + size))
+                lines.append(f'B{number:04}, {showtime[0]}, C{rng.randint(1, customers):04}, {seats}, {size - discounted}|{discounted}\n')
+                tickets[index][0] += size - discounted
+                tickets[index][1] += discounted
+                for column_values, value in zip(live, (number, index, size - discounted, discounted)):
+                    column_values.append(value)
+                if rng.random() < cancel_rate:
+                    # Move the last booking into the cancelled one's place so removing it does not shift the arrays.
+                    position = rng.randrange(len(live[0]))
+                    cancelled, index, normal, discounted = (column_values[position] for column_values in live)
+                    for column_values in live:
+                        column_values[position] = column_values[-1]
+                        column_values.pop()
+                    lines.append(f'CANCELLED, B{cancelled:04}\n')
+                    tickets[index][0] -= normal
+                    tickets[index][1] -= discounted
+                if len(lines) >= 10000:
+                    f.writelines(lines)
+                    lines = []
+            f.writelines(lines)
+
+        with open(os.path.join(self.out, "booking_revenue.txt"), "w", encoding="utf-8", newline="\n") as f:
+            f.write(PRICED_HEADER)
+            lines = []
+            for position in sorted(range(len(live[0])), key=live[0].__getitem__):
+                booked, index, normal, discounted = (column_values[position] for column_values in live)
+                keys, amounts = booking_amounts(showtimes[index][0], showtimes[index], f'{normal}|{discounted}')
+                lines.append(priced_line(f'B{booked:04}', keys, amounts))
+                if len(lines) >= 10000:
+                    f.writelines(lines)
+                    lines = []
+            f.writelines(lines)
+
+        ledger = RevenueLedger(None)
+        for showtime, (normal, discounted) in zip(showtimes, tickets):
+            keys, amounts = booking_amounts(showtime[0], showtime, f'{normal}|{discounted}')
+            for key in keys:
+                ledger.add(key, amounts)
+        self.write("revenue_summary.txt", [ledger.snapshot()])
+        self.counters["booking"] = number + 1
+        return number
+
+    def generate_issues(self):
+        lines = [ISSUES_HEADER]
+        for auditorium_id, _, _, _ in self.auditoriums:
+            for equipment in EQUIPMENT:
+                if self.rng.random() < 0.1:
+                    start = self.start_date + timedelta(days=self.rng.randint(0, 30), hours=self.rng.randint(9, 20))
+                    end = start + timedelta(hours=self.rng.randint(4, 72))
+                    lines.append(row_line([auditorium_id, equipment, UNDER_MAINTENANCE, start.strftime(TIMESTAMP_FORMAT), end.strftime(TIMESTAMP_FORMAT)]))
+                else:
+                    lines.append(f'{auditorium_id}, {equipment}, READY, , \n')
+        self.write("technician_issues.txt", lines)
+
+    def write_counters(self):
+        self.counters["discount"] = len(self.discounts) + 1
+        for item, next_number in self.counters.items():
+            self.write(f'COUNTER_{item}_id.txt', [str(next_number)])
+
+
+def generate(out, seed, auditoriums, movies, showtimes, bookings, customers, cancel_rate=0.02, start_date=datetime(2026, 1, 1)):
+    """
+    Writes a complete synthetic database.
+
+    Args:
+        out (str): Existing directory to write the tables to.
+        seed (int): Random seed.
+        auditoriums (int): Number of auditoriums.
+        movies (int): Number of movies.
+        showtimes (int): Number of showtimes.
+        bookings (int): Number of bookings, cancelled ones included.
+        customers (int): Number of customers.
+        cancel_rate (float, optional): Share of bookings later cancelled. Defaults to 0.02.
+        start_date (datetime.datetime, optional): First showtime date. Defaults to 1 January 2026.
+
+    Returns:
+        int: Number of bookings written, fewer than asked if the showtimes ran out of seats.
+    """
+    generator = DatasetGenerator(out, seed, start_date)
+    generator.generate_auditoriums(auditoriums)
+    generator.generate_sitting()
+    generator.generate_discounts()
+    generator.generate_movies(movies)
+    generator.generate_showtimes(showtimes)
+    generator.generate_customers(customers)
+    booked = generator.generate_bookings(bookings, customers, cancel_rate)
+    generator.generate_issues()
+    generator.write_counters()
+    return booked
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a consistent synthetic cinema database.")
+    parser.add_argument("--out", required=True, help="directory to write the tables to; it must be empty or new unless --force is given")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="small", help="base sizes (default small)")
+    parser.add_argument("--seed", type=int, default=1, help="random seed (default 1)")
+    parser.add_argument("--auditoriums", type=int, help="number of auditoriums")
+    parser.add_argument("--movies", type=int, help="number of movies")
+    parser.add_argument("--showtimes", type=int, help="number of showtimes")
+    parser.add_argument("--bookings", type=int, help="number of bookings, cancelled ones included")
+    parser.add_argument("--customers", type=int, help="number of customers")
+    parser.add_argument("--cancel-rate", type=float, default=0.02, help="share of bookings later cancelled (default 0.02)")
+    parser.add_argument("--start-date", default="01-01-2026", help="first showtime date as DD-MM-YYYY (default 01-01-2026)")
+    parser.add_argument("--force", action="store_true", help="overwrite tables in a non-empty directory")
+    args = parser.parse_args()
+
+    auditoriums, movies, showtimes, bookings, customers = PRESETS[args.preset]
+    auditoriums = args.auditoriums or auditoriums
+    movies = args.movies or movies
+    showtimes = args.showtimes or showtimes
+    bookings = args.bookings if args.bookings is not None else bookings
+    customers = args.customers or customers
+    if min(auditoriums, movies, showtimes, customers) < 1 or bookings < 0 or not 0 <= args.cancel_rate < 1:
+        parser.error("sizes must be positive and --cancel-rate between 0 and 1")
+
+    os.makedirs(args.out, exist_ok=True)
+    if os.listdir(args.out) and not args.force:
+        parser.error(f'{args.out} is not empty; pass --force to overwrite its tables')
+
+    booked = generate(args.out, args.seed, auditoriums, movies, showtimes, bookings, customers, args.cancel_rate,
+                      datetime.strptime(args.start_date, "%d-%m-%Y"))
+    print(f'Wrote {auditoriums} auditoriums, {movies} movies, {showtimes} showtimes, {customers} customers and {booked} bookings to {args.out}')
+
+
+if __name__ == "__main__":
+    main()
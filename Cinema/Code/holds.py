@@ -0,0 +1,124 @@
+#------------------------- SEAT HOLDS --------------------------------------------------
+# Short-lived seat holds in seat_holds.txt, shared by every terminal on the host.
+#
+# While a customer or clerk enters ticket counts and confirms, the seats they picked
+# are held for them, one line per (showtime, holder):
+#   showtime_id, holder, seat_ids, expires_at
+# where holder names the terminal and expires_at is a Unix time. Other terminals
+# treat held seats as taken until the booking is saved, the hold is released, or it
+# expires. Expired holds are ignored when read and dropped the next time the file is
+# written. Writes happen under file_lock; reads use the cached table and take no lock.
+import os
+import time
+
+from storage import load_parsed, atomic_write
+from locking import file_lock
+from seating import seat_mask
+
+HEADER = "showtime_id, holder, seat_ids, expires_at\n"
+HOLD_SECONDS = 300
+
+
+def _parse_holds(table):
+    holds = {}
+    for record in table.rows():
+        if len(record) >= 4:
+            try:
+                expires_at = float(record[3])
+            except ValueError:
+                continue
+            holds.setdefault(record[0], []).append((record[1], record[2], expires_at))
+    return holds
+
+
+def load_holds(filename):
+    """
+    Retrieves every hold in the holds file, expired ones included.
+
+    Args:
+        filename (str): Path to seat_holds.txt.
+
+    Returns:
+        dict: Maps a showtime ID to a list of (holder, seat_ids text, expires_at); shared, must not be modified.
+    """
+    try:
+        return load_parsed(filename, _parse_holds)
+    except FileNotFoundError:
+        return {}
+
+
+def held_seats(filename, showtime_id, holder=None, now=None):
+    """
+    Retrieves the seats of a showtime held by other terminals.
+
+    Args:
+        filename (str): Path to seat_holds.txt.
+        showtime_id (str): ID of the showtime.
+        holder (str, optional): Holder whose own hold is left out. Defaults to None.
+        now (float, optional): Current Unix time. Defaults to time.time().
+
+    Returns:
+        int: Bitmask of held seats.
+    """
+    now = time.time() if now is None else now
+    mask = 0
+    for who, seats_text, expires_at in load_holds(filename).get(showtime_id, []):
+        if who != holder and expires_at > now:
+            mask |= seat_mask(seats_text.split("|"))
+    return mask
+
+
+def _rewrite_holds(filename, showtime_id, holder, now, new_hold=None):
+    lines = [HEADER]
+    for held_showtime, holds in load_holds(filename).items():
+        for who, seats_text, expires_at in holds:
+            if expires_at > now and not (held_showtime == showtime_id and who == holder):
+                lines.append(f'{held_showtime}, {who}, {seats_text}, {expires_at:.0f}\n')
+    if new_hold is not None:
+        lines.append(new_hold)
+    atomic_write(filename, "".join(lines))
+
+
+def place_hold(filename, showtime_id, holder, seat_ids, expires_at, now=None):
+    """
+    Holds seats for a terminal, replacing its earlier hold on the same showtime.
+
+    Args:
+        filename (str): Path to seat_holds.txt.
+        showtime_id (str): ID of the showtime.
+        holder (str): Terminal holding the seats.
+        seat_ids (list): Seat IDs to hold.
+        expires_at (float): Unix time the hold lapses.
+        now (float, optional): Current Unix time. Defaults to time.time().
+
+    Returns:
+        list: Seat IDs already held by other terminals; nothing is written unless it is empty.
+    """
+    now = time.time() if now is None else now
+    with file_lock(filename):
+        held = held_seats(filename, showtime_id, holder, now)
+        clashing = [seat for seat in seat_ids if seat_mask([seat]) & held]
+        if not clashing:
+            _rewrite_holds(filename, showtime_id, holder, now, f'{showtime_id}, {holder}, {"|".join(seat_ids)}, {expires_at:.0f}\n')
+    return clashing
+
+
+def release_hold(filename, showtime_id, holder, now=None):
+    """
+    Drops a terminal's hold on a showtime, along with every expired hold.
+
+    Args:
+        filename (str): Path to seat_holds.txt.
+        showtime_id (str): ID of the showtime.
+        holder (str): Terminal holding the seats.
+        now (float, optional): Current Unix time. Defaults to time.time().
+
+    Returns:
+        None
+    """
+    if not os.path.exists(filename):
+        return
+    now = time.time() if now is None else now
+    with file_lock(filename):
+        if any(who == holder for who, _, _ in load_holds(filename).get(showtime_id, [])):
+            _rewrite_holds(filename, showtime_id, holder, now)
@@ -0,0 +1,220 @@
+#------------------------- ID ALLOCATION --------------------------------------------------
+# Monotonic ID allocation backed by the COUNTER_{item}_id.txt files.
+#
+# Each counter file holds the next number to hand out. Allocating reads and bumps
+# it under a file lock, so IDs are never reused, even after the rows they were
+# given to are cancelled or deleted, and two terminals never get the same ID.
+#
+# Items created in bulk take their IDs from an IdBlock instead, which reserves a
+# run of numbers with one counter write and hands them out from memory. Numbers
+# still unused at exit are given back if no one has reserved after them, and are
+# otherwise skipped, so they are never handed out twice.
+import atexit
+import os
+
+from storage import atomic_write
+from locking import file_lock
+
+
+def counter_file(database_dir, item_counted):
+    """
+    Builds the path of the counter file for an item type.
+
+    Args:
+        database_dir (str): Directory holding the database files.
+        item_counted (str): The name of the item type (e.g., "booking", "customer").
+
+    Returns:
+        str: Path to COUNTER_{item_counted}_id.txt.
+    """
+    return os.path.join(database_dir, f'COUNTER_{item_counted}_id.txt')
+
+
+def highest_id_number(filename, prefix):
+    """
+    Finds the highest number used by IDs in the first column of a table file.
+
+    Args:
+        filename (str): Path to the table file.
+        prefix (str): ID prefix, such as "B" for B0001.
+
+    Returns:
+        int: The highest number found, or 0 if there are none.
+    """
+    highest = 0
+    try:
+        with open(filename, "r", encoding="utf-8") as f:
+            for line in f:
+                first = line.split(",", 1)[0].strip()
+                number = first[len(prefix):]
+                if first.startswith(prefix) and number.isdigit():
+                    highest = max(highest, int(number))
+    except FileNotFoundError:
+        pass
+    return highest
+
+
+def reserve_ids(filename, count=1, seed_file=None, prefix=""):
+    """
+    Reserves a run of consecutive ID numbers with a single counter write.
+
+    If the counter file is missing or empty, it is seeded from the highest ID already used in seed_file.
+
+    Args:
+        filename (str): Path to the counter file.
+        count (int, optional): How many numbers to reserve. Defaults to 1.
+        seed_file (str, optional): Table file to seed a missing counter from. Defaults to None.
+        prefix (str, optional): ID prefix used in seed_file. Defaults to "".
+
+    Returns:
+        int: The first reserved number; the run is [first, first + count).
+    """
+    with file_lock(filename):
+        try:
+            with open(filename, "r", encoding="utf-8") as f:
+                content = f.read().strip()
+        except FileNotFoundError:
+            content = ""
+        if content.isdigit():
+            id_no = int(content)
+        elif seed_file is not None:
+            id_no = highest_id_number(seed_file, prefix) + 1
+        else:
+            id_no = 1
+        atomic_write(filename, str(id_no + count))
+    return id_no
+
+
+def next_id(filename, prefix, width, seed_file=None):
+    """
+    Allocates the next formatted ID.
+
+    Args:
+        filename (str): Path to the counter file.
+        prefix (str): ID prefix, such as "B".
+        width (int): Number of digits, zero-padded.
+        seed_file (str, optional): Table file to seed a missing counter from. Defaults to None.
+
+    Returns:
+        str: The new ID, such as "B0016".
+    """
+    id_no = reserve_ids(filename, 1, seed_file, prefix)
+    return f'{prefix}{id_no:0{width}}'
+
+
+class IdBlock:
+    """
+    Hands out ID numbers from a block reserved with one counter write, reserving a new block when it runs out.
+
+    Attributes:
+        filename (str): Path to the counter file.
+        block_size (int): How many numbers to reserve at a time.
+        seed_file (str): Table file to seed a missing counter from.
+        prefix (str): ID prefix used in seed_file.
+        next (int): Next number to hand out, or None if no block is held.
+        end (int): First number past the held block, or None if no block is held.
+    """
+
+    def __init__(self, filename, block_size=10, seed_file=None, prefix=""):
+        self.filename = filename
+        self.block_size = block_size
+        self.seed_file = seed_file
+        self.prefix = prefix
+        self.next = None
+        self.end = None
+
+    def remaining(self):
+        """
+        Counts the numbers left in the held block.
+
+        Returns:
+            int: Numbers left.
+        """
+        return 0 if self.next is None else self.end - self.next
+
+    def reserve(self, count):
+        """
+        Makes sure at least count numbers are held, reserving a new block if needed.
+
+        Args:
+            count (int): How many numbers are about to be taken.
+
+        Returns:
+            None
+        """
+        if self.remaining() >= count:
+            return
+        self.release()
+        size = max(count, self.block_size)
+        self.next = reserve_ids(self.filename, size, self.seed_file, self.prefix)
+        self.end = self.next + size
+
+    def take(self):
+        """
+        Hands out the next number of the block.
+
+        Returns:
+            int: The ID number.
+        """
+        self.reserve(1)
+        id_no = self.next
+        self.next += 1
+        return id_no
+
+    def release(self):
+        """
+        Gives unused numbers back to the counter if no one reserved after this block; otherwise they are skipped.
+
+        Returns:
+            None
+        """
+        if not self.remaining():
+            self.next = self.end = None
+            return
+        with file_lock(self.filename):
+            try:
+                with open(self.filename, "r", encoding="utf-8") as f:
+                    content = f.read().strip()
+            except FileNotFoundError:
+                content = ""
+            if content == str(self.end):
+                atomic_write(self.filename, str(self.next))
+        self.next = self.end = None
+
+
+_blocks = {}
+
+
+def id_block(filename, block_size=10, seed_file=None, prefix=""):
+    """
+    Retrieves the ID block for a counter file, creating it on first use. Unused numbers are released when the program exits.
+
+    Args:
+        filename (str): Path to the counter file.
+        block_size (int, optional): How many numbers to reserve at a time. Defaults to 10.
+        seed_file (str, optional): Table file to seed a missing counter from. Defaults to None.
+        prefix (str, optional): ID prefix used in seed_file. Defaults to "".
+
+    Returns:
+        IdBlock: The block for that counter file.
+    """
+    key = os.path.abspath(filename)
+    if key not in _blocks:
+        if not _blocks:
+            atexit.register(release_id_blocks)
+        _blocks[key] = IdBlock(filename, block_size, seed_file, prefix)
+    return _blocks[key]
+
+
+def release_id_blocks():
+    """
+    Releases the unused numbers of every ID block.
+
+    Returns:
+        None
+    """
+    for block in _blocks.values():
+        try:
+            block.release()
+        except OSError:
+            pass
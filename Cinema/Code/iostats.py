@@ -0,0 +1,294 @@
+#------------------------- I/O ACCOUNTING --------------------------------------------------
+# Opt-in count of the file I/O done by each top-level menu action.
+#
+# Set CINEMA_IO_STATS before starting the program to turn it on:
+#   CINEMA_IO_STATS=1                  metrics go to io_metrics.jsonl in the project root
+#   CINEMA_IO_STATS=/path/metrics.jsonl
+# Every function decorated with io_action then counts, while it runs:
+#   opens          files opened in Cinema/Database, per file (lock and temporary
+#                  files included, as they cost a real open)
+#   bytes_read     bytes read and written through open() and os.fdopen()
+#   bytes_written
+#   rows_parsed    table rows split into fields by the table store
+# prints a one-line summary to stderr when it returns and appends the same figures
+# as one JSON line to the metrics file. Actions called from another action count
+# towards the outer one. When the variable is not set io_action returns the
+# function unchanged, so the menus pay nothing.
+#
+# Budgets per action can be checked against a metrics file:
+#   python Cinema/Code/iostats.py check io_metrics.jsonl budgets.json
+# where budgets.json maps "module.action" to limits, e.g.
+#   {"role_clerk.book_ticket": {"opens": 12, "bytes_read": 2000000}}
+import argparse
+import builtins
+import functools
+import json
+import os
+import re
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+
+STATS_ENV = "CINEMA_IO_STATS"
+DEFAULT_METRICS_FILE = "io_metrics.jsonl"
+DATABASE_DIR = "Cinema/Database"
+METRICS = ("opens", "bytes_read", "bytes_written", "rows_parsed")
+# atomic_write's temporary files are named ".<table>.<random>.tmp".
+TEMPORARY_FILE = re.compile(r"^\.(.+)\.[^.]+\.tmp$")
+
+
+def metrics_file():
+    """
+    Reads where metrics go from CINEMA_IO_STATS.
+
+    Returns:
+        str or None: Path to the metrics file, or None if accounting is off.
+    """
+    value = os.environ.get(STATS_ENV, "").strip()
+    if not value or value == "0":
+        return None
+    return DEFAULT_METRICS_FILE if value == "1" else value
+
+
+class IoAccount:
+    """
+    I/O counted during one run of an action.
+
+    Attributes:
+        action (str): "module.function" of the action.
+        files (collections.Counter): Opens per database file name.
+        bytes_read (int): Bytes read from files.
+        bytes_written (int): Bytes written to files.
+        rows_parsed (int): Table rows split into fields.
+        started (float): perf_counter() when the action started.
+    """
+
+    def __init__(self, action):
+        self.action = action
+        self.files = Counter()
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.rows_parsed = 0
+        self.started = time.perf_counter()
+
+    def record(self, seconds):
+        return {
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "pid": os.getpid(),
+            "action": self.action,
+            "seconds": round(seconds, 6),
+            "opens": sum(self.files.values()),
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+            "rows_parsed": self.rows_parsed,
+            "files": dict(self.files),
+        }
+
+
+_account = None
+_depth = 0
+_hook_installed = False
+_database_dir = os.path.abspath(DATABASE_DIR)
+_real_open = builtins.open
+_real_fdopen = os.fdopen
+
+
+def count_rows(count):
+    """
+    Adds parsed table rows to the running action, if any.
+
+    Args:
+        count (int): Number of rows split into fields.
+
+    Returns:
+        None
+    """
+    if _account is not None:
+        _account.rows_parsed += count
+
+
+def _data_size(data):
+    return len(data.encode("utf-8")) if isinstance(data, str) else len(data)
+
+
+class CountingFile:
+    """
+    Wraps an open file and adds what passes through it to the running action.
+
+    Attributes:
+        file (io.IOBase): The wrapped file.
+    """
+
+    def __init__(self, file):
+        self.file = file
+
+    def __getattr__(self, name):
+        return getattr(self.file, name)
+
+    def __enter__(self):
+        self.file.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        return self.file.__exit__(*exc_info)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = next(self.file)
+        self._read(line)
+        return line
+
+    def _read(self, data):
+        if _account is not None:
+            _account.bytes_read += _data_size(data)
+        return data
+
+    def read(self, *args):
+        return self._read(self.file.read(*args))
+
+    def readline(self, *args):
+        return self._read(self.file.readline(*args))
+
+    def readlines(self, *args):
+        lines = self.file.readlines(*args)
+        if _account is not None:
+            _account.bytes_read += sum(_data_size(line) for line in lines)
+        return lines
+
+    def write(self, data):
+        if _account is not None:
+            _account.bytes_written += _data_size(data)
+        return self.file.write(data)
+
+    def writelines(self, lines):
+        lines = list(lines)
+        if _account is not None:
+            _account.bytes_written += sum(_data_size(line) for line in lines)
+        return self.file.writelines(lines)
+
+
+def _counting_open(*args, **kwargs):
+    return CountingFile(_real_open(*args, **kwargs))
+
+
+def _counting_fdopen(*args, **kwargs):
+    return CountingFile(_real_fdopen(*args, **kwargs))
+
+
+def _audit(event, args):
+    if event != "open" or _account is None or not isinstance(args[0], (str, bytes, os.PathLike)):
+        return
+    path = os.path.abspath(os.fsdecode(args[0]))
+    if os.path.dirname(path) == _database_dir:
+        name = os.path.basename(path)
+        temporary = TEMPORARY_FILE.match(name)
+        _account.files[temporary.group(1) + " (rewrite)" if temporary else name] += 1
+
+
+def _summary(record):
+    files = ", ".join(f'{name} x{count}' for name, count in sorted(record["files"].items()))
+    return (f'[I/O] {record["action"]}: {record["opens"]} opens, {record["bytes_read"]:,} bytes read, '
+            f'{record["bytes_written"]:,} bytes written, {record["rows_parsed"]:,} rows parsed in {record["seconds"]:.3f}s'
+            + (f'\n      {files}' if files else ""))
+
+
+def _start(action):
+    global _account, _hook_installed, _database_dir
+    if not _hook_installed:
+        # Audit hooks cannot be removed, so the hook stays installed and checks for a running action.
+        sys.addaudithook(_audit)
+        _hook_installed = True
+    _database_dir = os.path.abspath(DATABASE_DIR)
+    _account = IoAccount(action)
+    builtins.open, os.fdopen = _counting_open, _counting_fdopen
+
+
+def _finish(filename):
+    global _account
+    builtins.open, os.fdopen = _real_open, _real_fdopen
+    account, _account = _account, None
+    record = account.record(time.perf_counter() - account.started)
+    print(_summary(record), file=sys.stderr)
+    try:
+        with open(filename, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+    except OSError as e:
+        print(f'[I/O] Could not write {filename}: {e}', file=sys.stderr)
+
+
+def io_action(function):
+    """
+    Decorates a top-level menu action so that its I/O is counted when CINEMA_IO_STATS is set.
+
+    Args:
+        function (callable): The action.
+
+    Returns:
+        callable: The counting wrapper, or function itself if accounting is off.
+    """
+    filename = metrics_file()
+    if filename is None:
+        return function
+    action = f'{function.__module__}.{function.__name__}'
+
+    @functools.wraps(function)
+    def counted(*args, **kwargs):
+        global _depth
+        _depth += 1
+        if _depth == 1:
+            _start(action)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _depth -= 1
+            if _depth == 0:
+                _finish(filename)
+    return counted
+
+
+def check_budgets(metrics_path, budgets_path):
+    """
+    Compares every recorded action run with its budget.
+
+    Args:
+        metrics_path (str): JSONL metrics file.
+        budgets_path (str): JSON file mapping "module.action" to {metric: limit}.
+
+    Returns:
+        list: One message per run that went over a limit.
+    """
+    with open(budgets_path, "r", encoding="utf-8") as f:
+        budgets = json.load(f)
+    over = []
+    with open(metrics_path, "r", encoding="utf-8") as f:
+        for number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            for metric, limit in budgets.get(record["action"], {}).items():
+                if record.get(metric, 0) > limit:
+                    over.append(f'line {number} {record["action"]} at {record["time"]}: {metric} {record[metric]:,} > {limit:,}')
+    return over
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check I/O metrics recorded with CINEMA_IO_STATS against per-action budgets.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    check_parser = commands.add_parser("check", help="report action runs over budget; exits with status 1 if there are any")
+    check_parser.add_argument("metrics", help="JSONL metrics file")
+    check_parser.add_argument("budgets", help=f'JSON file mapping module.action to limits on {", ".join(METRICS)}')
+    args = parser.parse_args()
+
+    over = check_budgets(args.metrics, args.budgets)
+    for message in over:
+        print(message)
+    if over:
+        sys.exit(1)
+    print("Every recorded action is within budget.")
+
+
+if __name__ == "__main__":
+    main()
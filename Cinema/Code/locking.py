@@ -0,0 +1,39 @@
+#------------------------- LOCKING --------------------------------------------------
+# Advisory file locks shared by every process working on Cinema/Database.
+#
+# A lock on "name.txt" is taken on a separate "name.txt.lock" file, so the data
+# file itself can still be replaced atomically while the lock is held.
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def file_lock(filename):
+    """
+    Holds an exclusive advisory lock for a file while the with-block runs.
+
+    Args:
+        filename (str): Path to the file to be locked.
+
+    Yields:
+        None
+    """
+    with open(filename + ".lock", "a") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
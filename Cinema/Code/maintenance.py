@@ -0,0 +1,122 @@
+#------------------------- MAINTENANCE --------------------------------------------------
+# Maintenance-window index over technician_issues.txt, shared by the manager and
+# technician roles.
+#
+# Every "Under Maintenance" row becomes a window of parsed datetimes
+#   (estimated_repair_date, estimated_repaired_date)
+# filed under its auditorium. An auditorium stays out of service until its last
+# window ends, so "is AUD03 blocked for this slot?" is one dict lookup against the
+# latest end. The index is rebuilt only when the issues file changes, which is
+# whenever save_issues writes it (see storage.load_parsed).
+from datetime import datetime
+import os
+
+from storage import load_parsed
+
+ISSUES_HEADER = "auditorium_id, equipment, status, estimated_repair_date, estimated_repaired_date\n"
+UNDER_MAINTENANCE = "Under Maintenance"
+TIMESTAMP_FORMAT = "%d-%m-%Y %I:%M%p"
+
+
+def parse_timestamp(text):
+    """
+    Parses a repair timestamp such as "15-10-2025 09:00PM".
+
+    Args:
+        text (str): The timestamp.
+
+    Returns:
+        datetime.datetime or None: The parsed timestamp, or None if it is empty or malformed.
+    """
+    try:
+        return datetime.strptime(" ".join(text.split()), TIMESTAMP_FORMAT)
+    except ValueError:
+        return None
+
+
+def ensure_issues_file(filename):
+    """
+    Creates the issues file with its header row, and its directory, if it does not exist yet.
+
+    Args:
+        filename (str): Path to technician_issues.txt.
+
+    Returns:
+        None
+    """
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    if not os.path.exists(filename):
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write(ISSUES_HEADER)
+
+
+class MaintenanceWindows:
+    """
+    Maintenance windows of every auditorium.
+
+    Attributes:
+        windows (dict): Maps an auditorium ID to a list of (start, end, equipment); start is None if it was not given.
+        until (dict): Maps an auditorium ID to the end of its last window.
+    """
+
+    def __init__(self):
+        self.windows = {}
+        self.until = {}
+
+    def add(self, auditorium_id, equipment, start, end):
+        """
+        Adds a maintenance window.
+
+        Args:
+            auditorium_id (str): ID of the auditorium.
+            equipment (str): The equipment being repaired.
+            start (datetime.datetime or None): Estimated repair start.
+            end (datetime.datetime): Estimated repair completion.
+
+        Returns:
+            None
+        """
+        self.windows.setdefault(auditorium_id, []).append((start, end, equipment))
+        if auditorium_id not in self.until or end > self.until[auditorium_id]:
+            self.until[auditorium_id] = end
+
+    def blocked(self, auditorium_id, slot_end):
+        """
+        Checks whether an auditorium is still under maintenance when a time slot ends.
+
+        Args:
+            auditorium_id (str): ID of the auditorium.
+            slot_end (datetime.datetime): End of the time slot.
+
+        Returns:
+            bool: True if a repair is estimated to finish after slot_end.
+        """
+        until = self.until.get(auditorium_id)
+        return until is not None and until > slot_end
+
+
+def _parse_windows(table):
+    index = MaintenanceWindows()
+    for record in table.rows():
+        if len(record) < 5 or record[2] != UNDER_MAINTENANCE:
+            continue
+        end = parse_timestamp(record[4])
+        if end is not None:
+            index.add(record[0], record[1], parse_timestamp(record[3]), end)
+    return index
+
+
+def load_maintenance_windows(filename):
+    """
+    Retrieves the maintenance-window index of an issues file, rebuilt only when the file changes.
+
+    Args:
+        filename (str): Path to technician_issues.txt.
+
+    Returns:
+        MaintenanceWindows: The index; shared, must not be modified.
+
+    Raises:
+        FileNotFoundError: If the issues file does not exist.
+    """
+    return load_parsed(filename, _parse_windows)
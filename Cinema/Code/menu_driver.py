@@ -0,0 +1,328 @@
+#------------------------- MENU DRIVER --------------------------------------------------
+# Runs the interactive menus headlessly from recorded sessions, to load test the
+# real end-to-end flows (login -> movie -> showtime -> seats -> tickets) without
+# changing the menus.
+#
+# A session is a JSON file naming the entry function and every prompt with the
+# answer typed at it:
+#   {"entry": "cinema_compiled:main",
+#    "steps": [{"prompt": "Select role (enter number 1-5): ", "answer": "4"}, ...]}
+# record runs the program as usual and saves what was typed; stdin may be a pipe.
+# replay feeds the answers back through input() from several processes at once,
+# each looping over the session, with everything printed captured instead of shown
+# and the screen never cleared. Modules and table caches stay loaded between
+# sessions, as in a terminal left open.
+#
+# Answers may contain placeholders, resolved on every replay:
+#   {free_seats:N}  N seats still free in the showtime last answered (an ST... ID),
+#                   so repeated booking sessions neither run out of seats nor collide
+#   {process}       number of the replaying process
+#   {session}       number of the session within its process
+# When a prompt differs from the recorded one the session took another path, e.g.
+# a seat was booked by another process first; it is ended and counted as diverged.
+#
+# Each step's latency is the time from answering its prompt until the next prompt
+# appears (or the session ends), i.e. the work the menus did for that answer.
+#
+# Replays write to the database under --root; use a generated dataset (see
+# generate_dataset.py), not the sample data. sessions/customer_booking.json books
+# tickets on the small preset with seed 1. Run from the project root:
+#   python Cinema/Code/menu_driver.py record session.json
+#   python Cinema/Code/menu_driver.py replay Cinema/Code/sessions/customer_booking.json --root /tmp/small [--processes 8] [--sessions 50 | --duration 30]
+import argparse
+import builtins
+import importlib
+import io
+import json
+import os
+import random
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+DEFAULT_ENTRY = "cinema_compiled:main"
+DATABASE_DIR = "Cinema/Database"
+SHOWTIME_ANSWER = re.compile(r"ST\d+", re.IGNORECASE)
+PLACEHOLDER = re.compile(r"\{(free_seats):(\d+)\}|\{(process|session)\}")
+LABEL_WIDTH = 48
+
+
+class ScriptEnded(BaseException):
+    """
+    Raised from input() when a replayed session has no answers left or took another path.
+
+    Derived from BaseException so that the menus' "except Exception" handlers do not swallow it.
+
+    Attributes:
+        diverged (bool): True if the prompt did not match the recorded one.
+    """
+
+    def __init__(self, diverged=False):
+        super().__init__()
+        self.diverged = diverged
+
+
+def load_entry(entry):
+    """
+    Imports an entry function named as "module:function".
+
+    Args:
+        entry (str): The entry, such as "cinema_compiled:main".
+
+    Returns:
+        callable: The function.
+    """
+    module_name, _, function_name = entry.partition(":")
+    return getattr(importlib.import_module(module_name), function_name or "main")
+
+
+def load_session(filename):
+    with open(filename, "r", encoding="utf-8") as f:
+        session = json.load(f)
+    session.setdefault("entry", DEFAULT_ENTRY)
+    return session
+
+
+def record(filename, entry):
+    """
+    Runs the program interactively and saves every prompt and the answer typed at it.
+
+    Recording stops when the entry function returns or input ends (EOF or Ctrl-C).
+
+    Args:
+        filename (str): Session file to write.
+        entry (str): Entry function as "module:function".
+
+    Returns:
+        None
+    """
+    steps = []
+    real_input = builtins.input
+
+    def recording_input(prompt=""):
+        answer = real_input(prompt)
+        steps.append({"prompt": str(prompt), "answer": answer})
+        return answer
+
+    builtins.input = recording_input
+    try:
+        load_entry(entry)()
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        builtins.input = real_input
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump({"entry": entry, "steps": steps}, f, indent=2)
+        f.write("\n")
+    print(f'\nRecorded {len(steps)} steps to {filename}', file=sys.stderr)
+
+
+class Replay:
+    """
+    Feeds one session's answers to input() and times each step.
+
+    Attributes:
+        steps (list): Recorded {"prompt", "answer"} steps.
+        process (int): Number of the replaying process.
+        rng (random.Random): Picks free seats, seeded by process so processes spread out.
+        latencies (list): Per step, the latencies of every replay so far, in seconds.
+        completed (int): Sessions that ran to the end.
+        diverged (int): Sessions ended because a prompt did not match.
+        divergence (str): Prompt and recent output of the first diverged session.
+    """
+
+    def __init__(self, steps, process):
+        self.steps = steps
+        self.process = process
+        self.rng = random.Random(process)
+        self.latencies = [[] for _ in steps]
+        self.completed = 0
+        self.diverged = 0
+        self.divergence = None
+        self.session = 0
+        self.position = 0
+        self.answered_at = None
+        self.showtime_id = None
+        self.output = None
+
+    def free_seats(self, count):
+        from services import BookingService
+        from seating import load_seat_layouts, format_seat, is_seat_set
+        if self.showtime_id is None:
+            return ""
+        service = BookingService(DATABASE_DIR)
+        showtime = service.showtime(self.showtime_id)
+        layout = load_seat_layouts(os.path.join(DATABASE_DIR, "auditorium_info.txt")).get(showtime[2])
+        taken = service.taken_seats(self.showtime_id)
+        free = [format_seat(row, column) for row in range(layout.rows) for column in range(1, layout.columns + 1)
+                if not is_seat_set(taken, format_seat(row, column))]
+        if len(free) < count:
+            return "|".join(free)
+        start = self.rng.randrange(len(free) - count + 1)
+        return "|".join(free[start:start + count])
+
+    def resolve(self, answer):
+        def substitute(match):
+            if match.group(1):
+                return self.free_seats(int(match.group(2)))
+            return str(self.process if match.group(3) == "process" else self.session)
+        return PLACEHOLDER.sub(substitute, answer)
+
+    def finish_step(self, now):
+        if self.answered_at is not None:
+            self.latencies[self.position - 1].append(now - self.answered_at)
+            self.answered_at = None
+
+    def input(self, prompt=""):
+        now = time.perf_counter()
+        self.finish_step(now)
+        if self.position >= len(self.steps):
+            raise ScriptEnded()
+        step = self.steps[self.position]
+        if str(prompt).strip() != step["prompt"].strip():
+            if self.divergence is None:
+                self.divergence = f'step {self.position + 1}: expected {step["prompt"].strip()!r}, got {str(prompt).strip()!r}\n' \
+                                  f'last output:\n{self.output.getvalue()[-600:]}'
+            raise ScriptEnded(diverged=True)
+        answer = self.resolve(step["answer"])
+        if SHOWTIME_ANSWER.fullmatch(answer.strip()):
+            self.showtime_id = answer.strip().upper()
+        self.position += 1
+        self.answered_at = time.perf_counter()
+        return answer
+
+    def run(self, entry_function):
+        """
+        Replays the session once.
+
+        Returns:
+            None
+        """
+        self.session += 1
+        self.position = 0
+        self.answered_at = None
+        self.showtime_id = None
+        self.output = io.StringIO()
+        saved_stdout = sys.stdout
+        sys.stdout = self.output
+        diverged = False
+        try:
+            entry_function()
+        except ScriptEnded as e:
+            diverged = e.diverged
+        finally:
+            sys.stdout = saved_stdout
+        self.finish_step(time.perf_counter())
+        if diverged:
+            self.diverged += 1
+        else:
+            self.completed += 1
+
+
+def replay_worker(filename, root, process, sessions, duration):
+    """
+    Replays a session in a loop in one process.
+
+    Args:
+        filename (str): Session file.
+        root (str): Project root holding Cinema/Database.
+        process (int): Number of this process.
+        sessions (int): Sessions to replay, if duration is not given.
+        duration (float or None): Seconds to keep replaying.
+
+    Returns:
+        dict: Step latencies, session counts, the first divergence and the time window covered.
+    """
+    session = load_session(os.path.abspath(filename))
+    os.chdir(root)
+    replay = Replay(session["steps"], process)
+    real_input, real_system = builtins.input, os.system
+    builtins.input = replay.input
+    # On Windows clear_terminal shells out to cls, which would dominate every step; elsewhere it
+    # prints escape codes, which go to the captured output like everything else.
+    os.system = lambda command: 0 if command == "cls" else real_system(command)
+    try:
+        entry_function = load_entry(session["entry"])
+        started = time.time()
+        deadline = None if duration is None else time.perf_counter() + duration
+        while (replay.session < sessions) if deadline is None else (time.perf_counter() < deadline):
+            replay.run(entry_function)
+        ended = time.time()
+    finally:
+        builtins.input, os.system = real_input, real_system
+    return {"latencies": replay.latencies, "completed": replay.completed, "diverged": replay.diverged,
+            "divergence": replay.divergence, "started": started, "ended": ended}
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, round(fraction * (len(sorted_values) - 1)))]
+
+
+def step_label(index, step):
+    text = f'{index + 1:>3} {" ".join(step["prompt"].split())} -> {step["answer"]}'
+    return text if len(text) <= LABEL_WIDTH else text[:LABEL_WIDTH - 3] + "..."
+
+
+def replay(args):
+    session = load_session(args.session)
+    steps = session["steps"]
+    root = os.path.abspath(args.root)
+    if not os.path.isdir(os.path.join(root, DATABASE_DIR)):
+        raise SystemExit(f'{root} has no {DATABASE_DIR} directory.')
+    with ProcessPoolExecutor(max_workers=args.processes) as pool:
+        futures = [pool.submit(replay_worker, args.session, root, process, args.sessions, args.duration)
+                   for process in range(1, args.processes + 1)]
+        results = [future.result() for future in futures]
+
+    completed = sum(result["completed"] for result in results)
+    diverged = sum(result["diverged"] for result in results)
+    window = max(result["ended"] for result in results) - min(result["started"] for result in results)
+    print(f'{args.processes} processes, {completed} sessions completed, {diverged} diverged in {window:.2f}s: '
+          f'{completed / window if window else 0:.1f} sessions/sec')
+    print(f'{"step":{LABEL_WIDTH}}{"count":>8}{"p50 ms":>10}{"p99 ms":>10}{"max ms":>10}')
+    summary = []
+    for index, step in enumerate(steps):
+        latencies = sorted(latency for result in results for latency in result["latencies"][index])
+        if not latencies:
+            continue
+        row = {"step": index + 1, "prompt": step["prompt"], "count": len(latencies),
+               "p50_ms": round(percentile(latencies, 0.50) * 1000, 3), "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+               "max_ms": round(latencies[-1] * 1000, 3)}
+        summary.append(row)
+        print(f'{step_label(index, step):{LABEL_WIDTH}}{row["count"]:>8}{row["p50_ms"]:>10.2f}{row["p99_ms"]:>10.2f}{row["max_ms"]:>10.2f}')
+    divergence = next((result["divergence"] for result in results if result["divergence"]), None)
+    if divergence:
+        print(f'\nFirst divergence, {divergence}')
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"session": args.session, "processes": args.processes, "completed": completed, "diverged": diverged,
+                       "seconds": round(window, 3), "sessions_per_sec": round(completed / window if window else 0, 2), "steps": summary}, f, indent=2)
+            f.write("\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record and replay interactive menu sessions headlessly.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = commands.add_parser("record", help="run the program and save what is typed")
+    record_parser.add_argument("session", help="session file to write")
+    record_parser.add_argument("--entry", default=DEFAULT_ENTRY, help=f'entry function as module:function (default {DEFAULT_ENTRY})')
+
+    replay_parser = commands.add_parser("replay", help="replay a session in a loop from several processes")
+    replay_parser.add_argument("session", help="session file to replay")
+    replay_parser.add_argument("--root", default=".", help="project root holding Cinema/Database (default the current directory)")
+    replay_parser.add_argument("--processes", type=int, default=4, help="replaying processes (default 4)")
+    replay_parser.add_argument("--sessions", type=int, default=20, help="sessions per process (default 20)")
+    replay_parser.add_argument("--duration", type=float, help="replay for this many seconds instead of a number of sessions")
+    replay_parser.add_argument("--json", help="file to save the summary to")
+
+    args = parser.parse_args()
+    if args.command == "record":
+        record(args.session, args.entry)
+    else:
+        replay(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+#------------------------- PERFORMANCE STATS --------------------------------------------------
+# In-process latency histograms for every menu action and role, and a slow-ops log.
+#
+# Functions decorated with timed record how long each call took into a histogram
+# named after the function. Time spent waiting at input() prompts inside the call is
+# left out, so the figures measure the work done, not how fast staff type: while the
+# outermost timed call runs, builtins.input is swapped for a wrapper that adds up
+# the wait, and put back when the call returns. Decorating a function changes
+# nothing outside its calls, so importing a module that uses timed is safe. The
+# histograms are log-linear like HdrHistogram: exact below 128 microseconds and
+# within 1% above, in a few hundred counters however many calls are recorded.
+# The cinema manager's "Performance stats" action shows them for the running
+# terminal.
+#
+# A call that takes at least CINEMA_SLOW_MS milliseconds (default 500) is appended to
+# the slow-ops log named by CINEMA_SLOW_LOG (default slow_ops.log in the project
+# root) with its arguments.
+import builtins
+import functools
+import os
+import time
+from datetime import datetime
+
+SLOW_MS_ENV = "CINEMA_SLOW_MS"
+SLOW_LOG_ENV = "CINEMA_SLOW_LOG"
+DEFAULT_SLOW_MS = 500.0
+DEFAULT_SLOW_LOG = "slow_ops.log"
+SUB_BUCKET_BITS = 7
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+HALF_BUCKETS = SUB_BUCKETS >> 1
+ARGUMENT_TEXT_LIMIT = 200
+
+
+def bucket_index(micros):
+    """
+    Maps a latency to its histogram bucket.
+
+    Values below SUB_BUCKETS get a bucket each; above that, every power of two is split into HALF_BUCKETS equal buckets.
+
+    Args:
+        micros (int): Latency in whole microseconds.
+
+    Returns:
+        int: The bucket index.
+    """
+    if micros < SUB_BUCKETS:
+        return micros
+    shift = micros.bit_length() - SUB_BUCKET_BITS
+    return SUB_BUCKETS + (shift - 1) * HALF_BUCKETS + (micros >> shift) - HALF_BUCKETS
+
+
+def bucket_bounds(index):
+    """
+    Finds the range of latencies a bucket holds.
+
+    Args:
+        index (int): The bucket index.
+
+    Returns:
+        tuple: (lowest, highest) latency in microseconds.
+    """
+    if index < SUB_BUCKETS:
+        return index, index
+    shift = (index - SUB_BUCKETS) // HALF_BUCKETS + 1
+    top = (index - SUB_BUCKETS) % HALF_BUCKETS + HALF_BUCKETS
+    return top << shift, ((top + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of call latencies.
+
+    Attributes:
+        counts (dict): Maps a bucket index to the number of calls in it.
+        count (int): Number of calls recorded.
+        total (float): Sum of the latencies, in seconds.
+        minimum (float): Fastest call, in seconds.
+        maximum (float): Slowest call, in seconds.
+    """
+
+    def __init__(self):
+        self.counts = {}
+        self.count = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = None
+
+    def record(self, seconds):
+        index = bucket_index(int(seconds * 1_000_000))
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.minimum = seconds if self.minimum is None else min(self.minimum, seconds)
+        self.maximum = seconds if self.maximum is None else max(self.maximum, seconds)
+
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def value_at(self, percentile):
+        """
+        Estimates the latency below which a share of the calls fall.
+
+        Args:
+            percentile (float): Percentile between 0 and 100.
+
+        Returns:
+            float: The latency in seconds, the middle of its bucket, clamped to the recorded range.
+        """
+        if not self.count:
+            return 0.0
+        wanted = max(1, round(percentile / 100 * self.count))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= wanted:
+                low, high = bucket_bounds(index)
+                return min(max((low + high) / 2 / 1_000_000, self.minimum), self.maximum)
+        return self.maximum
+
+
+_histograms = {}
+_input_wait = [0.0]
+_real_input = builtins.input
+
+
+def _waiting_input(prompt=""):
+    started = time.perf_counter()
+    try:
+        return _real_input(prompt)
+    finally:
+        _input_wait[0] += time.perf_counter() - started
+
+
+def slow_threshold():
+    """
+    Reads the slow-op threshold from CINEMA_SLOW_MS.
+
+    Returns:
+        float: Threshold in seconds.
+    """
+    try:
+        return float(os.environ.get(SLOW_MS_ENV, DEFAULT_SLOW_MS)) / 1000
+    except ValueError:
+        return DEFAULT_SLOW_MS / 1000
+
+
+def slow_log_file():
+    """
+    Reads where slow calls are logged from CINEMA_SLOW_LOG.
+
+    Returns:
+        str: Path to the slow-ops log.
+    """
+    return os.environ.get(SLOW_LOG_ENV) or DEFAULT_SLOW_LOG
+
+
+def _argument_text(args, kwargs):
+    parts = [repr(arg) for arg in args] + [f'{key}={value!r}' for key, value in kwargs.items()]
+    text = ", ".join(parts)
+    return text if len(text) <= ARGUMENT_TEXT_LIMIT else text[:ARGUMENT_TEXT_LIMIT - 3] + "..."
+
+
+def log_slow_op(name, busy, wall, args, kwargs):
+    """
+    Appends a slow call to the slow-ops log.
+
+    Args:
+        name (str): Name of the operation.
+        busy (float): Seconds spent working, input() waits excluded.
+        wall (float): Seconds from call to return.
+        args (tuple): Positional arguments of the call.
+        kwargs (dict): Keyword arguments of the call.
+
+    Returns:
+        None
+    """
+    line = (f'{datetime.now().isoformat(timespec="seconds")} pid={os.getpid()} {name} busy={busy * 1000:.1f}ms '
+            f'wall={wall * 1000:.1f}ms args=({_argument_text(args, kwargs)})\n')
+    try:
+        with open(slow_log_file(), "a", encoding="utf-8") as f:
+            f.write(line)
+    except OSError:
+        pass
+
+
+def timed(function):
+    """
+    Decorates an operation so that every call is recorded in its latency histogram.
+
+    Args:
+        function (callable): The operation.
+
+    Returns:
+        callable: The timing wrapper.
+    """
+    name = f'{function.__module__}.{function.__name__}'
+    histogram = _histograms.setdefault(name, LatencyHistogram())
+
+    @functools.wraps(function)
+    def timed_call(*args, **kwargs):
+        global _real_input
+        # Nested timed calls find the wrapper already in place and leave it to the outermost one.
+        outermost = builtins.input is not _waiting_input
+        if outermost:
+            _real_input = builtins.input
+            builtins.input = _waiting_input
+        waited = _input_wait[0]
+        started = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            wall = time.perf_counter() - started
+            if outermost:
+                builtins.input = _real_input
+            busy = max(0.0, wall - (_input_wait[0] - waited))
+            histogram.record(busy)
+            if busy >= slow_threshold():
+                log_slow_op(name, busy, wall, args, kwargs)
+    return timed_call
+
+
+def stats_rows():
+    """
+    Summarises every operation called so far in this process, slowest p99 first.
+
+    Returns:
+        list: (name, calls, mean, p50, p90, p99, max) with latencies in milliseconds.
+    """
+    rows = []
+    for name, histogram in _histograms.items():
+        if histogram.count:
+            rows.append((name, histogram.count, histogram.mean() * 1000, histogram.value_at(50) * 1000,
+                         histogram.value_at(90) * 1000, histogram.value_at(99) * 1000, histogram.maximum * 1000))
+    rows.sort(key=lambda row: row[5], reverse=True)
+    return rows
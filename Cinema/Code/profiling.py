@@ -0,0 +1,156 @@
+#------------------------- SESSION PROFILING --------------------------------------------------
+# Opt-in profile of a whole terminal session, for slowness reported from the field.
+#
+# Set CINEMA_PROFILE before starting the program:
+#   CINEMA_PROFILE=cpu    main() runs under cProfile; on exit the statistics are saved
+#                         as a .prof file, to be read with "python -m pstats FILE" or
+#                         any pstats viewer
+#   CINEMA_PROFILE=mem    main() runs under tracemalloc; on exit a text report of the
+#                         peak traced memory and the source lines holding the most
+#                         memory is saved
+# Files go to CINEMA_PROFILE_DIR (default profiles/ in the project root) and are
+# named after the mode, the roles used in the session and the time the session
+# started, e.g. profiles/cpu-ticketing-clerk-20261018-135654-4242.prof. They are
+# written however the program ends, Ctrl-C and errors included. When the variable
+# is not set main() runs as usual.
+import cProfile
+import linecache
+import os
+import sys
+import tracemalloc
+from datetime import datetime
+
+PROFILE_ENV = "CINEMA_PROFILE"
+PROFILE_DIR_ENV = "CINEMA_PROFILE_DIR"
+DEFAULT_PROFILE_DIR = "profiles"
+MODES = ("cpu", "mem")
+TOP_ALLOCATIONS = 25
+
+_roles_used = []
+
+
+def profile_mode():
+    """
+    Reads the profiling mode from CINEMA_PROFILE.
+
+    Returns:
+        str or None: "cpu", "mem", or None if profiling is off or the value is not recognised.
+    """
+    value = os.environ.get(PROFILE_ENV, "").strip().lower()
+    if not value or value == "0":
+        return None
+    if value not in MODES:
+        print(f'[profile] Ignoring {PROFILE_ENV}={value!r}: expected one of {", ".join(MODES)}.', file=sys.stderr)
+        return None
+    return value
+
+
+def note_role(label):
+    """
+    Records a role chosen in this session, for the profile's file name.
+
+    Args:
+        label (str): The role's menu label, such as "Ticketing Clerk".
+
+    Returns:
+        None
+    """
+    role = "-".join(label.lower().split())
+    if role not in _roles_used:
+        _roles_used.append(role)
+
+
+def profile_path(mode, started, extension):
+    """
+    Builds the file name a session's profile is saved under.
+
+    Args:
+        mode (str): "cpu" or "mem".
+        started (datetime): When the session started.
+        extension (str): File extension, such as ".prof".
+
+    Returns:
+        str: Path inside the profile directory.
+    """
+    roles = "-".join(_roles_used) or "main-menu"
+    name = f'{mode}-{roles}-{started.strftime("%Y%m%d-%H%M%S")}-{os.getpid()}{extension}'
+    return os.path.join(os.environ.get(PROFILE_DIR_ENV) or DEFAULT_PROFILE_DIR, name)
+
+
+def memory_report(snapshot, peak, current):
+    """
+    Formats the top allocations of a tracemalloc snapshot.
+
+    Args:
+        snapshot (tracemalloc.Snapshot): Memory still allocated when the session ended.
+        peak (int): Peak traced memory in bytes.
+        current (int): Traced memory in bytes when the session ended.
+
+    Returns:
+        str: The report.
+    """
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    ))
+    lines = [f'Roles: {", ".join(_roles_used) or "none"}',
+             f'Peak traced memory: {peak / 1024:,.1f} KiB',
+             f'Traced memory at exit: {current / 1024:,.1f} KiB',
+             "",
+             f'Top {TOP_ALLOCATIONS} source lines by memory held at exit:']
+    for rank, stat in enumerate(snapshot.statistics("lineno")[:TOP_ALLOCATIONS], start=1):
+        frame = stat.traceback[0]
+        lines.append(f'{rank:>3}. {frame.filename}:{frame.lineno}: {stat.size / 1024:,.1f} KiB in {stat.count:,} blocks')
+        source = linecache.getline(frame.filename, frame.lineno).strip()
+        if source:
+            lines.append(f'       {source}')
+    return "\n".join(lines) + "\n"
+
+
+def _save(path, write):
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        write(path)
+        print(f'[profile] Saved {path}', file=sys.stderr)
+    except OSError as e:
+        print(f'[profile] Could not write {path}: {e}', file=sys.stderr)
+
+
+def _write_text(text):
+    def write(path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+    return write
+
+
+def run_profiled(function):
+    """
+    Runs the program's entry function, under the profiler CINEMA_PROFILE asks for, if any.
+
+    Args:
+        function (callable): The entry function, such as main.
+
+    Returns:
+        The entry function's return value.
+    """
+    mode = profile_mode()
+    if mode is None:
+        return function()
+    started = datetime.now()
+    if mode == "cpu":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            return function()
+        finally:
+            profiler.disable()
+            _save(profile_path(mode, started, ".prof"), profiler.dump_stats)
+    tracemalloc.start()
+    try:
+        return function()
+    finally:
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        _save(profile_path(mode, started, ".txt"), _write_text(memory_report(snapshot, peak, current)))
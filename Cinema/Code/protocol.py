@@ -0,0 +1,106 @@
+#------------------------- PROTOCOL --------------------------------------------------
+# Wire format shared by booking_server.py and booking_client.py.
+#
+# One JSON object per line in each direction. A request names a BookingService
+# method and its keyword arguments:
+#   {"op": "book", "args": {"showtime_id": "ST0001", "customer_id": "C0001", ...}}
+# and gets back either its result or the error it raised:
+#   {"ok": true, "result": ...}
+#   {"ok": false, "error": "SeatTakenError", "message": "...", "seats": ["A01"]}
+# Result objects travel as their attributes plus a "type" field naming the class.
+import json
+
+import services
+from services import ServiceError
+
+DEFAULT_PORT = 8765
+SERVER_ENV = "CINEMA_SERVER"
+OPERATIONS = ("showtime", "taken_seats", "check_seats", "hold", "release", "quote", "book", "get", "bookings_for", "cancel", "revenue")
+RESULT_TYPES = {cls.__name__: cls for cls in (services.Quote, services.Hold, services.Booking, services.Showtime, services.RevenueSummary)}
+ERROR_TYPES = {cls.__name__: cls for cls in (services.ServiceError, services.NotFoundError, services.InvalidRequestError, services.InvalidSeatError,
+                                             services.SeatTakenError, services.SeatHeldError, services.SlotTakenError, services.NotOwnerError)}
+
+
+def parse_address(address):
+    """
+    Parses a server address.
+
+    Args:
+        address (str): "unix:/path/to/socket", "host:port" or ":port" (localhost).
+
+    Returns:
+        tuple: ("unix", path) or ("tcp", (host, port)).
+
+    Raises:
+        ValueError: If the address is malformed.
+    """
+    if address.startswith("unix:"):
+        return "unix", address[len("unix:"):]
+    host, _, port = address.rpartition(":")
+    if not port.isdigit():
+        raise ValueError(f'Invalid server address "{address}", expected unix:PATH or HOST:PORT.')
+    return "tcp", (host or "127.0.0.1", int(port))
+
+
+def encode_value(value):
+    if type(value).__name__ in RESULT_TYPES:
+        return dict(vars(value), type=type(value).__name__)
+    if isinstance(value, list):
+        return [encode_value(item) for item in value]
+    return value
+
+
+def decode_value(value):
+    if isinstance(value, dict) and value.get("type") in RESULT_TYPES:
+        cls = RESULT_TYPES[value["type"]]
+        result = cls.__new__(cls)
+        result.__dict__.update((key, item) for key, item in value.items() if key != "type")
+        return result
+    if isinstance(value, list):
+        return [decode_value(item) for item in value]
+    return value
+
+
+def encode_error(error):
+    """
+    Encodes an exception raised by an operation as a response.
+
+    Args:
+        error (Exception): A ServiceError or OSError.
+
+    Returns:
+        dict: The response.
+    """
+    response = {"ok": False, "error": type(error).__name__, "message": str(error)}
+    if isinstance(error, ServiceError):
+        response["seats"] = getattr(error, "seats", None)
+    elif isinstance(error, OSError):
+        response["error"] = "FileNotFoundError" if isinstance(error, FileNotFoundError) else "OSError"
+        response["message"] = error.strerror or str(error)
+        response["filename"] = error.filename
+    return response
+
+
+def decode_error(response):
+    """
+    Rebuilds the exception described by an error response.
+
+    Args:
+        response (dict): The response.
+
+    Returns:
+        Exception: The ServiceError subclass or OSError the server raised.
+    """
+    name = response.get("error")
+    message = response.get("message", "")
+    if name in ("FileNotFoundError", "OSError"):
+        cls = FileNotFoundError if name == "FileNotFoundError" else OSError
+        return cls(2 if name == "FileNotFoundError" else 5, message, response.get("filename"))
+    cls = ERROR_TYPES.get(name, ServiceError)
+    if issubclass(cls, (services.InvalidSeatError, services.SeatTakenError)):
+        return cls(message, response.get("seats") or [])
+    return cls(message)
+
+
+def dump(message):
+    return (json.dumps(message) + "\n").encode("utf-8")
@@ -0,0 +1,62 @@
+#------------------------- REPORTS --------------------------------------------------
+# Report builders that join the booking, showtime and movie tables in memory.
+#
+# Each table is loaded once through the table store and joined through hash maps
+# keyed by showtime_id and movie_id, so a report is a single pass over the
+# bookings however many showtimes and movies there are.
+from storage import load_table, split_raw_line
+from bookings import load_bookings
+
+
+def booking_report(bookings_file, showtimes_file, movies_file, movie_id=None):
+    """
+    Builds the booking report rows, each enriched with the movie name, date and start time of its showtime.
+
+    Bookings whose showtime no longer exists are left out.
+
+    Args:
+        bookings_file (str): Path to the bookings file.
+        showtimes_file (str): Path to the showtimes file.
+        movies_file (str): Path to the movie listings file.
+        movie_id (str, optional): Only report bookings for this movie. Defaults to None.
+
+    Returns:
+        tuple: (header fields, list of row field lists).
+
+    Raises:
+        FileNotFoundError: If one of the table files does not exist.
+    """
+    bookings = load_bookings(bookings_file)
+    showtimes = load_table(showtimes_file)
+    movies = load_table(movies_file)
+
+    header = [field.upper() for field in bookings.header()]
+    header.insert(1, "MOVIE_NAME")
+    header.insert(2, "DATE")
+    header.insert(3, "START_TIME")
+
+    if movie_id is None:
+        selected = bookings.rows()
+    else:
+        selected = []
+        for showtime in showtimes.records[1:]:
+            if len(showtime) > 1 and showtime[1] == movie_id:
+                for position in bookings.by_showtime.get(showtime[0], []):
+                    selected.append(list(bookings.records[position]))
+
+    movie_names = {}
+    rows = []
+    for booking in selected:
+        showtime = showtimes.get(booking[1])
+        if showtime is None or len(showtime) < 5:
+            continue
+        if showtime[1] not in movie_names:
+            position = movies.index.get(showtime[1])
+            movie_names[showtime[1]] = None if position is None else split_raw_line(movies.lines[position])[1]
+        movie_name = movie_names[showtime[1]]
+        if movie_name is not None:
+            booking.insert(1, movie_name)
+        booking.insert(2, showtime[3])
+        booking.insert(3, showtime[4])
+        rows.append(booking)
+    return header, rows
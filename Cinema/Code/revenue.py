@@ -0,0 +1,413 @@
+#------------------------- REVENUE --------------------------------------------------
+# Running revenue aggregates kept in revenue_summary.txt next to the other tables.
+#
+# Every line is a delta:
+#   scope, key, normal_tickets, discounted_tickets, normal_revenue, discounted_revenue
+# where scope is total (key ALL), showtime, movie, auditorium or date. A booking
+# appends one positive line per scope and a cancellation one negative line, priced
+# at the showtime's prices when the booking is made. The aggregate for a key is the
+# sum of its lines. Readers keep the sums in memory and only read lines appended
+# since their last look, so the summary does not depend on the number of bookings.
+# Once the file holds many more lines than keys it is compacted to one line per key.
+#
+# So that a cancellation takes back exactly what its booking added, even after the
+# showtime was repriced, moved or removed, every booking's keys and amounts are
+# recorded in booking_revenue.txt:
+#   booking_id, showtime_id, movie_id, auditorium_id, date, normal_revenue, discounted_revenue
+# Bookings without such a line (made before it existed) are priced at the
+# showtime's current prices.
+import os
+
+from storage import Table, load_table, atomic_write, append_text
+from locking import file_lock
+from iostats import count_rows
+
+REVENUE_FILE_NAME = "revenue_summary.txt"
+SHOWTIME_FILE_NAME = "movie_showtimes.txt"
+PRICED_FILE_NAME = "booking_revenue.txt"
+HEADER = "scope, key, normal_tickets, discounted_tickets, normal_revenue, discounted_revenue\n"
+PRICED_HEADER = "booking_id, showtime_id, movie_id, auditorium_id, date, normal_revenue, discounted_revenue\n"
+PRICED_SCOPES = ("movie", "auditorium", "date")
+SCOPES = ("total", "showtime", "movie", "auditorium", "date")
+COMPACT_FACTOR = 4
+COMPACT_MIN_LINES = 1000
+
+
+def to_cents(price):
+    """
+    Converts a price string to whole cents.
+
+    Args:
+        price (str): Price such as "24.00". Empty or malformed prices count as 0.
+
+    Returns:
+        int: Price in cents.
+    """
+    try:
+        return round(float(price) * 100)
+    except ValueError:
+        return 0
+
+
+def format_cents(cents):
+    """
+    Formats whole cents as a price string.
+
+    Args:
+        cents (int): Amount in cents.
+
+    Returns:
+        str: Amount such as "24.00" or "-24.00".
+    """
+    sign = "-" if cents < 0 else ""
+    return f'{sign}{abs(cents) // 100}.{abs(cents) % 100:02}'
+
+
+def ticket_counts(tickets_text):
+    """
+    Splits a normal_discounted_tickets field into its two counts.
+
+    Args:
+        tickets_text (str): Ticket counts formatted as normal|discounted.
+
+    Returns:
+        tuple: (normal tickets, discounted tickets). Malformed counts are 0.
+    """
+    parts = [part.strip() for part in tickets_text.split("|")] + ["", ""]
+    return tuple(int(part) if part.isdigit() else 0 for part in parts[:2])
+
+
+def booking_amounts(showtime_id, showtime, tickets_text):
+    """
+    Calculates the aggregate keys and amounts a booking contributes.
+
+    Args:
+        showtime_id (str): ID of the booked showtime.
+        showtime (list or None): Fields of the booked showtime, or None if it no longer exists.
+        tickets_text (str): Ticket counts formatted as normal|discounted.
+
+    Returns:
+        tuple: (list of (scope, key) pairs, [normal tickets, discounted tickets, normal cents, discounted cents]).
+    """
+    normal, discounted = ticket_counts(tickets_text)
+    keys = [("total", "ALL"), ("showtime", showtime_id)]
+    if showtime is None or len(showtime) < 8:
+        return keys, [normal, discounted, 0, 0]
+    keys += [("movie", showtime[1]), ("auditorium", showtime[2]), ("date", showtime[3])]
+    return keys, [normal, discounted, normal * to_cents(showtime[6]), discounted * to_cents(showtime[7])]
+
+
+def recorded_amounts(booking, priced):
+    """
+    Rebuilds the aggregate keys and amounts of a booking from its booking_revenue.txt line.
+
+    Args:
+        booking (list): Fields of the booking.
+        priced (list): Fields of the booking's line in booking_revenue.txt.
+
+    Returns:
+        tuple: (list of (scope, key) pairs, [normal tickets, discounted tickets, normal cents, discounted cents]).
+    """
+    normal, discounted = ticket_counts(booking[4] if len(booking) > 4 else "")
+    keys = [("total", "ALL"), ("showtime", booking[1])]
+    keys += [(scope, key) for scope, key in zip(PRICED_SCOPES, priced[2:5]) if key]
+    return keys, [normal, discounted, to_cents(priced[5]), to_cents(priced[6])]
+
+
+def priced_line(booking_id, keys, amounts):
+    """
+    Formats the booking_revenue.txt line recording a booking's keys and amounts.
+
+    Args:
+        booking_id (str): ID of the booking.
+        keys (list): (scope, key) pairs from booking_amounts.
+        amounts (list): Amounts from booking_amounts.
+
+    Returns:
+        str: The line, newline included.
+    """
+    keyed = dict(keys)
+    fields = [booking_id, keyed["showtime"]] + [keyed.get(scope, "") for scope in PRICED_SCOPES] + [format_cents(amounts[2]), format_cents(amounts[3])]
+    return ", ".join(fields) + "\n"
+
+
+def format_line(scope, key, amounts):
+    return f'{scope}, {key}, {amounts[0]}, {amounts[1]}, {format_cents(amounts[2])}, {format_cents(amounts[3])}\n'
+
+
+class PricedTable(Table):
+    """
+    Booking revenue file indexed by booking and showtime, as booking IDs are not unique in older data.
+
+    Attributes:
+        by_booking (dict): Maps (booking ID, showtime ID) to the fields of its line.
+    """
+
+    def __init__(self, filename):
+        super().__init__(filename)
+        self.by_booking = {}
+        for record in self.records[1:]:
+            self.added(record)
+
+    def added(self, record):
+        if len(record) >= 7:
+            self.by_booking[(record[0], record[1])] = record
+
+
+class RevenueLedger:
+    """
+    In-memory sums of the revenue file.
+
+    Attributes:
+        filename (str): Path to the revenue file.
+        totals (dict): Maps (scope, key) to [normal tickets, discounted tickets, normal cents, discounted cents].
+        lines (int): Number of delta lines read.
+        inode (int): Inode of the file the sums were read from.
+        offset (int): Bytes of the file already read.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.reset(None)
+
+    def reset(self, inode):
+        self.totals = {}
+        self.lines = 0
+        self.inode = inode
+        self.offset = 0
+
+    def refresh(self):
+        """
+        Reads the lines appended to the file since the last refresh, or the whole file if it was replaced.
+
+        Returns:
+            None
+        """
+        try:
+            stat = os.stat(self.filename)
+        except FileNotFoundError:
+            self.reset(None)
+            return
+        if stat.st_ino != self.inode or stat.st_size < self.offset:
+            self.reset(stat.st_ino)
+        if stat.st_size == self.offset:
+            return
+        with open(self.filename, "rb") as f:
+            f.seek(self.offset)
+            data = f.read()
+        complete = data[:data.rfind(b"\n") + 1]
+        self.offset += len(complete)
+        lines = complete.decode("utf-8").splitlines()
+        count_rows(len(lines))
+        for line in lines:
+            self.apply_line(line)
+
+    def apply_line(self, line):
+        fields = [field.strip() for field in line.split(",")]
+        if len(fields) < 6 or fields[0] not in SCOPES:
+            return
+        try:
+            amounts = [int(fields[2]), int(fields[3]), to_cents(fields[4]), to_cents(fields[5])]
+        except ValueError:
+            return
+        self.add((fields[0], fields[1]), amounts)
+        self.lines += 1
+
+    def add(self, key, amounts):
+        total = self.totals.setdefault(key, [0, 0, 0, 0])
+        for i in range(4):
+            total[i] += amounts[i]
+
+    def get(self, scope, key="ALL"):
+        """
+        Retrieves the aggregate for one key.
+
+        Args:
+            scope (str): One of SCOPES.
+            key (str, optional): Showtime, movie or auditorium ID, or date. Defaults to "ALL".
+
+        Returns:
+            tuple: (normal tickets, discounted tickets, normal revenue, discounted revenue).
+        """
+        total = self.totals.get((scope, key), [0, 0, 0, 0])
+        return total[0], total[1], total[2] / 100, total[3] / 100
+
+    def breakdown(self, scope):
+        """
+        Retrieves the aggregates of every key in a scope.
+
+        Args:
+            scope (str): One of SCOPES.
+
+        Returns:
+            dict: Maps each key to (normal tickets, discounted tickets, normal revenue, discounted revenue).
+        """
+        return {key: self.get(scope, key) for (s, key) in self.totals if s == scope}
+
+    def snapshot(self):
+        """
+        Formats the current sums as one line per key.
+
+        Returns:
+            str: File contents, header included.
+        """
+        lines = [HEADER]
+        for scope in SCOPES:
+            for (s, key), amounts in sorted(self.totals.items()):
+                if s == scope and any(amounts):
+                    lines.append(format_line(scope, key, amounts))
+        return "".join(lines)
+
+
+_ledgers = {}
+
+
+def revenue_paths(bookings_file):
+    """
+    Locates the revenue, showtime and booking revenue files kept next to a bookings file.
+
+    Args:
+        bookings_file (str): Path to the bookings file.
+
+    Returns:
+        tuple: (revenue file path, showtimes file path, booking revenue file path).
+    """
+    directory = os.path.dirname(bookings_file)
+    return (os.path.join(directory, REVENUE_FILE_NAME), os.path.join(directory, SHOWTIME_FILE_NAME),
+            os.path.join(directory, PRICED_FILE_NAME))
+
+
+def load_ledger(revenue_file):
+    """
+    Retrieves the in-memory revenue sums, reading only what was appended since the last call.
+
+    Args:
+        revenue_file (str): Path to the revenue file.
+
+    Returns:
+        RevenueLedger: The refreshed ledger.
+    """
+    key = os.path.abspath(revenue_file)
+    if key not in _ledgers:
+        _ledgers[key] = RevenueLedger(revenue_file)
+    ledger = _ledgers[key]
+    ledger.refresh()
+    return ledger
+
+
+def _load_or_none(filename, table_class=Table):
+    try:
+        return load_table(filename, table_class)
+    except FileNotFoundError:
+        return None
+
+
+def _current_amounts(showtimes, booking):
+    showtime = showtimes.get(booking[1]) if showtimes is not None else None
+    return booking_amounts(booking[1], showtime, booking[4] if len(booking) > 4 else "")
+
+
+def _booked_amounts(showtimes, priced, booking):
+    record = priced.by_booking.get((booking[0], booking[1])) if priced is not None else None
+    if record is not None:
+        return recorded_amounts(booking, record)
+    return _current_amounts(showtimes, booking)
+
+
+def _append_priced(priced_file, line):
+    if not os.path.exists(priced_file):
+        with file_lock(priced_file):
+            if not os.path.exists(priced_file):
+                append_text(priced_file, PRICED_HEADER)
+    append_text(priced_file, line)
+
+
+def record_revenue(revenue_file, showtimes_file, priced_file, booking, sign):
+    """
+    Appends the revenue deltas of a booked or cancelled booking.
+
+    A new booking is priced at the showtime's current prices and its keys and amounts are recorded in the
+    booking revenue file; a cancellation negates what was recorded for the booking.
+
+    Args:
+        revenue_file (str): Path to the revenue file.
+        showtimes_file (str): Path to the showtimes file.
+        priced_file (str): Path to the booking revenue file.
+        booking (list): Fields of the booking.
+        sign (int): 1 for a new booking, -1 for a cancellation.
+
+    Returns:
+        None
+    """
+    if sign > 0:
+        keys, amounts = _current_amounts(_load_or_none(showtimes_file), booking)
+        _append_priced(priced_file, priced_line(booking[0], keys, amounts))
+    else:
+        keys, amounts = _booked_amounts(_load_or_none(showtimes_file), _load_or_none(priced_file, PricedTable), booking)
+    amounts = [sign * amount for amount in amounts]
+    with file_lock(revenue_file):
+        append_text(revenue_file, "".join(format_line(scope, key, amounts) for scope, key in keys))
+        ledger = load_ledger(revenue_file)
+        if ledger.lines > max(COMPACT_MIN_LINES, COMPACT_FACTOR * len(ledger.totals)):
+            atomic_write(revenue_file, ledger.snapshot())
+            load_ledger(revenue_file)
+
+
+def keep_priced(priced_file, booking_ids):
+    """
+    Drops the booking revenue lines of bookings that are no longer live.
+
+    Args:
+        priced_file (str): Path to the booking revenue file.
+        booking_ids (collection): IDs of the live bookings.
+
+    Returns:
+        None
+    """
+    with file_lock(priced_file):
+        priced = _load_or_none(priced_file, PricedTable)
+        if priced is None:
+            return
+        lines = [PRICED_HEADER] + [line for line, record in zip(priced.lines[1:], priced.records[1:]) if record[0] in booking_ids]
+        if len(lines) < len(priced.lines):
+            atomic_write(priced_file, "".join(lines))
+
+
+def rebuild_revenue(revenue_file, showtimes_file, priced_file, bookings):
+    """
+    Recalculates every aggregate from the live bookings and replaces the revenue file.
+
+    Bookings are counted at the amounts recorded when they were made, or at the showtime's current prices if none
+    were recorded; the booking revenue file is rewritten with a line for every live booking.
+
+    Args:
+        revenue_file (str): Path to the revenue file.
+        showtimes_file (str): Path to the showtimes file.
+        priced_file (str): Path to the booking revenue file.
+        bookings (list): Fields of every live booking.
+
+    Returns:
+        list: (scope, key, previous aggregate, rebuilt aggregate) for every key that did not match.
+    """
+    showtimes = _load_or_none(showtimes_file)
+    rebuilt = RevenueLedger(revenue_file)
+    with file_lock(priced_file):
+        priced = _load_or_none(priced_file, PricedTable)
+        lines = [PRICED_HEADER]
+        for booking in bookings:
+            keys, amounts = _booked_amounts(showtimes, priced, booking)
+            lines.append(priced_line(booking[0], keys, amounts))
+            for key in keys:
+                rebuilt.add(key, amounts)
+        atomic_write(priced_file, "".join(lines))
+    with file_lock(revenue_file):
+        previous = load_ledger(revenue_file)
+        mismatches = []
+        for key in sorted(set(previous.totals) | set(rebuilt.totals)):
+            before = previous.totals.get(key, [0, 0, 0, 0])
+            after = rebuilt.totals.get(key, [0, 0, 0, 0])
+            if before != after:
+                mismatches.append((key[0], key[1], previous.get(*key), rebuilt.get(*key)))
+        atomic_write(revenue_file, rebuilt.snapshot())
+        load_ledger(revenue_file)
+    return mismatches
@@ -0,0 +1,344 @@
+#------------------------- TICKETING CLERK --------------------------------------------------
+from storage import load_table
+from bookings import load_bookings
+from services import ServiceError, NotFoundError
+from booking_client import open_booking_service
+from iostats import io_action
+from perfstats import timed
+
+# File names - Change these if your files have different names
+MOVIE_FILE = "Cinema/Database/movie_listings.txt"
+SHOWTIME_FILE = "Cinema/Database/movie_showtimes.txt"
+BOOKING_FILE = "Cinema/Database/movie_bookings.txt"
+AUDITORIUM_FILE = "Cinema/Database/auditorium_info.txt"
+
+booking_service = open_booking_service("Cinema/Database")
+
+
+@io_action
+@timed
+def view_movies():
+    """Show all movies"""
+    print("\n========== AVAILABLE MOVIES ==========")
+
+    try:
+        for parts in load_table(MOVIE_FILE).rows():
+            movie_id = parts[0]
+            movie_name = parts[1]
+            genre = parts[4]
+
+            print(f"{movie_id} - {movie_name} ({genre})")
+
+        print("=" * 40)
+    except FileNotFoundError:
+        print(f"ERROR: {MOVIE_FILE} not found!")
+    except Exception as e:
+        print(f"ERROR: Could not read movies")
+
+
+@io_action
+@timed
+def view_auditoriums():
+    """Show all auditoriums"""
+    print("\n========== AUDITORIUMS ==========")
+
+    try:
+        file = open(AUDITORIUM_FILE, 'r')
+        lines = file.readlines()
+        file.close()
+
+        for i in range(1, len(lines)):
+            if lines[i].strip() == "":
+                continue
+
+            parts = lines[i].split(',')
+            audi_id = parts[0].strip()
+            audi_type = parts[1].strip()
+            capacity = parts[2].strip()
+            price = parts[5].strip()
+
+            print(f"{audi_id} - {audi_type} Hall | Capacity: {capacity} | Price: RM{price}")
+
+        print("=" * 40)
+    except FileNotFoundError:
+        print(f"ERROR: {AUDITORIUM_FILE} not found!")
+    except Exception as e:
+        print(f"ERROR: Could not read auditoriums")
+
+
+@io_action
+@timed
+def view_showtimes():
+    """Show all showtimes"""
+    print("\n========== MOVIE SHOWTIMES ==========")
+
+    try:
+        for parts in load_table(SHOWTIME_FILE).rows():
+            showtime_id = parts[0]
+            movie_id = parts[1]
+            audi_id = parts[2]
+            date = parts[3]
+            start = parts[4]
+
+            print(f"{showtime_id}: Movie {movie_id} | Hall {audi_id} | {date} at {start}")
+
+        print("=" * 40)
+    except FileNotFoundError:
+        print(f"ERROR: {SHOWTIME_FILE} not found!")
+    except Exception as e:
+        print(f"ERROR: Could not read showtimes")
+
+
+@io_action
+@timed
+def view_bookings():
+    """Show all bookings"""
+    print("\n========== ALL BOOKINGS ==========")
+
+    try:
+        bookings = load_bookings(BOOKING_FILE).rows()
+
+        count = 0
+        for parts in bookings:
+            booking_id = parts[0].strip()
+            showtime_id = parts[1].strip()
+            customer_id = parts[2].strip()
+            seats = parts[3].strip()
+
+            print(f"{booking_id}: Showtime {showtime_id} | Customer {customer_id} | Seats: {seats}")
+            count = count + 1
+
+        if count == 0:
+            print("No bookings yet.")
+
+        print("=" * 40)
+    except FileNotFoundError:
+        print(f"ERROR: {BOOKING_FILE} not found!")
+    except Exception as e:
+        print(f"ERROR: Could not read bookings")
+
+
+@io_action
+@timed
+def book_ticket():
+    """Book a new ticket"""
+    print("\n========== BOOK TICKET ==========")
+
+    view_movies()
+    view_auditoriums()
+    view_showtimes()
+
+    # Get booking info with validation for each field
+    while True:
+        try:
+            print("\nEnter details:")
+
+            # Get and validate Showtime ID
+            while True:
+                showtime_id = input("Showtime ID: ").strip()
+                if not showtime_id:
+                    print("ERROR: Showtime ID required!")
+                    continue
+
+                try:
+                    booking_service.showtime(showtime_id)
+                    break
+                except NotFoundError:
+                    print(f"ERROR: Showtime {showtime_id} not found! Try again.")
+                    continue
+                except FileNotFoundError:
+                    print(f"ERROR: {SHOWTIME_FILE} not found!")
+                    return
+
+            # Get Customer ID
+            while True:
+                customer_id = input("Customer ID: ").strip()
+                if not customer_id:
+                    print("ERROR: Customer ID required!")
+                    continue
+                break
+
+            # Get and validate Seats
+            while True:
+                seats = input("Seats (A1 or A1|A2): ").strip()
+                if not seats:
+                    print("ERROR: Seats required!")
+                    continue
+                break
+
+            # Get and validate Tickets
+            while True:
+                tickets = input("Tickets (normal|discount like 1|0): ").strip()
+                if not tickets:
+                    print("ERROR: Tickets required!")
+                    continue
+
+                if "|" not in tickets:
+                    print("ERROR: Tickets must be like 1|0 or 2|1. Try again.")
+                    continue
+
+                ticket_parts = tickets.split('|')
+                if len(ticket_parts) != 2:
+                    print("ERROR: Tickets must have 2 numbers (normal|discount). Try again.")
+                    continue
+
+                try:
+                    normal = int(ticket_parts[0])
+                    discount = int(ticket_parts[1])
+                    break
+                except ValueError:
+                    print("ERROR: Tickets must be numbers! Try again.")
+                    continue
+
+            # Check seats, tickets and prices, and hold the seats while the clerk confirms
+            try:
+                quote = booking_service.quote(showtime_id, seats.split('|'), normal, discount)
+                booking_service.hold(showtime_id, quote.seats)
+            except ServiceError as e:
+                print(f"\nERROR: {e}")
+                retry = input("Try again? (Y/N): ").strip().upper()
+                if retry != "Y":
+                    return
+                continue
+
+            # Show summary
+            print("\n========== SUMMARY ==========")
+            print(f"Movie: {quote.movie_id}")
+            print(f"Hall: {quote.auditorium_id}")
+            print(f"Showtime: {showtime_id}")
+            print(f"Seats: {seats}")
+            print(f"Normal: {normal} x RM{quote.normal_price()}")
+            print(f"Discount: {discount} x RM{quote.discounted_price()}")
+            print(f"TOTAL: RM{quote.total_price()}")
+            print("=" * 30)
+
+            confirm = input("\nConfirm? (Y/N): ").strip().upper()
+            if confirm != "Y":
+                booking_service.release(showtime_id)
+                print("Cancelled.")
+                return
+
+            # Save booking
+            try:
+                booking = booking_service.book(showtime_id, customer_id, quote.seats, normal, discount)
+
+                print("\n✓ Booking successful!")
+                print(f"Booking ID: {booking.booking_id}")
+                return
+
+            except ServiceError as e:
+                booking_service.release(showtime_id)
+                print(f"\nERROR: {e}")
+                return
+            except Exception as e:
+                booking_service.release(showtime_id)
+                print(f"\nERROR: Could not save booking!")
+                return
+
+        except Exception as e:
+            print(f"\nERROR: Something went wrong!")
+            retry = input("Try again? (Y/N): ").strip().upper()
+            if retry != "Y":
+                return
+
+
+@io_action
+@timed
+def cancel_booking():
+    """Cancel a booking"""
+    print("\n========== CANCEL BOOKING ==========")
+
+    view_bookings()
+
+    while True:
+        try:
+            booking_id = input("\nBooking ID to cancel (or 0 to exit): ").strip()
+
+            if booking_id == "0":
+                return
+
+            if not booking_id:
+                print("ERROR: Enter booking ID!")
+                continue
+
+            # Look up the booking
+            try:
+                booking = booking_service.get(booking_id)
+            except FileNotFoundError:
+                print("ERROR: No bookings file found!")
+                return
+            except NotFoundError:
+                print(f"ERROR: Booking {booking_id} not found!")
+                retry = input("Try again? (Y/N): ").strip().upper()
+                if retry != "Y":
+                    return
+                continue
+
+            print(f"\nFound: {booking.booking_id}, {booking.showtime_id}, {booking.customer_id}, {booking.seats_text()}, {booking.tickets_text()}")
+            confirm = input("Cancel? (Y/N): ").strip().upper()
+            if confirm != "Y":
+                print("Not cancelled.")
+                return
+
+            # Save updated bookings
+            try:
+                booking_service.cancel(booking_id)
+                print(f"\n✓ Booking {booking_id} cancelled!")
+                return
+            except Exception as e:
+                print("ERROR: Could not save changes!")
+                return
+
+        except Exception as e:
+            print("ERROR: Something went wrong!")
+            retry = input("Try again? (Y/N): ").strip().upper()
+            if retry != "Y":
+                return
+
+
+def main_ticketing_clerk():
+    """Main program"""
+    print("=" * 50)
+    print("   CINEMA TICKETING SYSTEM")
+    print("=" * 50)
+
+    while True:
+        try:
+            print("\n========== MENU ==========")
+            print("1. View Movies")
+            print("2. View Auditoriums")
+            print("3. View Showtimes")
+            print("4. Book Ticket")
+            print("5. View Bookings")
+            print("6. Cancel Booking")
+            print("7. Exit")
+            print("=" * 27)
+
+            choice = input("\nChoice (1-7): ").strip()
+
+            if choice == "1":
+                view_movies()
+            elif choice == "2":
+                view_auditoriums()
+            elif choice == "3":
+                view_showtimes()
+            elif choice == "4":
+                book_ticket()
+            elif choice == "5":
+                view_bookings()
+            elif choice == "6":
+                cancel_booking()
+            elif choice == "7":
+                print("\nGoodbye!")
+                return
+            else:
+                print("ERROR: Choose 1-7")
+
+            input("\nPress Enter...")
+
+        except KeyboardInterrupt:
+            print("\n\nExiting...")
+            break
+        except Exception as e:
+            print("\nERROR: Something went wrong!")
+            input("Press Enter to continue...")
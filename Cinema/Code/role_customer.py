@@ -0,0 +1,588 @@
+#------------------------- CUSTOMER --------------------------------------------------
+from pathlib import Path
+
+from storage import split_line, load_table, load_parsed, atomic_write
+from bookings import load_bookings
+from ids import counter_file, next_id
+from seating import ROW_LETTERS, load_seat_layouts, is_seat_set, format_seat
+from services import ServiceError, InvalidRequestError, SeatTakenError, SeatHeldError
+from booking_client import open_booking_service
+from holds import HOLD_SECONDS
+from iostats import io_action
+from perfstats import timed
+
+# --- Path setup compatible with teammate's files ---
+
+# Assume app is launched from the project root that contains "Cinema/"
+PROJECT_ROOT = Path.cwd()
+BASE = PROJECT_ROOT / "Cinema" / "Database"
+
+MOVIE_FILE       = str(BASE / "movie_listings.txt")
+SHOW_FILE        = str(BASE / "movie_showtimes.txt")     # teammate uses SHOWTIME_FILE
+CUSTOMER_FILE    = str(BASE / "customer.txt")
+BOOKING_FILE     = str(BASE / "movie_bookings.txt")
+AUD_SITTING_FILE = str(BASE / "auditorium_info.txt")     # teammate's file name
+DISCOUNT_FILE    = str(BASE / "discount_policies.txt")
+CUSTOMER_COUNTER_FILE = counter_file(str(BASE), "customer")
+
+booking_service = open_booking_service(str(BASE))
+
+
+def safe_input(msg):
+    text = input(msg)
+    return text.strip()
+
+def read_int(msg):
+    while True:
+        t = safe_input(msg)
+        if t.isdigit():
+            return int(t)
+        print("Please enter digits only.")
+
+EXIT_HINT = " (Enter 0 to return to menu)"
+
+def read_int_or_menu(msg):
+    while True:
+        t = safe_input(msg + EXIT_HINT + ": ")
+        if t == "0":
+            return None
+        if t.isdigit():
+            return int(t)
+        print("Please enter digits only.")
+
+def input_or_menu(msg):
+    t = safe_input(msg + EXIT_HINT + ": ")
+    if t == "0":
+        return None
+    return t.strip()
+
+def is_valid_msisdn_with_60(text):
+    return text.isdigit() and text.startswith("60") and len(text) > 2
+
+
+def split_csv_line(line):
+    return split_line(line)
+
+def join_csv(items):
+    texts = []
+    for it in items:
+        texts.append(str(it))
+    return ", ".join(texts)
+
+
+def read_all_lines(filename):
+    try:
+        f = open(filename, "r", encoding="utf-8")
+        raw = f.readlines()
+        f.close()
+    except FileNotFoundError:
+        print(f"[Warning] Missing file: {filename}. (Returning empty list.)")
+        return []
+    except PermissionError:
+        print(f"[Error] No permission to read: {filename}.")
+        return []
+    except OSError as e:
+        print(f"[Error] Could not read {filename}: {e}")
+        return []
+
+    out = []
+    for ln in raw:
+        out.append(ln.rstrip("\n"))
+    return out
+
+def append_line(filename, one_line):
+    try:
+        f = open(filename, "a", encoding="utf-8")
+        f.write(one_line + "\n")
+        f.close()
+    except PermissionError:
+        print(f"[Error] No permission to write: {filename}. Data not saved.")
+    except OSError as e:
+        print(f"[Error] Could not append to {filename}: {e}. Data not saved.")
+
+def write_all_lines(filename, lines):
+    try:
+        atomic_write(filename, "".join(ln + "\n" for ln in lines))
+    except PermissionError:
+        print(f"[Error] No permission to write: {filename}. Changes not saved.")
+    except OSError as e:
+        print(f"[Error] Could not write {filename}: {e}. Changes not saved.")
+
+
+def load_cached(filename, parse, empty):
+    try:
+        return load_parsed(filename, parse)
+    except FileNotFoundError:
+        print(f"[Warning] Missing file: {filename}. (Returning empty list.)")
+        return empty
+
+
+# The load_* results are cached until their file changes and shared between callers; do not modify them.
+def load_movies():
+    return load_cached(MOVIE_FILE, parse_movies, [])
+
+def parse_movies(table):
+    movies = []
+    for parts in table.rows():
+        if len(parts) >= 2:
+            movies.append({"movie_id": parts[0], "movie_name": parts[1]})
+    return movies
+
+def load_showtimes():
+    return load_cached(SHOW_FILE, parse_showtimes, [])
+
+def parse_showtimes(table):
+    shows = []
+    for parts in table.rows():
+        if len(parts) >= 9:
+            shows.append({
+                "showtime_id":      parts[0],
+                "movie_id":         parts[1],
+                "auditorium":       parts[2],
+                "date":             parts[3],
+                "start_time":       parts[4],
+                "end_time":         parts[5],
+                "normal_price":     parts[6],
+                "discounted_price": parts[7],
+                "discount_id":      parts[8],
+            })
+    return shows
+
+def load_discounts():
+    return load_cached(DISCOUNT_FILE, parse_discounts, {})
+
+def parse_discounts(table):
+    discs = {}
+    for parts in table.rows():
+        if len(parts) >= 2:
+            disc_id = parts[0]
+            name    = parts[1]
+            policy  = ", ".join(parts[2:]).strip()
+            discs[disc_id] = {"name": name, "policy": policy}
+    return discs
+
+
+def load_auditorium_seats():
+    return load_seat_layouts(AUD_SITTING_FILE)
+
+def pad2(n):
+    s = str(n)
+    if len(s) < 2:
+        s = "0" + s
+    return s
+
+def print_seat_map(aud_id, taken_seats, seats_by_aud):
+    if aud_id not in seats_by_aud:
+        print("No seating layout found for", aud_id)
+        return
+
+    layout = seats_by_aud[aud_id]
+
+    print("Legend: [ ] = available   [X] = taken")
+    header = "    "
+    for c in range(1, layout.columns + 1):
+        header = header + " " + pad2(c) + " "
+    print(header)
+
+    for r in range(layout.rows):
+        line = ROW_LETTERS[r] + " :"
+        for c in range(1, layout.columns + 1):
+            if is_seat_set(taken_seats, format_seat(r, c)):
+                line = line + " [X]"
+            else:
+                line = line + " [ ]"
+        print(line)
+    print("Seats left:", layout.seats_left(taken_seats), "of", layout.capacity())
+    print()
+
+
+def find_row_by_id(filename, id_index, target_id):
+    if id_index == 0:
+        try:
+            return load_table(filename).get(target_id)
+        except FileNotFoundError:
+            print(f"[Warning] Missing file: {filename}. (Returning empty list.)")
+            return None
+    lines = read_all_lines(filename)
+    for i in range(1, len(lines)):
+        parts = split_csv_line(lines[i])
+        if len(parts) > id_index and parts[id_index] == target_id:
+            return parts
+    return None
+
+def get_auditorium_for_showtime(showtime_id):
+    row = find_row_by_id(SHOW_FILE, 0, showtime_id)
+    if row is None or len(row) < 3:
+        return None
+    return row[2]
+
+
+def ask_existing_showtime_id_for_movie(movie_id):
+    shows = load_showtimes()
+    any_printed = False
+
+    for s in shows:
+        if s["movie_id"] == movie_id:
+            if not any_printed:
+                print("\n=== Showtimes for", movie_id, "===\n")
+            any_printed = True
+            print(" " + s["showtime_id"], "|", s["date"],
+                  s["start_time"] + "-" + s["end_time"], "| Aud:", s["auditorium"])
+            print()
+
+    if not any_printed:
+        print("No showtimes for that movie.\n")
+
+    while True:
+        sid = input_or_menu("Enter Showtime ID (e.g. ST0001)")
+        if sid is None: return None
+        row = find_row_by_id(SHOW_FILE, 0, sid)
+        if row is not None and len(row) > 1 and row[1] == movie_id:
+            print()
+            return sid
+        print("Invalid showtime for that movie. Try again.\n")
+
+
+def ask_existing_customer_login():
+    while True:
+        cid = input_or_menu("Customer ID (e.g. C0001)")
+        if cid is None: return None
+        pwd = input_or_menu("Password")
+        if pwd is None: return None
+
+        lines = read_all_lines(CUSTOMER_FILE)
+        for i in range(1, len(lines)):
+            parts = split_csv_line(lines[i])
+            if len(parts) >= 5 and parts[0] == cid and parts[4] == pwd:
+                return cid
+        print("ID or password incorrect. Try again.")
+
+def ask_existing_movie_id():
+    movies = load_movies()
+    if len(movies) == 0:
+        print("No movies found in", MOVIE_FILE)
+    else:
+        print("=== Movies ===")
+        for m in movies:
+            print(m["movie_id"] + " - " + m["movie_name"])
+
+    while True:
+        mid = input_or_menu("Enter Movie ID (e.g. M001)")
+        if mid is None: return None
+        if find_row_by_id(MOVIE_FILE, 0, mid):
+            return mid
+        print("Invalid Movie ID. Try again.")
+
+
+@io_action
+@timed
+def register_customer():
+    name = input_or_menu("Name")
+    if name is None: return
+
+    while True:
+        phone = input_or_menu("Phone (must start with 60)")
+        if phone is None: return
+        if is_valid_msisdn_with_60(phone): break
+        print("Phone must start with '60' and contain digits only.")
+
+    email = input_or_menu("Email")
+    if email is None: return
+    while "@" not in email:
+        print("Email must contain '@'.")
+        email = input_or_menu("Email")
+        if email is None: return
+
+    while True:
+        pwd1 = input_or_menu("Create password")
+        if pwd1 is None: return
+        pwd2 = input_or_menu("Confirm password")
+        if pwd2 is None: return
+        if pwd1 != "" and pwd1 == pwd2: break
+        print("Passwords do not match. Try again.")
+
+    cust_id = next_id(CUSTOMER_COUNTER_FILE, "C", 4, seed_file=CUSTOMER_FILE)
+    new_row = join_csv([cust_id, name, phone, email, pwd1])
+    append_line(CUSTOMER_FILE, new_row)
+    print("Registered! Your customer ID is:", cust_id)
+
+
+@io_action
+@timed
+def update_my_details():
+    lines = read_all_lines(CUSTOMER_FILE)
+    if len(lines) <= 1:
+        print("No customers yet.")
+        return
+
+    cid = ask_existing_customer_login()
+
+    idx = -1
+    cur = None
+    for i in range(1, len(lines)):
+        parts = split_csv_line(lines[i])
+        if parts[0] == cid:
+            idx = i
+            cur = parts
+            break
+    if idx == -1:
+        print("Unexpected: customer not found.")
+        return
+
+    print("Leave blank to keep current value in [brackets].")
+    new_name  = safe_input("Name  [" + cur[1] + "]: ") or cur[1]
+    new_phone = safe_input("Phone [" + cur[2] + "]: ") or cur[2]
+    new_email = safe_input("Email [" + cur[3] + "]: ") or cur[3]
+
+    if not new_phone.isdigit():
+        print("Phone must be digits only. Keeping old.")
+        new_phone = cur[2]
+    if "@" not in new_email:
+        print("Email must contain '@'. Keeping old.")
+        new_email = cur[3]
+
+    change = safe_input("Change password? (Y/N): ").strip().upper()
+    if change == "Y":
+        while True:
+            p1 = safe_input("New password: ")
+            p2 = safe_input("Confirm new password: ")
+            if p1 != "" and p1 == p2:
+                new_pass = p1
+                break
+            print("Passwords do not match or are empty. Try again.")
+    else:
+        new_pass = cur[4]
+
+    lines[idx] = join_csv([cid, new_name, new_phone, new_email, new_pass])
+    write_all_lines(CUSTOMER_FILE, lines)
+    print("Details updated.")
+
+
+@io_action
+@timed
+def view_all_movie_showtimes():
+    movies = load_movies()
+    shows  = load_showtimes()
+    discs  = load_discounts()
+
+    if len(movies) == 0 or len(shows) == 0:
+        print("No movies or showtimes to display.")
+        return
+
+    name_of = {}
+    for m in movies:
+        name_of[m["movie_id"]] = m["movie_name"]
+
+    print("=== All Movie Showtimes ===")
+    n = 1
+    for s in shows:
+        title = name_of.get(s["movie_id"], "(title not found)")
+        print(str(n) + ". Movie:", title)
+        print("   date:", s["date"])
+        print("   time:", s["start_time"])
+        print("   venue:", s["auditorium"])
+
+        if s["normal_price"] != "":
+            print("   normal price: RM", s["normal_price"])
+        if s["discounted_price"] != "" and s["discount_id"] != "":
+            did = s["discount_id"]
+            rule = discs.get(did, None)
+            print("   discounted price: RM", s["discounted_price"])
+            if rule is not None:
+                print("   discount:", did, "-", rule["name"])
+                print("   who qualifies: 10% off for students, kids, senior citizens, and OKU.")
+        print()
+        n = n + 1
+
+
+def live_booking_rows():
+    try:
+        return load_bookings(BOOKING_FILE).rows()
+    except FileNotFoundError:
+        print(f"[Warning] Missing file: {BOOKING_FILE}. (Returning empty list.)")
+        return []
+
+def seats_taken_for_show(showtime_id):
+    return booking_service.taken_seats(showtime_id)
+
+
+@io_action
+@timed
+def book_tickets():
+    cid = ask_existing_customer_login()
+    if cid is None:
+        return
+
+    mid = ask_existing_movie_id()
+    if mid is None:
+        return
+
+    sid = ask_existing_showtime_id_for_movie(mid)
+    if sid is None:
+        return
+
+    aud_id = get_auditorium_for_showtime(sid)
+    seats_map = load_auditorium_seats()
+    taken = seats_taken_for_show(sid)
+
+    print("\n=== Seat Map ===\n")
+    print_seat_map(aud_id, taken, seats_map)
+    print("This show is in", aud_id + ". Seats will be checked against that auditorium.\n")
+
+    while True:
+        raw = input_or_menu("Seats (e.g. A01|A02)")
+        if raw is None:
+            return
+
+        pieces = raw.split("|")
+        chosen = [p.strip() for p in pieces if p.strip() != ""]
+        if len(chosen) == 0:
+            print("Enter at least one seat.\n")
+            continue
+
+        try:
+            hold = booking_service.hold(sid, chosen)
+            chosen = hold.seats
+        except SeatHeldError as e:
+            for s in e.seats:
+                print("Seat", s, "is being booked at another kiosk. Pick others.")
+            print("")
+            continue
+        except SeatTakenError as e:
+            for s in e.seats:
+                print("Seat", s, "already taken. Pick others.")
+            print("")
+            continue
+        except (ServiceError, FileNotFoundError) as e:
+            print(e)
+            print("Please choose seats that exist in", aud_id + ".\n")
+            continue
+
+        break
+
+    shows = load_showtimes()
+    discs = load_discounts()
+    the_show = next((s for s in shows if s["showtime_id"] == sid), None)
+
+    print("")
+    if the_show:
+        if the_show["normal_price"]:
+            print("Normal price per ticket: RM", the_show["normal_price"])
+        if the_show["discounted_price"] and the_show["discount_id"]:
+            did = the_show["discount_id"]
+            print("Discounted price per ticket: RM", the_show["discounted_price"])
+            if did in discs:
+                print("Who qualifies: 10% off for students, kids, senior citizens, and OKU.")
+        else:
+            print("No discount set for this showtime.")
+    print("")
+
+    print("Your seats are held for", HOLD_SECONDS // 60, "minutes.")
+    while True:
+        normal = read_int_or_menu("Normal tickets")
+        if normal is None:
+            booking_service.release(sid)
+            return
+        disc = 0
+        if the_show and the_show["discounted_price"] and the_show["discount_id"]:
+            disc = read_int("Discounted tickets (if you qualify; enter 0 if none): ")
+
+        try:
+            booking = booking_service.book(sid, cid, chosen, normal, disc)
+        except InvalidRequestError as e:
+            print(e, "Enter the ticket counts again.\n")
+            continue
+        except ServiceError as e:
+            print(e)
+            booking_service.release(sid)
+            return
+        except OSError as e:
+            print(f"[Error] Could not append to {BOOKING_FILE}: {e}. Data not saved.")
+            booking_service.release(sid)
+            return
+        break
+
+    print("\nBooked! Your Booking ID is:", booking.booking_id, "\n")
+
+
+@io_action
+@timed
+def cancel_ticket():
+    cid = ask_existing_customer_login()
+    if cid is None:
+        return
+
+    try:
+        mine = booking_service.bookings_for(cid)
+    except FileNotFoundError:
+        print(f"[Warning] Missing file: {BOOKING_FILE}. (Returning empty list.)")
+        mine = []
+    print("=== Your Bookings ===")
+    for booking in mine:
+        print("Booking:", booking.booking_id, "| Show:", booking.showtime_id, "| Seats:", booking.seats_text())
+
+    if len(mine) == 0:
+        print("You have no bookings.")
+        return
+
+    while True:
+        bid = input_or_menu("Enter Booking ID to cancel")
+        if bid is None:
+            return
+        try:
+            booking_service.cancel(bid, cid)
+            break
+        except ServiceError:
+            print("That booking doesn't belong to you. Try again.")
+        except OSError as e:
+            print(f"[Error] Could not write {BOOKING_FILE}: {e}. Changes not saved.")
+            return
+
+    print("Booking", bid, "cancelled.")
+
+
+@io_action
+@timed
+def view_booking_history():
+    rows = live_booking_rows()
+    cid = ask_existing_customer_login()
+    if cid is None:
+        return
+    any_printed = False
+    print("=== Booking History for", cid, "===")
+
+    for parts in rows:
+        if len(parts) >= 3 and parts[2] == cid:
+            any_printed = True
+            print("Booking ID:", parts[0])
+            print(" Show ID:", parts[1])
+            print(" Seats:", parts[3])
+            print(" Tickets (normal|discount):", parts[4])
+            print("-" * 30)
+    if not any_printed:
+        print("No bookings found.")
+
+
+def main_customer():
+    while True:
+        print("\n=== CUSTOMER MENU ===")
+        print("[1] Register / Create account")
+        print("[2] Update my account details")
+        print("[3] View all movie showtimes (Movie/Date/Time/Venue)")
+        print("[4] Book tickets")
+        print("[5] Cancel my ticket")
+        print("[6] View my booking history")
+        print("[0] Exit")
+        choice = read_int("Enter your choice: ")
+
+        if choice == 1:   register_customer()
+        elif choice == 2: update_my_details()
+        elif choice == 3: view_all_movie_showtimes()
+        elif choice == 4: book_tickets()
+        elif choice == 5: cancel_ticket()
+        elif choice == 6: view_booking_history()
+        elif choice == 0:
+            print("Goodbye!")
+            return
+        else:
+            print("Invalid choice. Try again.")
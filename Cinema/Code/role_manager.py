@@ -0,0 +1,1148 @@
+#------------------------- CINEMA MANAGER --------------------------------------------------
+from datetime import datetime, timedelta
+
+from storage import load_table, append_row, update_row, remove_row, lint_item
+from bookings import rebuild_revenue_summary
+from ids import counter_file, id_block
+from reports import booking_report
+from iostats import io_action
+from perfstats import timed, stats_rows, slow_threshold, slow_log_file
+from services import BookingService, ShowtimeService, ServiceError, NotFoundError
+from terminal import (color_error_message, color_completion_message, color_confirmation_message, clear_terminal,
+                      validate_yes_no, validate_int, validate_float, validate_date, validate_time)
+
+# Return codes of menu actions
+MENU = 0
+AGAIN = 1
+
+AUDITORIUM_OPTIONS = ["AUD01", "AUD02", "AUD03", "AUD04", "AUD05", "AUD06", "AUD07", "AUD08"]
+CLASSIFICATION_OPTIONS = ["U", "P12", "13", "16", "18+", "18SG", "18SX"]
+
+MOVIE_CONFIRMATION_KEYS = ["Movie Name", "Release Date", "Running Time", "Genre", "Classification", "Spoken language", "Subtitle language", "Directors", "Casts", "Description", "Eligibility for discount"]
+SHOWTIME_CONFIRMATION_KEYS = ["Movie ID", "Auditorium ID", "Date", "Start Time", "End Time", "Normal Price", "Discounted Price", "Discount ID"]
+DISCOUNT_CONFIRMATION_KEYS = ["Discount Name", "Discount Type", "Discount Amount", "Discount Rate", "Discount Policies"]
+
+ID_BLOCK_SIZE = 10
+ID_COUNTER_ITEMS = {
+    "movie": ("M", "Cinema/Database/movie_listings.txt"),
+    "showtime": ("ST", "Cinema/Database/movie_showtimes.txt"),
+    "discount": ("D", "Cinema/Database/discount_policies.txt"),
+}
+
+booking_service = BookingService("Cinema/Database")
+showtime_service = ShowtimeService("Cinema/Database")
+
+
+def add_entry(filename, entry_detail_list):
+    """
+    Adds a formatted entry to a text file.
+
+    Args:
+        filename (str): Path to the file where the entry is to be added.
+        entry_detail_list (list): List of items to be formatted and written as a single line.
+
+    Returns:
+        None
+    """
+    formatted_entry = []
+    for item in entry_detail_list:
+        formatted_entry.append(lint_item(item))
+    try:
+        append_row(filename, ", ".join(formatted_entry))
+    except FileNotFoundError:
+        print(color_error_message(f'Error: {filename} file not found.'))
+        return
+
+
+def update_entry(filename, entry_id, detail_index, entry_detail_item):
+    """
+    Updates a specific field in an entry within a text file.
+
+    Args:
+        filename (str): Path to the file containing the entry.
+        entry_id (str): ID of the entry to be updated.
+        detail_index (int): Index of the field within the entry to be updated.
+        entry_detail_item (Any): New value to replace the existing one.
+
+    Returns:
+        None
+    """
+    try:
+        update_row(filename, entry_id, detail_index, lint_item(entry_detail_item))
+    except FileNotFoundError:
+        print(color_error_message(f'Error: {filename} file not found.'))
+        return
+
+
+def remove_entry(filename, entry_id):
+    """
+    Removes a specific entry within a text file.
+
+    Args:
+        filename (str): Path to the file containing the entry.
+        entry_id (str): ID of the entry to be removed.
+
+    Returns:
+        None
+    """
+    try: 
+        remove_row(filename, entry_id)
+    except FileNotFoundError:
+        print(color_error_message(f'Error: {filename} file not found.'))
+        return
+
+
+def view_all_entries(filename):
+    """
+    Displays all entries from a text file.
+
+    Args:
+        filename (str): Path to the file containing the entries.
+
+    Returns:
+        None
+    """
+    try:
+        with open(filename, "r") as f:
+            header = f.readline().upper()
+            print(header, end="")
+            print("-" * len(header))
+            entries = f.readlines()
+            if not entries:
+                print("No entries found.")
+            else:
+                for entry in entries:
+                    print(entry, end="")
+                print("\n")
+    except FileNotFoundError:
+        print(color_error_message(f'Error: {filename} file not found.'))
+        return None
+
+
+def lookup_entry(filename, entry_id="", header=0):
+    """
+    Retrieves either the header or a specific entry from a text file.
+
+    The file is loaded once into an in-memory table indexed by entry ID, so repeated lookups do not rescan the file.
+
+    Args:
+        filename (str): Path to the file containing entry.
+        entry_id (str, optional): ID of the entry to be retrieved. Defaults to "".
+        header (int, optional): If set to 1, returns the header row instead of searching for an entry. If set to 0, searches for an entry. Defaults to 0.
+
+    Returns:
+        list or None: Header or matching entry, or None if not found.
+    """
+    try: 
+        table = load_table(filename)
+    except FileNotFoundError:
+        print(color_error_message(f'Error: {filename} file not found.'))
+        return None
+    if header:
+        return table.header()
+    return table.get(entry_id)
+
+
+def id_counter(item_counted):
+    """
+    Retrieves the next ID number for a given item type from a persistent ID counter.
+
+    IDs are handed out from a block reserved in the counter file specific to the item type, so creating many items costs one counter write per ID_BLOCK_SIZE items. Numbers left unused when the program exits are given back or skipped, never reused.
+
+    Args:
+        item_counted (str): The name of the item type (e.g., "movie", "showtime") used to locate the counter file.
+
+    Returns:
+        int: The ID number, or None if the item type is unknown.
+    """
+    if item_counted not in ID_COUNTER_ITEMS:
+        return
+    prefix, seed_file = ID_COUNTER_ITEMS[item_counted]
+    block = id_block(counter_file("Cinema/Database", item_counted), ID_BLOCK_SIZE, seed_file, prefix)
+    return block.take()
+
+
+@io_action
+@timed
+def view_movie_listing():
+    """
+    Displays all movie listings.
+
+    Returns:
+        int: AGAIN to run the action again, or MENU to return to the menu.
+    """
+    view_all_entries("Cinema/Database/movie_listings.txt")
+    while True:
+        done = input("Press ENTER to return to cinema manager menu...")
+        if done == "":
+            return MENU
+
+
+@io_action
+@timed
+def add_movie_listing():
+    """
+    Collects movie details from user input and adds a new movie listing entry.
+
+    Returns:
+        int: AGAIN to run the action again, or MENU to return to the menu.
+    """
+    while True:
+        movie_name = input("Enter movie name: ")
+        if movie_name:
+            break
+        print(color_error_message("Invalid input: movie listing must have movie name."))
+
+    release_date = validate_date("Enter release date (DD-MM-YYYY): ")
+
+    while True:
+        running_time = validate_int("Enter running time (total number of minutes): ")
+        if 0 < running_time < 500:
+            break
+        print(color_error_message("Invalid input: running time should be greater than 0 and lesser than 500."))
+
+    genre = [genre.strip().title() for genre in input("Enter genres (lists should be comma-separated): ").split(",")]
+
+    for index, field in enumerate(CLASSIFICATION_OPTIONS, start=1):
+        print(f'[{index}] {field}', end="   ")
+    print()
+    while True:
+        classification_selection = validate_int("Select classification (enter number 1-7): ")
+        if (1 <= classification_selection <= 7):
+            classification = CLASSIFICATION_OPTIONS[classification_selection - 1]
+            break
+        print(color_error_message("Invalid option: please enter a number 1-7."))
+
+    spoken_language = input("Enter spoken language (full form): ").title()
+
+    subtitle_language = [language.strip().title() for language in input("Enter subtitle languages (full form, lists should be comma-separated): ").split(",")]
+
+    directors = [director.strip().title() for director in input("Enter director names (lists should be comma-separated): ").split(",")]
+
+    casts = [cast.strip().title() for cast in input("Enter cast names (lists should be comma-separated): ").split(",")]
+
+    description = input("Enter movie description: ")
+
+    eligibility_for_discount = validate_yes_no("Select eligibility for discount [Y/N]: ")
+
+    movie_listing = [movie_name, release_date, running_time, genre, classification, spoken_language, subtitle_language, directors, casts, description, eligibility_for_discount]
+
+    clear_terminal()
+    for i in range(len(MOVIE_CONFIRMATION_KEYS)):
+        print(f'{color_confirmation_message(MOVIE_CONFIRMATION_KEYS[i])}: {movie_listing[i] if not isinstance(movie_listing[i], list) else ", ".join(movie_listing[i])}')
+
+    confirmed = validate_yes_no("Confirm and add movie listing? [Y/N]: ") == "Y"
+    if confirmed:
+        movie_id_no = id_counter("movie")
+        movie_id = f'M{movie_id_no:03}'
+        movie_listing.insert(0, movie_id)
+        add_entry("Cinema/Database/movie_listings.txt", movie_listing)
+        notification = f'SUCCESS: Movie listing {movie_id} for "{movie_name}" added.'
+        print("-" * len(notification))
+        print(color_completion_message(notification))
+        print("\n")
+        return repeat_or_return("Add another movie listing? [Y/N]: ")
+    else:
+        return repeat_or_return("Try again? [Y/N]: ")
+
+
+@io_action
+@timed
+def update_movie_listing():
+    """
+    Updates a specific field in an existing movie listing entry.
+
+    Prompts the user for a movie ID, validates its existence, displays editable fields, and allows selection of one field to update.
+
+    Returns:
+        int: AGAIN to run the action again, or MENU to return to the menu.
+    """
+    movie_id = input("Enter ID of movie to be edited: ").upper().strip()
+    movie_listing = lookup_entry("Cinema/Database/movie_listings.txt", entry_id=movie_id)
+    if not movie_listing:
+        print(color_error_message("Invalid input: this movie ID does not exist."))
+        return repeat_or_return("Try again? [Y/N]: ")
+
+    details = lookup_entry("Cinema/Database/movie_listings.txt", header=1)
+    for index, field in enumerate(details[1:], start=1):
+        print(f'[{index}] {field}')
+
+    detail_selection = validate_int("Select detail (enter number 1-11): ")
+
+    match detail_selection:
+        case 1:
+            while True:
+                update_details = input("Enter update movie name: ")
+                if update_details:
+                    break
+                print(color_error_message("Invalid input: movie listing must have movie name."))
+        case 2:
+            update_details = validate_date("Enter updated release date (DD-MM-YYYY): ")
+        case 3:
+            while True:
+                update_details = validate_int("Enter updated running time (total number of minutes): ")
+                if 0 < update_details < 500:
+                    break
+                print(color_error_message("Invalid input: running time should be greater than 0 and lesser than 500."))
+        case 4:
+            update_details = [genre.strip().title() for genre in input("Enter updated genres (lists should be comma-separated): ").split(",")]
+        case 5:
+            for index, field in enumerate(CLASSIFICATION_OPTIONS, start=1):
+                print(f'[{index}] {field}', end="   ")
+            print()
+            while True:
+                classification_selection = validate_int("Select classification (enter number 1-7): ")
+                if (1 <= classification_selection <= 7):
+                    update_details = CLASSIFICATION_OPTIONS[classification_selection - 1]
+                    break
+                print(color_error_message("Invalid option: please enter a number 1-7."))
+        case 6:
+            update_details = input("Enter updated spoken language (full form): ").title()
+        case 7:
+            update_details = [language.strip().title() for language in input("Enter updated subtitle languages (full form, lists should be comma-separated): ").split(",")]
+        case 8:
+            update_details = [director.strip().title() for director in input("Enter updated director names (lists should be comma-separated): ").split(",")]
+        case 9:
+            update_details = [cast.strip().title() for cast in input("Enter updated cast names (lists should be comma-separated): ").split(",")]
+        case 10:
+            update_details = input("Enter updated description: ")
+        case 11:
+            update_details = validate_yes_no("Select updated eligibility for discount [Y/N]: ")
+        case _:
+            print(color_error_message("Invalid option."))
+            return repeat_or_return("Try again? [Y/N]: ")
+            
+    clear_terminal()       
+    print(f'{color_confirmation_message(MOVIE_CONFIRMATION_KEYS[detail_selection - 1])}: {update_details if not isinstance(update_details, list) else ", ".join(update_details)}')
+    
+    confirmed = validate_yes_no("Confirm and update movie listing? [Y/N]: ") == "Y"
+    if confirmed:
+        update_entry("Cinema/Database/movie_listings.txt", movie_id, detail_selection, update_details)
+        notification = f'SUCCESS: Movie listing {movie_id} for "{lookup_entry("Cinema/Database/movie_listings.txt", entry_id=movie_id)[1]}" updated.'
+        print("-" * len(notification))
+        print(color_completion_message(notification))
+        print("\n")
+        return repeat_or_return("Update another movie listing? [Y/N]: ")
+    else:
+        return repeat_or_return("Try again? [Y/N]: ")
+            
+
+@io_action
+@timed
+def remove_movie_listing():
+    """
+    Removes a specific movie listing entry.
+
+    Prompts the user for a movie ID, validates its existence, then deletes corresponding movie listing.
+
+    Returns:
+        int: AGAIN to run the action again, or MENU to return to the menu.
+    """
+    movie_id = input("Enter ID of movie to be removed: ").upper().strip()
+    movie_listing = lookup_entry("Cinema/Database/movie_listings.txt", entry_id=movie_id)
+    if not movie_listing:
+        print(color_error_message("Invalid input: this movie ID does not exist."))
+        return repeat_or_return("Try again? [Y/N]: ")
+    remove_entry("Cinema/Database/movie_listings.txt", movie_id)
+    notification = f'SUCCESS: Movie listing {movie_id} for "{movie_listing[1]}" removed.'
+    print("-" * len(notification))
+    print(color_completion_message(notification))
+    print("\n")
+    return repeat_or_return("Remove another movie listing? [Y/N]: ")
+
+
+@io_action
+@timed
+def view_showtime():
+    """
+    Displays all movie showtimes.
+
+    Returns:
+        int: AGAIN to run the action again, or MENU to return to the menu.
+    """
+    view_all_entries("Cinema/Database/movie_showtimes.txt")
+    while True:
+        done = input("Press ENTER to return to cinema manager menu...")
+        if done == "":
+            return MENU
+
+
+def calculate_discount(discount_id, normal_price):
+    """
+    Calculates the discounted price based on a discount policy.
+
+    Applies either a fixed amount or percentage-based discount to the normal price and rounds the result to two decimal places.
+
+    Args:
+        discount_id (str): ID of the discount policy.
+        normal_price (float): Original price before discount.
+
+    Returns:
+        str: The discounted price, or "" if the policy type is unknown.
+
+    Raises:
+        NotFoundError: If the discount policy does not exist.
+    """
+    return showtime_service.discounted_price(discount_id, normal_price)
+
+
+def round_time(end_time):
+    """
+    Rounds up a time to the nearest 5 minutes if needed.
+
+    Args:
+        end_time (datetime.datetime): The time to be rounded.
+
+    Returns:
+        datetime.datetime: The time rounded to the nearest 5 minutes.
+    """
+    end_time = end_time.replace(second=0, microsecond=0)
+    minutes_to_add = (5 - end_time.minute % 5) % 5
+    if minutes_to_add:
+        end_time += timedelta(minutes=minutes_to_add)
+    return end_time
+
+
+def free_auditoriums(date, parsed_start_time, parsed_end_time, ignore=None):
+    """
+    Determines the auditoriums with no showtime within BUFFER_MINUTES of a time slot and no repair still running when it ends.
+
+    Args:
+        date (str): The date of the time slot.
+        parsed_start_time (datetime.datetime): The start of the time slot.
+        parsed_end_time (datetime.datetime): The rounded end of the time slot.
+        ignore (str, optional): ID of a showtime to leave out, such as the one being rescheduled. Defaults to None.
+
+    Returns:
+        list: The IDs of the free auditoriums, in AUDITORIUM_OPTIONS order.
+    """
+    start_time = datetime.strftime(parsed_start_time, "%H%M")
+    end_time = datetime.strftime(parsed_end_time, "%H%M")
+    return showtime_service.free_auditoriums(date, start_time, end_time, AUDITORIUM_OPTIONS, ignore)
+
+
+@io_action
+@timed
+def add_showtime():
+    """
+    Collects showtime details from user input and adds a new movie showtime entry.
+
+    Returns:
+        int: AGAIN to run the action again, or MENU to return to the menu.
+    """
+    movie_id = input("Enter movie ID: ").upper().strip()
+    try:
+        movie_listing = showtime_service.movie(movie_id)
+    except NotFoundError:
+        print(color_error_message("Invalid input: this movie ID does not exist."))
+        return repeat_or_return("Try again? [Y/N]: ")
+    except FileNotFoundError as e:
+        print(color_error_message(f'Error: "{e.filename}" file not found.'))
+        return repeat_or_return("Try again? [Y/N]: ")
+
+    while True:
+        date = validate_date("Enter date (DD-MM-YYYY): ")
+        parsed_date = datetime.strptime(date, "%d-%m-%Y")
+        if parsed_date > datetime.now():
+            break
+        print(color_error_message("Invalid input: showtime date should not be before today."))
+
+    start_time = validate_time("Enter start time (HHMM): ")
+    try:
+        end_time = showtime_service.end_time(movie_id, start_time)
+    except ServiceError as e:
+        print(color_error_message(f'Invalid input: {e}'))
+        return repeat_or_return("Try again? [Y/N]: ")
+    available_auditoriums = showtime_service.free_auditoriums(date, start_time, end_time, AUDITORIUM_OPTIONS)
+
+    if not available_auditoriums:
+        print(color_error_message("Unavailable time: no auditoriums are available for this time slot."))
+        return repeat_or_return("Try again? [Y/N]: ")
+
+    end_auditorium_number = len(available_auditoriums)
+    for index, field in enumerate(available_auditoriums, start=1):
+        print(f'[{index}] {field}', end="   ")
+    print()
+    while True:
+        auditorium_selection = validate_int(f'Select auditorium (enter number 1-{end_auditorium_number}): ')
+        if (1 <= auditorium_selection <= end_auditorium_number):
+            auditorium_id = available_auditoriums[auditorium_selection - 1]
+            break
+        print(color_error_message(f'Invalid option: please enter a number 1-{end_auditorium_number}.'))
+
+    discount_id = input("Enter discount ID: ").upper().strip() if movie_listing[11] == "Y" else None
+    try:
+        showtime = showtime_service.plan(movie_id, auditorium_id, date, start_time, discount_id)
+    except (ServiceError, FileNotFoundError) as e:
+        print(color_error_message(f'Invalid input: {e}'))
+        return repeat_or_return("Try again? [Y/N]: ")
+
+    clear_terminal()
+    fields = showtime.fields()
+    for i in range(len(SHOWTIME_CONFIRMATION_KEYS)):
+        print(f'{color_confirmation_message(SHOWTIME_CONFIRMATION_KEYS[i])}: {fields[i] if fields[i] != "" else "N/A"}')
+
+    confirmed = validate_yes_no("Confirm and add movie showtime? [Y/N]: ") == "Y"
+    if confirmed:
+        try:
+            showtime = showtime_service.add(showtime)
+        except (ServiceError, FileNotFoundError) as e:
+            print(color_error_message(f'Error: {e}'))
+            return repeat_or_return("Try again? [Y/N]: ")
+        notification = f'SUCCESS: Showtime {showtime.showtime_id} for {movie_id} at {start_time}, {date} added.'
+        print("-" * len(notification))
+        print(color_completion_message(notification))
+        print("\n")
+        return repeat_or_return("Add another movie showtime? [Y/N]: ")
+    else:
+        return repeat_or_return("Try again? [Y/N]: ")
+
+
+@io_action
+@timed
+def update_showtime():
+    """
+    Updates a specific field in an existing movie showtime entry.
+
+    Prompts the user for a showtime ID, validates its existence, displays editable fields, and allows selection of one field to update.
+
+    Returns:
+        int: AGAIN to run the action again, or MENU to return to the menu.
+    """
+
+    def check_auditorium_availability(date, start_time, showtime_id):
+        """
+        Determines the available auditoriums for a certain date and timeframe.
+
+        Args:
+            date (str): The date of the showtime.
+            start_time (str): The start time of the showtime.
+            showtime_id (str): The ID of the showtime to be updated.
+
+        Returns:
+            list or None: A list containing the auditorium ID of the selected auditorium, the end time, the normal price based on the auditorium, and the discounted price based on the normal price and the existing discount ID if the movie is eligible for discount. None if no auditorium is available.
+        """
+        movie_showtime = lookup_entry("Cinema/Database/movie_showtimes.txt", entry_id=showtime_id)
+        movie_id = movie_showtime[1]
+        movie_listing = lookup_entry("Cinema/Database/movie_listings.txt", entry_id=movie_id)
+        duration = timedelta(minutes=int(movie_listing[3]))
+        parsed_start_time = datetime.strptime(start_time, "%H%M")
+        parsed_end_time = round_time(parsed_start_time + duration)
+        end_time = datetime.strftime(parsed_end_time, "%H%M")
+        available_auditoriums = free_auditoriums(date, parsed_start_time, parsed_end_time, ignore=showtime_id)
+
+        if not available_auditoriums:
+            print(color_error_message("Unavailable time: no auditoriums are available for this time slot."))
+            return None
+
+        end_auditorium_number = len(available_auditoriums)
+        for index, field in enumerate(available_auditoriums, start=1):
+            print(f'[{index}] {field}', end="   ")
+        print()
+        while True:
+            auditorium_selection = validate_int(f'Select auditorium (enter number 1-{end_auditorium_number}): ')
+            if (1 <= auditorium_selection <= end_auditorium_number):
+                auditorium_id = available_auditoriums[auditorium_selection - 1]
+                break
+            print(color_error_message(f'Invalid option: please enter a number 1-{end_auditorium_number}.'))
+        auditorium_info = lookup_entry("Cinema/Database/auditorium_info.txt", entry_id=auditorium_id)
+        normal_price = round(float(auditorium_info[5]), 2)
+        discounted_price = None
+        
+        if movie_listing[11] == "Y":
+            discount_id = movie_showtime[8]
+            discounted_price = calculate_discount(discount_id, normal_price)
+        else:
+            discount_id = None
+        
+        update_details = [auditorium_id, end_time, f'{normal_price:.2f}', discounted_price if discounted_price is not None else ""]
+        return update_details
+
+    showtime_id = input("Enter ID of showtime to be edited: ").upper().strip()
+    movie_showtime = lookup_entry("Cinema/Database/movie_showtimes.txt", entry_id=showtime_id)
+    if not movie_showtime:
+        print(color_error_message("Invalid input: this showtime ID does not exist."))
+        return repeat_or_return("Try again? [Y/N]: ")
+
+    date = movie_showtime[3]
+    parsed_date = datetime.strptime(date, "%d-%m-%Y")
+    if parsed_date < datetime.now():
+        print(color_error_message("Invalid input: past showtimes cannot be updated."))
+        return repeat_or_return("Try again? [Y/N]: ")
+            
+    details = lookup_entry("Cinema/Database/movie_showtimes.txt", header=1)
+    for index, field in enumerate(details[1:5] + [details[8]], start=1):
+        print(f'[{index}] {field}')
+
+    detail_selection = validate_int("Select detail (enter number 1-5): ")
+
+    match detail_selection:
+        case 1:
+            update_details = input("Enter updated movie ID: ").upper().strip()
+            movie_listing = lookup_entry("Cinema/Database/movie_listings.txt", entry_id=update_details)
+            if not movie_listing:
+                print(color_error_message(
+                    "Invalid input: this movie ID does not exist."))
+                return repeat_or_return("Try again? [Y/N]: ")
+        case 2:
+            start_time = movie_showtime[4]
+            update_details = check_auditorium_availability(date, start_time, showtime_id)
+        case 3:
+            while True:
+                date = validate_date("Enter updated date (DD-MM-YYYY): ")
+                parsed_date = datetime.strptime(date, "%d-%m-%Y")
+                if parsed_date > datetime.now():
+                    break
+                print(color_error_message("Invalid input: showtime date should not be before today."))
+            start_time = movie_showtime[4]
+            update_details = check_auditorium_availability(date, start_time, showtime_id)
+        case 4:
+            start_time = validate_time("Enter updated start time (HHMM): ")
+            update_details = check_auditorium_availability(date, start_time, showtime_id)
+        case 5:
+            movie_id = movie_showtime[1]
+            movie_listing = lookup_entry("Cinema/Database/movie_listings.txt", entry_id=movie_id)
+            if movie_listing[11] == "Y":
+                discount_id = input("Enter updated discount ID: ").upper().strip()
+                discount_policy = lookup_entry("Cinema/Database/discount_policies.txt", entry_id=discount_id)
+                if not discount_policy:
+                    print(color_error_message("Invalid input: this discount ID does not exist."))
+                    return repeat_or_return("Try again? [Y/N]: ")
+                normal_price = movie_showtime[6]
+                discounted_price = calculate_discount(discount_id, normal_price)
+                update_details = [discounted_price, discount_id]
+            else:
+                print(color_error_message("Invalid option: this movie is not eligible for discounts."))
+                return repeat_or_return("Try again? [Y/N]: ")
+        case _:
+            print(color_error_message("Invalid option."))
+            return repeat_or_return("Try again? [Y/N]: ")
+    if update_details is None:
+        return repeat_or_return("Try again? [Y/N]: ")
+
+    clear_terminal()
+    match detail_selection:
+        case 1:
+            print(f'{color_confirmation_message(SHOWTIME_CONFIRMATION_KEYS[0])}: {update_details}')
+        case 2 | 3 | 4:
+            print(f'{color_confirmation_message(SHOWTIME_CONFIRMATION_KEYS[1])}: {update_details[0]}')
+            print(f'{color_confirmation_message(SHOWTIME_CONFIRMATION_KEYS[2])}: {date}')
+            print(f'{color_confirmation_message(SHOWTIME_CONFIRMATION_KEYS[3])}: {start_time}')
+            print(f'{color_confirmation_message(SHOWTIME_CONFIRMATION_KEYS[4])}: {update_details[1]}')
+            print(f'{color_confirmation_message(SHOWTIME_CONFIRMATION_KEYS[5])}: {update_details[2]}')
+            print(f'{color_confirmation_message(SHOWTIME_CONFIRMATION_KEYS[6])}: {update_details[3] if update_details[3] != "" else "N/A"}')
+        case 5:
+            print(f'{color_confirmation_message(SHOWTIME_CONFIRMATION_KEYS[7])}: {update_details[1]}')
+            print(f'{color_confirmation_message(SHOWTIME_CONFIRMATION_KEYS[6])}: {update_details[0]}')
+        
+    confirmed = validate_yes_no("Confirm and update movie showtime? [Y/N]: ") == "Y"
+    if confirmed:
+        match detail_selection:
+            case 1:
+                update_entry("Cinema/Database/movie_showtimes.txt", showtime_id, detail_selection, update_details)
+            case 2 | 3 | 4:
+                update_entry("Cinema/Database/movie_showtimes.txt", showtime_id, 2, update_details[0])
+                update_entry("Cinema/Database/movie_showtimes.txt", showtime_id, 5, update_details[1])
+                update_entry("Cinema/Database/movie_showtimes.txt", showtime_id, 6, update_details[2])
+                update_entry("Cinema/Database/movie_showtimes.txt", showtime_id, 7, update_details[3])
+                update_entry("Cinema/Database/movie_showtimes.txt", showtime_id, 3, date)
+                update_entry("Cinema/Database/movie_showtimes.txt", showtime_id, 4, start_time)
+            case 5:
+                update_entry("Cinema/Database/movie_showtimes.txt", showtime_id, 7, update_details[0])
+                update_entry("Cinema/Database/movie_showtimes.txt", showtime_id, 8, update_details[1])
+
+        notification = f'SUCCESS: Showtime {showtime_id} for {lookup_entry("Cinema/Database/movie_showtimes.txt", entry_id=showtime_id)[1]} at {lookup_entry("Cinema/Database/movie_showtimes.txt", entry_id=showtime_id)[3]}, {lookup_entry("Cinema/Database/movie_showtimes.txt", entry_id=showtime_id)[4]} updated.'
+        print("-" * len(notification))
+        print(color_completion_message(notification))
+        print("\n")
+        return repeat_or_return("Update another movie showtime? [Y/N]: ")
+    else:
+        return repeat_or_return("Try again? [Y/N]: ")
+
+
+@io_action
+@timed
+def remove_showtime():
+    """
+    Removes a specific movie showtime entry.
+
+    Prompts the user for a showtime ID, validates its existence, then deletes corresponding movie listing.
+
+    Returns:
+        int: AGAIN to run the action again, or MENU to return to the menu.
+    """
+    showtime_id = input("Enter ID of showtime to be removed: ").upper().strip()
+    movie_showtime = lookup_entry("Cinema/Database/movie_showtimes.txt", entry_id=showtime_id)
+    if not movie_showtime:
+        print(color_error_message("Invalid input: this showtime ID does not exist."))
+        return repeat_or_return("Try again? [Y/N]: ")
+    remove_entry("Cinema/Database/movie_showtimes.txt", showtime_id)
+    notification = f'SUCCESS: Showtime {showtime_id} for {movie_showtime[1]} at {movie_showtime[3]}, {movie_showtime[4]} removed.'
+    print("-" * len(notification))
+    print(color_completion_message(notification))
+    print("\n")
+    return repeat_or_return("Remove another movie showtime? [Y/N]: ")
+
+
+@io_action
+@timed
+def view_discount():
+    """
+    Displays all discount policies.
+
+    Returns:
+        int: AGAIN to run the action again, or MENU to return to the menu.
+    """
+    view_all_entries("Cinema/Database/discount_policies.txt")
+    while True:
+        done = input("Press ENTER to return to cinema manager menu...")
+        if done == "":
+            return MENU
+
+
+@io_action
+@timed
+def add_discount():
+    """
+    Collects discount details from user input and adds a new duscount policy entry.
+
+    Returns:
+        int: AGAIN to run the action again, or MENU to return to the menu.
+    """
+    while True:
+        discount_name = input("Enter discount name: ")
+        if discount_name:
+            break
+        print(color_error_message("Invalid input: discount policy must have discount name."))
+
+    discount_type_options = ["fixed", "percentage"]
+    for index, field in enumerate(discount_type_options[0: 2], start=1):
+        print(f'[{index}] {field}', end="   ")
+    print()
+    discount_type_selection = validate_int("Select discount type (enter number 1-2): ")
+    match discount_type_selection:
+        case 1:
+            discount_type = discount_type_options[0]
+            discount_amount = validate_float("Enter discount amount (2 decimal float): ")
+            discount_rate = None
+        case 2:
+            discount_type = discount_type_options[1]
+            discount_amount = None
+            discount_rate = validate_float(
+                "Enter discount rate (2 decimal float): ")
+        case _:
+            print(color_error_message("Invalid option."))
+            return repeat_or_return("Try again? [Y/N]: ")
+    discount_policies = input("Enter discount policies: ")
+
+    discount_policy = [discount_name, discount_type, f'{discount_amount:.2f}' if discount_amount is not None else "", f'{discount_rate:.2f}' if discount_rate is not None else "", discount_policies]
+    
+    clear_terminal()
+    for i in range(len(DISCOUNT_CONFIRMATION_KEYS)):
+        print(f'{color_confirmation_message(DISCOUNT_CONFIRMATION_KEYS[i])}: {discount_policy[i] if discount_policy[i] != "" else "N/A"}')
+    
+    confirmed = validate_yes_no("Confirm and add discount policy? [Y/N]: ") == "Y"
+    if confirmed:
+        discount_id_no = id_counter("discount")
+        discount_id = f'D{discount_id_no:02}'
+        discount_policy.insert(0, discount_id)
+        add_entry("Cinema/Database/discount_policies.txt", discount_policy)
+        notification = f'SUCCESS: Discount {discount_id} for {discount_name} added.'
+        print("-" * len(notification))
+        print(color_completion_message(notification))
+        print("\n")
+        return repeat_or_return("Add another discount policy? [Y/N]: ")
+    else:
+        return repeat_or_return("Try again? [Y/N]: ")
+
+
+@io_action
+@timed
+def update_discount():
+    """
+    Updates a specific field in an existing discount policy entry.
+
+    Prompts the user for a discount ID, validates its existence, displays editable fields, and allows selection of one field to update.
+
+    Returns:
+        int: AGAIN to run the action again, or MENU to return to the menu.
+    """
+    discount_id = input("Enter ID of discount to be edited: ").upper().strip()
+    discount_policy = lookup_entry(
+        "Cinema/Database/discount_policies.txt", entry_id=discount_id)
+    if not discount_policy:
+        print(color_error_message("Invalid input: this discount ID does not exist."))
+        return repeat_or_return("Try again [Y/N]: ")
+
+    details = lookup_entry(
+        "Cinema/Database/discount_policies.txt", header=1)
+    for index, field in enumerate(details[1:], start=1):
+        print(f'[{index}] {field}')
+
+    detail_selection = validate_int("Select detail (enter number 1-5): ")
+
+    match detail_selection:
+        case 1:
+            while True:
+                update_details = input("Enter discount name: ")
+                if update_details:
+                    break
+                print(color_error_message(
+                    "Invalid input: discount policy must have discount name."))
+        case 2:
+            if discount_policy[2] == "fixed":
+                discount_type = "percentage"
+                discount_amount = None
+                discount_rate = validate_float("Enter updated discount rate (2 decimal float): ")
+            elif discount_policy[2] == "percentage":
+                discount_type = "fixed"
+                discount_amount = validate_float("Enter updated discount amount (2 decimal float): ")
+                discount_rate = None
+            else:
+                print(color_error_message("Error: current discount type is neither fixed nor percentage."))
+                return repeat_or_return("Try again? [Y/N]: ")
+            update_details = [discount_type, f'{discount_amount:.2f}' if discount_amount is not None else "", f'{discount_rate:.2f}' if discount_rate is not None else ""]
+        case 3:
+            if discount_policy[2] != "fixed":
+                print(color_error_message("Invalid option: discount amount cannot be edited for percentage discounts."))
+                return repeat_or_return("Try again? [Y/N]: ")
+            else:
+                update_details = validate_float("Enter updated discount amount (2 decimal float): ")
+                update_details = f'{update_details:.2f}'
+        case 4:
+            if discount_policy[2] != "percentage":
+                print(color_error_message("Invalid option: discount rate cannot be edited for fixed discounts."))
+                return repeat_or_return("Try again? [Y/N]: ")
+            else:
+                update_details = validate_float("Enter updated discount rate (2 decimal float): ")
+                update_details = f'{update_details:.2f}'
+        case 5:
+            update_details = input("Enter updated discount policies: ")
+        case _:
+            print(color_error_message("Invalid option."))
+            return repeat_or_return("Try again? [Y/N]: ")
+      
+    clear_terminal()      
+    match detail_selection:
+        case 2:
+            print(f'{color_confirmation_message(DISCOUNT_CONFIRMATION_KEYS[1])}: {update_details[0]}')
+            print(f'{color_confirmation_message(DISCOUNT_CONFIRMATION_KEYS[2])}: {update_details[1] if update_details[1] != "" else "N/A"}')
+            print(f'{color_confirmation_message(DISCOUNT_CONFIRMATION_KEYS[3])}: {update_details[2] if update_details[2] != "" else "N/A"}')
+        case _:
+            print(f'{color_confirmation_message(DISCOUNT_CONFIRMATION_KEYS[detail_selection - 1])}: {update_details}')
+
+    confirmed = validate_yes_no("Confirm and update discount policy? [Y/N]: ") == "Y"
+    if confirmed:
+        match detail_selection:
+            case 2:
+                update_entry("Cinema/Database/discount_policies.txt",
+                            discount_id, 2, update_details[0])
+                update_entry("Cinema/Database/discount_policies.txt",
+                            discount_id, 3, update_details[1])
+                update_entry("Cinema/Database/discount_policies.txt",
+                            discount_id, 4, update_details[2])
+            case _:
+                update_entry("Cinema/Database/discount_policies.txt",
+                        discount_id, detail_selection, update_details)
+            
+        try:
+            with open("Cinema/Database/movie_showtimes.txt", "r") as f:
+                for line in f:
+                    showtime = [i.strip() for i in line.split(",")]
+                    if len(showtime) == 9:
+                        if showtime[8] == discount_id:
+                            normal_price = showtime[6]
+                            discounted_price = calculate_discount(discount_id, normal_price)
+                            update_entry("Cinema/Database/movie_showtimes.txt", showtime[0], 7, discounted_price)
+        except FileNotFoundError:
+            print(color_error_message(f'Error: "Cinema/Database/movie_showtimes.txt" file not found.'))
+        
+        notification = f'SUCCESS: Discount {discount_id} for {lookup_entry("Cinema/Database/discount_policies.txt", entry_id=discount_id)[1]} updated.'
+        print("-" * len(notification))
+        print(color_completion_message(notification))
+        print("\n")
+        return repeat_or_return("Update another discount policy? [Y/N]: ")
+    else:
+        return repeat_or_return("Try again? [Y/N]: ")
+
+
+@io_action
+@timed
+def remove_discount():
+    """
+    Removes a specific discount policy entry.
+
+    Prompts the user for a discount ID, validates its existence, then deletes corresponding movie listing.
+
+    Returns:
+        int: AGAIN to run the action again, or MENU to return to the menu.
+    """
+    discount_id = input("Enter ID of discount to be removed: ").upper().strip()
+    discount_policy = lookup_entry("Cinema/Database/discount_policies.txt", entry_id=discount_id)
+    if not discount_policy:
+        print(color_error_message("Invalid input: this discount ID does not exist."))
+        return repeat_or_return("Try again? [Y/N]: ")
+    remove_entry("Cinema/Database/discount_policies.txt", discount_id)
+    notification = f'SUCCESS: Discount {discount_id} for {discount_policy[1]} removed.'
+    print("-" * len(notification))
+    print(color_completion_message(notification))
+    print("\n")
+    return repeat_or_return("Remove another discount policy? [Y/N]: ")
+
+
+@io_action
+@timed
+def view_auditorium():
+    """
+    Displays all auditoriums.
+
+    Returns:
+        int: AGAIN to run the action again, or MENU to return to the menu.
+    """
+    view_all_entries("Cinema/Database/auditorium_info.txt")
+    while True:
+        done = input("Press ENTER to return to cinema manager menu...")
+        if done == "":
+            return MENU
+
+
+@io_action
+@timed
+def update_price():
+    """
+    Updates the default normal price field in an existing auditorium info entry.
+
+    Prompts the user for an auditorium ID, validates its existence, and updates price field.
+
+    Returns:
+        int: AGAIN to run the action again, or MENU to return to the menu.
+    """
+    for index, field in enumerate(AUDITORIUM_OPTIONS, start=1):
+        print(f'[{index}] {field}', end="   ")
+    print()
+    while True:
+        auditorium_selection = validate_int("Select auditorium (enter number 1-8): ")
+        if (1 <= auditorium_selection <= 8):
+            auditorium_id = AUDITORIUM_OPTIONS[auditorium_selection - 1]
+            break
+        print(color_error_message("Invalid option: please enter a number 1-8."))
+    print("\n")
+    update_details = validate_float("Enter updated price (2 decimal float): ")
+    
+    clear_terminal()
+    print(f'{color_confirmation_message("Auditorium ID")}: {auditorium_id}')
+    print(f'{color_confirmation_message("Updated Price")}: {update_details:.2f}')
+    
+    confirmed = validate_yes_no("Confirm and update price? [Y/N]: ") == "Y"
+    if confirmed:
+        update_entry("Cinema/Database/auditorium_info.txt", auditorium_id, 5, f'{update_details:.2f}')
+        notification = f'SUCCESS: Price for auditorium {auditorium_id} updated.'
+        print("-" * len(notification))
+        print(color_completion_message(notification))
+        print("\n")
+        return repeat_or_return("Update another price? [Y/N]: ")
+    else:
+        return repeat_or_return("Try again? [Y/N]: ")
+
+
+@io_action
+@timed
+def view_booking_reports():
+    """
+    Displays booking entries, optionally filtered by movie ID.
+
+    Returns:
+        int: AGAIN to run the action again, or MENU to return to the menu.
+    """
+    specific_movie = validate_yes_no("View the report for a specific movie? [Y/N] ") == "Y"
+    clear_terminal()
+    movie_id = input("Enter movie ID: ").upper().strip() if specific_movie else None
+    try:
+        header, booking_info = booking_report("Cinema/Database/movie_bookings.txt", "Cinema/Database/movie_showtimes.txt", "Cinema/Database/movie_listings.txt", movie_id)
+    except FileNotFoundError as e:
+        print(color_error_message(f'Error: "{e.filename}" file not found.'))
+        header, booking_info = [], []
+
+    header = ", ".join(header)
+    booking_info = [", ".join(item) for item in booking_info]
+    print(header)
+    print("-" * len(header))
+    if not booking_info:
+        print("No entries found.")
+    else:
+        for line in booking_info:
+            print(line)
+        print("\n")
+
+    while True:
+        done = input("Press ENTER to return to cinema manager menu...")
+        if done == "":
+            return MENU
+
+
+@io_action
+@timed
+def view_revenue_summary():
+    """
+    Displays total revenue from movie bookings, read from the running revenue aggregates.
+
+    Returns:
+        int: AGAIN to run the action again, or MENU to return to the menu.
+    """
+    normal_total_revenue = 0
+    discounted_total_revenue = 0
+    try:
+        summary = booking_service.revenue()
+        normal_total_revenue, discounted_total_revenue = summary.normal_revenue, summary.discounted_revenue
+    except FileNotFoundError:
+        print(color_error_message(f'Error: "Cinema/Database/movie_bookings.txt" file not found.'))
+
+    total_revenue = normal_total_revenue + discounted_total_revenue
+    print(f'REVENUE FROM NORMAL TICKETS: {normal_total_revenue:.2f}')
+    print(f'REVENUE FROM DISCOUNTED TICKETS: {discounted_total_revenue:.2f}')
+    print(max(len(f'REVENUE FROM NORMAL TICKETS: {normal_total_revenue:.2f}'), len(f'REVENUE FROM DISCOUNTED TICKETS: {discounted_total_revenue:.2f}')) * "-")
+    print(f'TOTAL REVENUE: {total_revenue}')
+    print()
+    while True:
+        done = input("Press ENTER to return to cinema manager menu...")
+        if done == "":
+            return MENU
+
+
+@io_action
+@timed
+def rebuild_revenue_aggregates():
+    """
+    Recalculates the revenue aggregates from the bookings and reports any that had drifted.
+
+    Returns:
+        int: AGAIN to run the action again, or MENU to return to the menu.
+    """
+    try:
+        mismatches = rebuild_revenue_summary("Cinema/Database/movie_bookings.txt")
+    except FileNotFoundError:
+        print(color_error_message(f'Error: "Cinema/Database/movie_bookings.txt" file not found.'))
+        mismatches = None
+
+    if mismatches == []:
+        print("Revenue summary is consistent with the bookings.")
+    elif mismatches:
+        print("SCOPE, KEY, RUNNING (NORMAL|DISCOUNTED), REBUILT (NORMAL|DISCOUNTED)")
+        for scope, key, before, after in mismatches:
+            print(f'{scope}, {key}, {before[2]:.2f}|{before[3]:.2f}, {after[2]:.2f}|{after[3]:.2f}')
+        print(f'\n{len(mismatches)} aggregate(s) differed and have been rebuilt.')
+    print()
+    while True:
+        done = input("Press ENTER to return to cinema manager menu...")
+        if done == "":
+            return MENU
+
+
+@io_action
+@timed
+def view_performance_stats():
+    """
+    Displays the latency of every menu action and role used since the program started, slowest first.
+
+    Returns:
+        int: AGAIN to run the action again, or MENU to return to the menu.
+    """
+    rows = stats_rows()
+    if not rows:
+        print("No actions have been timed yet.")
+    else:
+        width = max(len("OPERATION"), max(len(row[0]) for row in rows))
+        print(f'{"OPERATION":{width}}{"CALLS":>8}{"MEAN MS":>10}{"P50 MS":>10}{"P90 MS":>10}{"P99 MS":>10}{"MAX MS":>10}')
+        for name, calls, mean, p50, p90, p99, maximum in rows:
+            print(f'{name:{width}}{calls:>8}{mean:>10.2f}{p50:>10.2f}{p90:>10.2f}{p99:>10.2f}{maximum:>10.2f}')
+        print(f'\nCalls taking at least {slow_threshold() * 1000:g} ms are logged to {slow_log_file()}.')
+    print()
+    while True:
+        done = input("Press ENTER to return to cinema manager menu...")
+        if done == "":
+            return MENU
+
+
+def repeat_or_return(prompt):
+    """
+    Asks whether to run the current action again.
+
+    Args:
+        prompt (str): The yes/no question to ask.
+
+    Returns:
+        int: AGAIN if the user answered Y, otherwise MENU.
+    """
+    return AGAIN if validate_yes_no(prompt) == "Y" else MENU
+
+
+def run_action(action):
+    """
+    Runs a menu action, repeating it for as long as it returns AGAIN.
+
+    Args:
+        action (callable): The action to be run.
+
+    Returns:
+        None
+    """
+    while action() == AGAIN:
+        clear_terminal()
+
+
+def main_cinema_manager():
+    """
+    Displays the cinema manager menu and executes selected actions until the user exits the role.
+
+    Prompts the user to select an action, confirms intent, and executes the corresponding function. 
+
+    Returns:
+        None
+    """
+    actions = ["View movie listings", "Add movie listing", "Update movie listing", "Remove movie listing", "View showtimes", "Add showtime", "Update showtime", "Remove showtime", "View discounts",
+               "Add discount", "Update discount", "Remove discount", "View auditoriums", "Update normal price", "View booking report", "View revenue summary",
+               "Rebuild revenue summary", "Performance stats", "Exit cinema manager role"]
+
+    action_functions = {
+        1: view_movie_listing,
+        2: add_movie_listing,
+        3: update_movie_listing,
+        4: remove_movie_listing,
+        5: view_showtime,
+        6: add_showtime,
+        7: update_showtime,
+        8: remove_showtime,
+        9: view_discount,
+        10: add_discount,
+        11: update_discount,
+        12: remove_discount,
+        13: view_auditorium,
+        14: update_price,
+        15: view_booking_reports,
+        16: view_revenue_summary,
+        17: rebuild_revenue_aggregates,
+        18: view_performance_stats,
+        19: None
+    }
+
+    while True:
+        clear_terminal()
+        print("==== CINEMA MANAGER MENU ====\n\nAvailable actions:\n-----------------------------")
+        for index, action in enumerate(actions, start=1):
+            print(f'[{index}] {action}')
+        print("-----------------------------")
+
+        while True:
+            action_choice = validate_int("Select action (enter number 1-19): ")
+            if action_choice in action_functions:
+                break
+            print(color_error_message("Invalid input: please enter a number 1-19."))
+        confirmed = validate_yes_no(
+            f'Confirm action: {actions[action_choice - 1].lower()}? [Y/N]: ') == "Y"
+        if not confirmed:
+            continue
+        if action_functions[action_choice] is None:
+            clear_terminal()
+            return
+        clear_terminal()
+        run_action(action_functions[action_choice])
@@ -0,0 +1,185 @@
+#------------------------- SCHEDULE --------------------------------------------------
+# Interval index over movie_showtimes.txt for auditorium conflict checks.
+#
+# Times are minutes since midnight. Each showtime becomes the interval
+#   [start - BUFFER_MINUTES, end + BUFFER_MINUTES]
+# so the cleaning buffer between showtimes is part of the interval, and a showtime
+# ending before it starts is taken to run past midnight. The intervals of every
+# (auditorium, date) pair are kept sorted by start; a new slot is checked with a
+# bisect plus a look at the few intervals that can reach it, instead of re-reading
+# and re-parsing the whole showtime file. The index lives on the cached showtime
+# table and is updated in place as showtimes are added, updated or removed
+# (including lines other processes append); it is rebuilt only when the table is
+# read again in full.
+from bisect import bisect_left, bisect_right, insort
+
+from storage import Table, load_table
+
+BUFFER_MINUTES = 15
+MINUTES_PER_DAY = 24 * 60
+
+
+def to_minutes(hhmm):
+    """
+    Converts an HHMM time to minutes since midnight.
+
+    Args:
+        hhmm (str): Time such as "0930".
+
+    Returns:
+        int or None: Minutes since midnight, or None if the time is malformed.
+    """
+    if len(hhmm) != 4 or not hhmm.isdigit():
+        return None
+    hours, minutes = int(hhmm[:2]), int(hhmm[2:])
+    if hours > 23 or minutes > 59:
+        return None
+    return hours * 60 + minutes
+
+
+class ShowtimeSlots:
+    """
+    Buffered showtime intervals, sorted by start, for every (auditorium, date) pair.
+
+    Attributes:
+        slots (dict): Maps (auditorium ID, date) to a sorted list of (start, end, showtime ID).
+        longest (dict): Maps (auditorium ID, date) to the length of its longest interval.
+    """
+
+    def __init__(self):
+        self.slots = {}
+        self.longest = {}
+
+    def add(self, showtime_id, auditorium_id, date, start_time, end_time):
+        """
+        Adds a showtime to the index. Showtimes with malformed times are ignored.
+
+        Args:
+            showtime_id (str): ID of the showtime.
+            auditorium_id (str): ID of the auditorium.
+            date (str): Date as DD-MM-YYYY.
+            start_time (str): Start time as HHMM.
+            end_time (str): End time as HHMM.
+
+        Returns:
+            None
+        """
+        start, end = to_minutes(start_time), to_minutes(end_time)
+        if start is None or end is None:
+            return
+        if end < start:
+            end += MINUTES_PER_DAY
+        key = (auditorium_id, date)
+        interval = (start - BUFFER_MINUTES, end + BUFFER_MINUTES, showtime_id)
+        insort(self.slots.setdefault(key, []), interval)
+        self.longest[key] = max(self.longest.get(key, 0), interval[1] - interval[0])
+
+    def remove(self, showtime_id, auditorium_id, date, start_time, end_time):
+        """
+        Removes a showtime from the index, if it is there.
+
+        The longest interval of its (auditorium, date) pair is left as is; it only bounds how far back conflicts looks.
+
+        Args:
+            showtime_id (str): ID of the showtime.
+            auditorium_id (str): ID of the auditorium.
+            date (str): Date as DD-MM-YYYY.
+            start_time (str): Start time as HHMM.
+            end_time (str): End time as HHMM.
+
+        Returns:
+            None
+        """
+        start, end = to_minutes(start_time), to_minutes(end_time)
+        if start is None or end is None:
+            return
+        if end < start:
+            end += MINUTES_PER_DAY
+        key = (auditorium_id, date)
+        intervals = self.slots.get(key, [])
+        interval = (start - BUFFER_MINUTES, end + BUFFER_MINUTES, showtime_id)
+        position = bisect_left(intervals, interval)
+        if position < len(intervals) and intervals[position] == interval:
+            del intervals[position]
+            if not intervals:
+                del self.slots[key]
+                del self.longest[key]
+
+    def conflicts(self, auditorium_id, date, start, end, ignore=None):
+        """
+        Finds the showtimes in an auditorium that clash with a slot, buffer included.
+
+        Args:
+            auditorium_id (str): ID of the auditorium.
+            date (str): Date as DD-MM-YYYY.
+            start (int): Start of the slot in minutes since midnight.
+            end (int): End of the slot in minutes since midnight; may exceed a day.
+            ignore (str, optional): Showtime ID to leave out, such as the one being rescheduled. Defaults to None.
+
+        Returns:
+            list: IDs of the clashing showtimes.
+        """
+        key = (auditorium_id, date)
+        intervals = self.slots.get(key)
+        if not intervals:
+            return []
+        # Only intervals starting in [start - longest, end] can overlap the slot.
+        first = bisect_right(intervals, (start - self.longest[key],))
+        last = bisect_right(intervals, (end, MINUTES_PER_DAY * 3))
+        return [showtime_id for (slot_start, slot_end, showtime_id) in intervals[first:last]
+                if slot_end >= start and showtime_id != ignore]
+
+    def available(self, auditorium_ids, date, start, end, ignore=None):
+        """
+        Filters auditoriums down to those free for a slot.
+
+        Args:
+            auditorium_ids (list): Auditorium IDs to check, in display order.
+            date (str): Date as DD-MM-YYYY.
+            start (int): Start of the slot in minutes since midnight.
+            end (int): End of the slot in minutes since midnight; may exceed a day.
+            ignore (str, optional): Showtime ID to leave out. Defaults to None.
+
+        Returns:
+            list: The auditorium IDs without a clash, in the given order.
+        """
+        return [auditorium_id for auditorium_id in auditorium_ids if not self.conflicts(auditorium_id, date, start, end, ignore)]
+
+
+class ShowtimeTable(Table):
+    """
+    Showtime table that keeps its interval index up to date as showtimes are added, updated and removed.
+
+    Attributes:
+        slots (ShowtimeSlots): Interval index of the showtimes in the table.
+    """
+
+    def __init__(self, filename):
+        super().__init__(filename)
+        self.slots = ShowtimeSlots()
+        for record in self.rows():
+            self.added(record)
+
+    def added(self, record):
+        if len(record) >= 6:
+            self.slots.add(record[0], record[2], record[3], record[4], record[5])
+
+    def removed(self, record):
+        if len(record) >= 6:
+            self.slots.remove(record[0], record[2], record[3], record[4], record[5])
+
+
+def load_showtime_slots(filename):
+    """
+    Retrieves the interval index of a showtime file, built once and then kept up to date.
+
+    Args:
+        filename (str): Path to movie_showtimes.txt.
+
+    Returns:
+        ShowtimeSlots: The index; shared, must not be modified.
+
+    Raises:
+        FileNotFoundError: If the showtime file does not exist.
+    """
+    return load_table(filename, ShowtimeTable).slots
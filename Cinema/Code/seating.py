@@ -0,0 +1,156 @@
+#------------------------- SEATING --------------------------------------------------
+# Bitmask seat model built from the auditorium geometry in auditorium_info.txt.
+#
+# Seat IDs are a row letter followed by a column number (A01, B12, ...). Every
+# seat maps to one bit: row A starts at bit 0, row B at bit ROW_STRIDE, and so on,
+# with column 1 as the lowest bit of its row. A set of seats is then a single int,
+# so validity, conflict and "seats left" checks are bit operations.
+from storage import load_parsed
+
+ROW_STRIDE = 64
+ROW_LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def seat_bit(seat_id):
+    """
+    Converts a seat ID to its bit position.
+
+    Args:
+        seat_id (str): Seat ID such as "A01" (leading zeros are optional).
+
+    Returns:
+        int or None: Bit position of the seat, or None if the seat ID is malformed.
+    """
+    seat_id = seat_id.strip().upper()
+    if len(seat_id) < 2 or seat_id[0] not in ROW_LETTERS or not seat_id[1:].isdigit():
+        return None
+    column = int(seat_id[1:])
+    if not 1 <= column <= ROW_STRIDE:
+        return None
+    return ROW_LETTERS.index(seat_id[0]) * ROW_STRIDE + column - 1
+
+
+def seat_mask(seat_ids):
+    """
+    Converts seat IDs to a bitmask, skipping malformed seat IDs.
+
+    Args:
+        seat_ids (list): Seat IDs.
+
+    Returns:
+        int: Bitmask with one bit set per seat.
+    """
+    mask = 0
+    for seat_id in seat_ids:
+        bit = seat_bit(seat_id)
+        if bit is not None:
+            mask |= 1 << bit
+    return mask
+
+
+def is_seat_set(mask, seat_id):
+    """
+    Checks whether a seat's bit is set in a bitmask.
+
+    Args:
+        mask (int): Seat bitmask.
+        seat_id (str): Seat ID.
+
+    Returns:
+        bool: True if the seat is in the mask.
+    """
+    bit = seat_bit(seat_id)
+    return bit is not None and bool(mask >> bit & 1)
+
+
+def format_seat(row, column):
+    """
+    Formats a row index and column number as a seat ID.
+
+    Args:
+        row (int): Zero-based row index.
+        column (int): One-based column number.
+
+    Returns:
+        str: Seat ID such as "A01".
+    """
+    return f'{ROW_LETTERS[row]}{column:02}'
+
+
+class SeatLayout:
+    """
+    Seat geometry of one auditorium.
+
+    Attributes:
+        auditorium_id (str): ID of the auditorium.
+        rows (int): Number of seat rows.
+        columns (int): Number of seats per row.
+        valid_mask (int): Bitmask of every seat in the auditorium.
+    """
+
+    def __init__(self, auditorium_id, rows, columns):
+        self.auditorium_id = auditorium_id
+        self.rows = min(rows, len(ROW_LETTERS))
+        self.columns = min(columns, ROW_STRIDE)
+        row_mask = (1 << self.columns) - 1
+        self.valid_mask = 0
+        for row in range(self.rows):
+            self.valid_mask |= row_mask << (row * ROW_STRIDE)
+
+    def is_valid(self, seat_id):
+        """
+        Checks whether a seat exists in this auditorium.
+
+        Args:
+            seat_id (str): Seat ID.
+
+        Returns:
+            bool: True if the seat exists.
+        """
+        return is_seat_set(self.valid_mask, seat_id)
+
+    def capacity(self):
+        """
+        Counts the seats in this auditorium.
+
+        Returns:
+            int: Number of seats.
+        """
+        return self.valid_mask.bit_count()
+
+    def seats_left(self, taken_mask):
+        """
+        Counts the seats that are not yet taken.
+
+        Args:
+            taken_mask (int): Bitmask of taken seats.
+
+        Returns:
+            int: Number of available seats.
+        """
+        return (self.valid_mask & ~taken_mask).bit_count()
+
+
+def load_seat_layouts(filename):
+    """
+    Retrieves the seat layout of every auditorium, built from the auditorium info file when it changes.
+
+    Args:
+        filename (str): Path to auditorium_info.txt.
+
+    Returns:
+        dict: Maps auditorium ID to SeatLayout. Empty if the file does not exist. Shared; must not be modified.
+    """
+    try:
+        return load_parsed(filename, _parse_layouts)
+    except FileNotFoundError:
+        return {}
+
+
+def _parse_layouts(table):
+    layouts = {}
+    for record in table.rows():
+        if len(record) < 5 or not record[3].isdigit() or not record[4].isdigit():
+            continue
+        layouts[record[0]] = SeatLayout(record[0], int(record[3]), int(record[4]))
+    return layouts
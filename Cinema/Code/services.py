@@ -0,0 +1,709 @@
+#------------------------- SERVICES --------------------------------------------------
+# Headless booking, cancelling, scheduling and revenue operations behind the role menus.
+#
+# Nothing here reads input or prints. Every operation checks its arguments against
+# the in-memory tables, returns a result object and raises a ServiceError subclass
+# saying what was wrong, so the menus only collect answers and format results, and
+# the same code paths can be scripted, served or benchmarked at machine speed.
+#
+# Operations that write come in two steps, mirroring the menus' confirm prompts:
+# quote/plan check everything and work out prices without writing, book/add check
+# again and save. Between the two, a terminal can hold its seats (see holds.py) so
+# other terminals see them as taken. book and cancel run under a file lock on the
+# bookings file, so the final seat check and the append cannot interleave with
+# another process's; reads take no lock.
+import os
+import socket
+import time
+from datetime import datetime, timedelta
+
+from storage import load_table, append_row, lint_item
+from bookings import load_bookings, seats_taken, add_booking, cancel_booking_entry, split_seats, revenue_summary
+from holds import HOLD_SECONDS, held_seats, place_hold, release_hold
+from locking import file_lock
+from ids import counter_file, next_id, id_block
+from revenue import to_cents, format_cents, ticket_counts
+from seating import seat_mask, is_seat_set, load_seat_layouts
+from schedule import to_minutes, load_showtime_slots, MINUTES_PER_DAY
+from maintenance import load_maintenance_windows
+
+DATABASE_DIR = "Cinema/Database"
+DATE_FORMAT = "%d-%m-%Y"
+ID_BLOCK_SIZE = 10
+
+
+class ServiceError(Exception):
+    """Base class of the errors raised by the services; the message is meant for the user."""
+
+
+class NotFoundError(ServiceError):
+    """A movie, showtime, auditorium, discount or booking ID does not exist."""
+
+
+class InvalidRequestError(ServiceError):
+    """The arguments of an operation are malformed or inconsistent."""
+
+
+class InvalidSeatError(InvalidRequestError):
+    """
+    Some seats do not exist in the auditorium or were given twice.
+
+    Attributes:
+        seats (list): The offending seat IDs.
+    """
+
+    def __init__(self, message, seats):
+        super().__init__(message)
+        self.seats = seats
+
+
+class SeatTakenError(ServiceError):
+    """
+    Some seats are already booked for the showtime.
+
+    Attributes:
+        seats (list): The seat IDs already booked.
+    """
+
+    def __init__(self, message, seats):
+        super().__init__(message)
+        self.seats = seats
+
+
+class SeatHeldError(SeatTakenError):
+    """
+    Some seats are held by another terminal that is still booking them.
+
+    Attributes:
+        seats (list): The seat IDs held.
+    """
+
+
+class SlotTakenError(ServiceError):
+    """The auditorium is booked or under maintenance for the time slot."""
+
+
+class NotOwnerError(ServiceError):
+    """The booking belongs to another customer."""
+
+
+class Quote:
+    """
+    Priced, checked booking request that has not been saved yet.
+
+    Attributes:
+        showtime_id (str): ID of the showtime.
+        movie_id (str): ID of the showtime's movie.
+        auditorium_id (str): ID of the showtime's auditorium.
+        date (str): Date of the showtime as DD-MM-YYYY.
+        start_time (str): Start time of the showtime as HHMM.
+        seats (list): Seat IDs requested.
+        normal (int): Number of normal tickets.
+        discounted (int): Number of discounted tickets.
+        normal_cents (int): Price of a normal ticket in cents.
+        discounted_cents (int): Price of a discounted ticket in cents; 0 if the showtime has no discount.
+    """
+
+    def __init__(self, showtime, seats, normal, discounted):
+        self.showtime_id, self.movie_id, self.auditorium_id, self.date, self.start_time = showtime[:5]
+        self.seats = seats
+        self.normal = normal
+        self.discounted = discounted
+        self.normal_cents = to_cents(showtime[6])
+        self.discounted_cents = to_cents(showtime[7])
+
+    def total_cents(self):
+        return self.normal * self.normal_cents + self.discounted * self.discounted_cents
+
+    def normal_price(self):
+        return format_cents(self.normal_cents)
+
+    def discounted_price(self):
+        return format_cents(self.discounted_cents)
+
+    def total_price(self):
+        return format_cents(self.total_cents())
+
+
+class Hold:
+    """
+    Seats held for a terminal while it completes a booking.
+
+    Attributes:
+        showtime_id (str): ID of the showtime.
+        holder (str): Terminal holding the seats.
+        seats (list): Seat IDs held.
+        expires_at (float): Unix time the hold lapses.
+    """
+
+    def __init__(self, showtime_id, holder, seats, expires_at):
+        self.showtime_id = showtime_id
+        self.holder = holder
+        self.seats = seats
+        self.expires_at = expires_at
+
+
+class Booking:
+    """
+    Saved booking.
+
+    Attributes:
+        booking_id (str): ID of the booking.
+        showtime_id (str): ID of the booked showtime.
+        customer_id (str): ID of the customer.
+        seats (list): Seat IDs booked.
+        normal (int): Number of normal tickets.
+        discounted (int): Number of discounted tickets.
+    """
+
+    def __init__(self, booking_id, showtime_id, customer_id, seats, normal, discounted):
+        self.booking_id = booking_id
+        self.showtime_id = showtime_id
+        self.customer_id = customer_id
+        self.seats = seats
+        self.normal = normal
+        self.discounted = discounted
+
+    @classmethod
+    def from_record(cls, record):
+        """
+        Builds a booking from the fields of a movie_bookings.txt row.
+
+        Args:
+            record (list): Fields of the row.
+
+        Returns:
+            Booking: The booking.
+        """
+        record = list(record) + [""] * (5 - len(record))
+        normal, discounted = ticket_counts(record[4])
+        return cls(record[0], record[1], record[2], split_seats(record[3]), normal, discounted)
+
+    def seats_text(self):
+        return "|".join(self.seats)
+
+    def tickets_text(self):
+        return f'{self.normal}|{self.discounted}'
+
+
+class Showtime:
+    """
+    Showtime, saved or planned.
+
+    Attributes:
+        showtime_id (str): ID of the showtime, or None if it has not been saved yet.
+        movie_id (str): ID of the movie.
+        auditorium_id (str): ID of the auditorium.
+        date (str): Date as DD-MM-YYYY.
+        start_time (str): Start time as HHMM.
+        end_time (str): End time as HHMM, rounded up to 5 minutes.
+        normal_price (str): Price of a normal ticket, such as "24.00".
+        discounted_price (str): Price of a discounted ticket, or "" if there is no discount.
+        discount_id (str): ID of the discount policy, or "" if there is no discount.
+    """
+
+    def __init__(self, showtime_id, movie_id, auditorium_id, date, start_time, end_time, normal_price, discounted_price="", discount_id=""):
+        self.showtime_id = showtime_id
+        self.movie_id = movie_id
+        self.auditorium_id = auditorium_id
+        self.date = date
+        self.start_time = start_time
+        self.end_time = end_time
+        self.normal_price = normal_price
+        self.discounted_price = discounted_price
+        self.discount_id = discount_id
+
+    def fields(self):
+        """
+        Lists the fields in movie_showtimes.txt order, without the showtime ID.
+
+        Returns:
+            list: The fields.
+        """
+        return [self.movie_id, self.auditorium_id, self.date, self.start_time, self.end_time, self.normal_price, self.discounted_price, self.discount_id]
+
+
+class RevenueSummary:
+    """
+    Revenue totals over the live bookings.
+
+    Attributes:
+        normal_tickets (int): Normal tickets sold.
+        discounted_tickets (int): Discounted tickets sold.
+        normal_revenue (float): Revenue from normal tickets.
+        discounted_revenue (float): Revenue from discounted tickets.
+    """
+
+    def __init__(self, normal_tickets, discounted_tickets, normal_revenue, discounted_revenue):
+        self.normal_tickets = normal_tickets
+        self.discounted_tickets = discounted_tickets
+        self.normal_revenue = normal_revenue
+        self.discounted_revenue = discounted_revenue
+
+    def total_revenue(self):
+        return self.normal_revenue + self.discounted_revenue
+
+
+def default_holder():
+    """
+    Names the current terminal for seat holds.
+
+    Returns:
+        str: Host name and process ID, such as "kiosk2-4711".
+    """
+    return f'{socket.gethostname()}-{os.getpid()}'
+
+
+def _lookup(filename, entry_id, what):
+    record = load_table(filename).get(entry_id)
+    if record is None:
+        raise NotFoundError(f'{what} {entry_id} does not exist.')
+    return record
+
+
+class BookingService:
+    """
+    Books, cancels and lists tickets and reports revenue.
+
+    Attributes:
+        bookings_file (str): Path to movie_bookings.txt.
+        showtimes_file (str): Path to movie_showtimes.txt.
+        auditoriums_file (str): Path to auditorium_info.txt.
+        holds_file (str): Path to seat_holds.txt.
+        counter_file (str): Path to the booking ID counter file.
+        holder (str): Terminal name used for seat holds when a method is not given one.
+    """
+
+    def __init__(self, database_dir=DATABASE_DIR, holder=None):
+        self.bookings_file = os.path.join(database_dir, "movie_bookings.txt")
+        self.showtimes_file = os.path.join(database_dir, "movie_showtimes.txt")
+        self.auditoriums_file = os.path.join(database_dir, "auditorium_info.txt")
+        self.holds_file = os.path.join(database_dir, "seat_holds.txt")
+        self.counter_file = counter_file(database_dir, "booking")
+        self.holder = holder or default_holder()
+
+    def showtime(self, showtime_id):
+        """
+        Retrieves a showtime.
+
+        Args:
+            showtime_id (str): ID of the showtime.
+
+        Returns:
+            list: Fields of the showtime.
+
+        Raises:
+            NotFoundError: If the showtime does not exist.
+            FileNotFoundError: If the showtimes file does not exist.
+        """
+        return _lookup(self.showtimes_file, showtime_id, "Showtime")
+
+    def taken_seats(self, showtime_id, holder=None):
+        """
+        Retrieves the seats already booked for a showtime or held by other terminals.
+
+        Args:
+            showtime_id (str): ID of the showtime.
+            holder (str, optional): Terminal whose own hold counts as free. Defaults to self.holder.
+
+        Returns:
+            int: Bitmask of booked and held seats.
+        """
+        return seats_taken(self.bookings_file, showtime_id) | held_seats(self.holds_file, showtime_id, holder or self.holder)
+
+    def check_seats(self, showtime_id, seats, holder=None):
+        """
+        Checks that seats exist in a showtime's auditorium and are neither booked nor held by another terminal.
+
+        Args:
+            showtime_id (str): ID of the showtime.
+            seats (list): Seat IDs requested.
+            holder (str, optional): Terminal whose own hold counts as free. Defaults to self.holder.
+
+        Returns:
+            list: The seat IDs, stripped of surrounding whitespace.
+
+        Raises:
+            NotFoundError: If the showtime does not exist.
+            InvalidRequestError: If no seats were given or the auditorium has no seating layout.
+            InvalidSeatError: If some seats do not exist or were given twice.
+            SeatTakenError: If some seats are already booked.
+            SeatHeldError: If some seats are held by another terminal.
+            FileNotFoundError: If the showtimes or auditorium file does not exist.
+        """
+        showtime = self.showtime(showtime_id)
+        seats = [seat.strip() for seat in seats if seat.strip() != ""]
+        if not seats:
+            raise InvalidRequestError("Enter at least one seat.")
+        layout = load_seat_layouts(self.auditoriums_file).get(showtime[2])
+        if layout is None:
+            raise InvalidRequestError(f'No seating layout found for {showtime[2]}.')
+        bad = [seat for seat in seats if not layout.is_valid(seat)]
+        if bad:
+            raise InvalidSeatError(f'These seats are not valid for {showtime[2]}: {", ".join(bad)}', bad)
+        if seat_mask(seats).bit_count() != len(seats):
+            raise InvalidSeatError("The same seat was entered more than once.", seats)
+        taken = seats_taken(self.bookings_file, showtime_id)
+        if seat_mask(seats) & taken:
+            clashing = [seat for seat in seats if is_seat_set(taken, seat)]
+            raise SeatTakenError(f'Already taken: {", ".join(clashing)}', clashing)
+        held = held_seats(self.holds_file, showtime_id, holder or self.holder)
+        if seat_mask(seats) & held:
+            clashing = [seat for seat in seats if is_seat_set(held, seat)]
+            raise SeatHeldError(f'Being booked at another terminal: {", ".join(clashing)}', clashing)
+        return seats
+
+    def hold(self, showtime_id, seats, holder=None, seconds=HOLD_SECONDS):
+        """
+        Checks seats and holds them for a terminal, replacing its earlier hold on the showtime.
+
+        Args:
+            showtime_id (str): ID of the showtime.
+            seats (list): Seat IDs to hold.
+            holder (str, optional): Terminal holding the seats. Defaults to self.holder.
+            seconds (float, optional): How long the hold lasts. Defaults to HOLD_SECONDS.
+
+        Returns:
+            Hold: The hold.
+
+        Raises:
+            NotFoundError, InvalidRequestError, InvalidSeatError, SeatTakenError, SeatHeldError: As for check_seats.
+            OSError: If the hold could not be saved.
+        """
+        holder = holder or self.holder
+        seats = self.check_seats(showtime_id, seats, holder)
+        expires_at = time.time() + seconds
+        clashing = place_hold(self.holds_file, showtime_id, holder, seats, expires_at)
+        if clashing:
+            raise SeatHeldError(f'Being booked at another terminal: {", ".join(clashing)}', clashing)
+        return Hold(showtime_id, holder, seats, expires_at)
+
+    def release(self, showtime_id, holder=None):
+        """
+        Releases a terminal's hold on a showtime, if it has one.
+
+        Args:
+            showtime_id (str): ID of the showtime.
+            holder (str, optional): Terminal holding the seats. Defaults to self.holder.
+
+        Returns:
+            None
+        """
+        release_hold(self.holds_file, showtime_id, holder or self.holder)
+
+    def quote(self, showtime_id, seats, normal, discounted=0, holder=None):
+        """
+        Checks a booking request and prices it without saving it.
+
+        Args:
+            showtime_id (str): ID of the showtime.
+            seats (list): Seat IDs requested.
+            normal (int): Number of normal tickets.
+            discounted (int, optional): Number of discounted tickets. Defaults to 0.
+            holder (str, optional): Terminal whose own hold counts as free. Defaults to self.holder.
+
+        Returns:
+            Quote: The priced request.
+
+        Raises:
+            NotFoundError: If the showtime does not exist.
+            InvalidRequestError: If the ticket counts are negative, do not match the seats, or include discounted tickets for a showtime without a discount.
+            InvalidSeatError: If some seats do not exist or were given twice.
+            SeatTakenError: If some seats are already booked.
+            SeatHeldError: If some seats are held by another terminal.
+            FileNotFoundError: If the showtimes or auditorium file does not exist.
+        """
+        seats = self.check_seats(showtime_id, seats, holder)
+        if normal < 0 or discounted < 0:
+            raise InvalidRequestError("Ticket counts cannot be negative.")
+        if normal + discounted != len(seats):
+            raise InvalidRequestError(f'{len(seats)} seats but {normal + discounted} tickets.')
+        quote = Quote(self.showtime(showtime_id), seats, normal, discounted)
+        if discounted and not quote.discounted_cents:
+            raise InvalidRequestError(f'Showtime {showtime_id} has no discounted tickets.')
+        return quote
+
+    def book(self, showtime_id, customer_id, seats, normal, discounted=0, holder=None):
+        """
+        Books seats for a customer and releases the terminal's hold on the showtime.
+
+        Args:
+            showtime_id (str): ID of the showtime.
+            customer_id (str): ID of the customer.
+            seats (list): Seat IDs to book.
+            normal (int): Number of normal tickets.
+            discounted (int, optional): Number of discounted tickets. Defaults to 0.
+            holder (str, optional): Terminal whose own hold counts as free. Defaults to self.holder.
+
+        Returns:
+            Booking: The saved booking.
+
+        Raises:
+            InvalidRequestError: If no customer ID is given, or as for quote.
+            NotFoundError, InvalidSeatError, SeatTakenError, SeatHeldError: As for quote.
+            OSError: If the booking could not be saved.
+        """
+        if not customer_id:
+            raise InvalidRequestError("Customer ID required.")
+        holder = holder or self.holder
+        with file_lock(self.bookings_file):
+            quote = self.quote(showtime_id, seats, normal, discounted, holder)
+            booking_id = next_id(self.counter_file, "B", 4, seed_file=self.bookings_file)
+            booking = Booking(booking_id, showtime_id, customer_id, quote.seats, normal, discounted)
+            add_booking(self.bookings_file, booking_id, showtime_id, customer_id, booking.seats, booking.tickets_text())
+        self.release(showtime_id, holder)
+        return booking
+
+    def get(self, booking_id):
+        """
+        Retrieves a live booking.
+
+        Args:
+            booking_id (str): ID of the booking.
+
+        Returns:
+            Booking: The booking.
+
+        Raises:
+            NotFoundError: If there is no live booking with that ID.
+            FileNotFoundError: If the bookings file does not exist.
+        """
+        record = load_bookings(self.bookings_file).get(booking_id)
+        if record is None:
+            raise NotFoundError(f'Booking {booking_id} does not exist.')
+        return Booking.from_record(record)
+
+    def bookings_for(self, customer_id):
+        """
+        Lists a customer's live bookings in booking order.
+
+        Args:
+            customer_id (str): ID of the customer.
+
+        Returns:
+            list: Booking objects.
+
+        Raises:
+            FileNotFoundError: If the bookings file does not exist.
+        """
+        return [Booking.from_record(record) for record in load_bookings(self.bookings_file).rows()
+                if len(record) >= 3 and record[2] == customer_id]
+
+    def cancel(self, booking_id, customer_id=None):
+        """
+        Cancels a booking and frees its seats.
+
+        Args:
+            booking_id (str): ID of the booking.
+            customer_id (str, optional): If given, the booking must belong to this customer. Defaults to None.
+
+        Returns:
+            Booking: The cancelled booking.
+
+        Raises:
+            NotFoundError: If there is no live booking with that ID.
+            NotOwnerError: If the booking belongs to another customer.
+            OSError: If the cancellation could not be saved.
+        """
+        with file_lock(self.bookings_file):
+            booking = self.get(booking_id)
+            if customer_id is not None and booking.customer_id != customer_id:
+                raise NotOwnerError(f'Booking {booking_id} does not belong to {customer_id}.')
+            cancel_booking_entry(self.bookings_file, booking_id)
+        return booking
+
+    def revenue(self):
+        """
+        Retrieves the revenue totals from the running revenue aggregates.
+
+        Returns:
+            RevenueSummary: The totals.
+
+        Raises:
+            FileNotFoundError: If the bookings file does not exist.
+        """
+        return RevenueSummary(*revenue_summary(self.bookings_file).get("total"))
+
+
+class ShowtimeService:
+    """
+    Plans and adds showtimes, checking auditorium bookings and maintenance.
+
+    Attributes:
+        database_dir (str): Directory holding the database files.
+        movies_file (str): Path to movie_listings.txt.
+        showtimes_file (str): Path to movie_showtimes.txt.
+        auditoriums_file (str): Path to auditorium_info.txt.
+        discounts_file (str): Path to discount_policies.txt.
+        issues_file (str): Path to technician_issues.txt.
+    """
+
+    def __init__(self, database_dir=DATABASE_DIR):
+        self.database_dir = database_dir
+        self.movies_file = os.path.join(database_dir, "movie_listings.txt")
+        self.showtimes_file = os.path.join(database_dir, "movie_showtimes.txt")
+        self.auditoriums_file = os.path.join(database_dir, "auditorium_info.txt")
+        self.discounts_file = os.path.join(database_dir, "discount_policies.txt")
+        self.issues_file = os.path.join(database_dir, "technician_issues.txt")
+
+    def movie(self, movie_id):
+        """
+        Retrieves a movie listing.
+
+        Args:
+            movie_id (str): ID of the movie.
+
+        Returns:
+            list: Fields of the movie listing.
+
+        Raises:
+            NotFoundError: If the movie does not exist.
+            FileNotFoundError: If the movie listings file does not exist.
+        """
+        return _lookup(self.movies_file, movie_id, "Movie")
+
+    def end_time(self, movie_id, start_time):
+        """
+        Calculates when a screening of a movie ends, rounded up to 5 minutes.
+
+        Args:
+            movie_id (str): ID of the movie.
+            start_time (str): Start time as HHMM.
+
+        Returns:
+            str: End time as HHMM; earlier than start_time if the screening runs past midnight.
+
+        Raises:
+            NotFoundError: If the movie does not exist.
+            InvalidRequestError: If the start time or the movie's running time is malformed.
+        """
+        start = to_minutes(start_time)
+        if start is None:
+            raise InvalidRequestError(f'Invalid start time {start_time}: use HHMM.')
+        running_time = self.movie(movie_id)[3]
+        if not running_time.isdigit():
+            raise InvalidRequestError(f'Movie {movie_id} has no valid running time.')
+        end = start + int(running_time)
+        end += (5 - end % 5) % 5
+        return f'{end % MINUTES_PER_DAY // 60:02}{end % 60:02}'
+
+    def free_auditoriums(self, date, start_time, end_time, auditorium_ids=None, ignore=None):
+        """
+        Determines the auditoriums with no showtime within BUFFER_MINUTES of a time slot and no repair still running when it ends.
+
+        A missing showtimes or issues file counts as having no showtimes or no repairs.
+
+        Args:
+            date (str): Date of the time slot as DD-MM-YYYY.
+            start_time (str): Start of the time slot as HHMM.
+            end_time (str): End of the time slot as HHMM; earlier than start_time if it runs past midnight.
+            auditorium_ids (list, optional): Auditorium IDs to check, in display order. Defaults to every auditorium in auditorium_info.txt.
+            ignore (str, optional): ID of a showtime to leave out, such as the one being rescheduled. Defaults to None.
+
+        Returns:
+            list: The IDs of the free auditoriums, in the given order.
+
+        Raises:
+            InvalidRequestError: If the date or times are malformed.
+        """
+        start, end = to_minutes(start_time), to_minutes(end_time)
+        if start is None or end is None:
+            raise InvalidRequestError("Invalid time: use HHMM.")
+        if end < start:
+            end += MINUTES_PER_DAY
+        try:
+            day = datetime.strptime(date, DATE_FORMAT)
+        except ValueError:
+            raise InvalidRequestError(f'Invalid date {date}: use DD-MM-YYYY.')
+        if auditorium_ids is None:
+            auditorium_ids = [record[0] for record in load_table(self.auditoriums_file).rows()]
+        try:
+            auditorium_ids = load_showtime_slots(self.showtimes_file).available(auditorium_ids, date, start, end, ignore)
+        except FileNotFoundError:
+            pass
+        try:
+            maintenance = load_maintenance_windows(self.issues_file)
+        except FileNotFoundError:
+            return auditorium_ids
+        slot_end = day + timedelta(minutes=end)
+        return [auditorium_id for auditorium_id in auditorium_ids if not maintenance.blocked(auditorium_id, slot_end)]
+
+    def discounted_price(self, discount_id, normal_price):
+        """
+        Calculates the discounted price based on a discount policy.
+
+        Args:
+            discount_id (str): ID of the discount policy.
+            normal_price (float): Original price before discount.
+
+        Returns:
+            str: The discounted price rounded to two decimal places, or "" if the policy type is unknown.
+
+        Raises:
+            NotFoundError: If the discount policy does not exist.
+        """
+        policy = _lookup(self.discounts_file, discount_id, "Discount")
+        discounted_price = None
+        if policy[2] == "fixed":
+            discounted_price = round((float(normal_price) - float(policy[3])), 2)
+        elif policy[2] == "percentage":
+            discounted_price = round((float(normal_price) * (1 - float(policy[4]))), 2)
+        return f'{discounted_price:.2f}' if discounted_price is not None else ""
+
+    def plan(self, movie_id, auditorium_id, date, start_time, discount_id=None):
+        """
+        Checks and prices a new showtime without saving it.
+
+        Args:
+            movie_id (str): ID of the movie.
+            auditorium_id (str): ID of the auditorium.
+            date (str): Date as DD-MM-YYYY, after today.
+            start_time (str): Start time as HHMM.
+            discount_id (str, optional): ID of the discount policy; only for movies eligible for discount. Defaults to None.
+
+        Returns:
+            Showtime: The planned showtime, with showtime_id None.
+
+        Raises:
+            NotFoundError: If the movie, auditorium or discount policy does not exist.
+            InvalidRequestError: If the date or time is malformed, the date is not after today, or the movie is not eligible for discount.
+            SlotTakenError: If the auditorium is not free for the time slot.
+            FileNotFoundError: If a table file does not exist.
+        """
+        movie = self.movie(movie_id)
+        try:
+            if datetime.strptime(date, DATE_FORMAT) <= datetime.now():
+                raise InvalidRequestError("Showtime date should not be before today.")
+        except ValueError:
+            raise InvalidRequestError(f'Invalid date {date}: use DD-MM-YYYY.')
+        auditorium = _lookup(self.auditoriums_file, auditorium_id, "Auditorium")
+        end_time = self.end_time(movie_id, start_time)
+        if auditorium_id not in self.free_auditoriums(date, start_time, end_time, [auditorium_id]):
+            raise SlotTakenError(f'{auditorium_id} is not available from {start_time} to {end_time} on {date}.')
+        normal_price = round(float(auditorium[5]), 2)
+        discounted_price = ""
+        if discount_id:
+            if len(movie) < 12 or movie[11] != "Y":
+                raise InvalidRequestError(f'Movie {movie_id} is not eligible for discount.')
+            discounted_price = self.discounted_price(discount_id, normal_price)
+        return Showtime(None, movie_id, auditorium_id, date, start_time, end_time, f'{normal_price:.2f}', discounted_price, discount_id or "")
+
+    def add(self, showtime):
+        """
+        Checks a planned showtime again and saves it under a new showtime ID.
+
+        Args:
+            showtime (Showtime): The planned showtime, as returned by plan.
+
+        Returns:
+            Showtime: The saved showtime, with its showtime_id set.
+
+        Raises:
+            NotFoundError, InvalidRequestError, SlotTakenError: As for plan.
+            FileNotFoundError: If a table file does not exist.
+        """
+        showtime = self.plan(showtime.movie_id, showtime.auditorium_id, showtime.date, showtime.start_time, showtime.discount_id or None)
+        block = id_block(counter_file(self.database_dir, "showtime"), ID_BLOCK_SIZE, self.showtimes_file, "ST")
+        showtime.showtime_id = f'ST{block.take():04}'
+        append_row(self.showtimes_file, ", ".join(lint_item(item) for item in [showtime.showtime_id] + showtime.fields()))
+        return showtime
@@ -0,0 +1,554 @@
+#------------------------- STORAGE --------------------------------------------------
+# Shared table storage for the text files in Cinema/Database.
+#
+# Each table file is read once into memory and indexed by its primary key (the
+# first field of every line). The cached copy is checked against the file's
+# modification time, size and inode before use, so writes made by other roles or
+# other terminals are picked up on the next lookup. When another process only
+# appended lines, just those lines are read and added to the indexes; the whole
+# file is read again only if it was replaced, truncated or changed in place.
+# Loaders that turn a table into other structures (dicts, seat layouts) cache
+# their result on the table through load_parsed, so it is rebuilt only when the
+# file changes. The cache keeps the most recently used tables up to CACHE_LIMIT
+# bytes of file content in total; a table larger than that on its own (the
+# bookings file of a big multiplex) is kept as well, and only dropped when another
+# table at least as large is loaded.
+#
+# Whole-file rewrites go through atomic_write: the new content is written to a
+# temporary file in the same directory and renamed over the original, so a crash
+# or Ctrl-C mid-write leaves either the old or the new table, never a truncated one.
+# DURABILITY controls how much is fsynced. Programs set it at startup from the
+# CINEMA_DURABILITY environment variable (default "close"), so a batch job can run
+# with CINEMA_DURABILITY=none:
+#   "always" - fsync every append, every rewrite and the directory after the rename
+#   "close"  - fsync the temporary file before it is renamed into place
+#   "none"   - no fsync; rewrites are still atomic but may be lost on power failure
+import os
+import re
+import stat
+import tempfile
+from collections import OrderedDict
+
+from iostats import count_rows
+
+DURABILITY_MODES = ("always", "close", "none")
+DURABILITY_ENV = "CINEMA_DURABILITY"
+DURABILITY = "close"
+CACHE_LIMIT = 32 * 1024 * 1024
+
+
+# A field is a run of plain characters and quoted sections; a quote left open runs to the end of the line.
+_FIELD = re.compile(r'(?:[^,"]+|"[^"]*(?:"|\Z))*')
+
+
+def split_raw_line(line):
+    """
+    Splits a line into fields using comma as separator, keeping the double quotation marks around quoted fields.
+
+    Args:
+        line (str): The line to be split.
+
+    Returns:
+        list: A list of the raw fields that makes up the line, with surrounding whitespace removed.
+    """
+    if '"' not in line:
+        fields = line.split(",")
+        if fields[-1] == "":
+            fields.pop()
+        return [field.strip() for field in fields]
+    fields = []
+    position = 0
+    end = len(line)
+    while True:
+        match = _FIELD.match(line, position)
+        position = match.end()
+        if position >= end:
+            if match.group():
+                fields.append(match.group().strip())
+            return fields
+        fields.append(match.group().strip())
+        position += 1
+
+
+def split_line(line):
+    """
+    Splits a line into fields using comma as separator, while refraining from splitting when wrapped in double quotation marks.
+
+    Args:
+        line (str): The line to be split.
+
+    Returns:
+        list: A list of the fields that makes up the line.
+    """
+    return [i.strip('"') for i in split_raw_line(line)]
+
+
+def lint_item(value):
+    """
+    Formats a list or string to be entered in text file.
+
+    Args:
+        value (Any): Item to be formatted. Lists are joined with "|". Joined lists or strings are wrapped in quotation marks if they contain a comma or space.
+
+    Returns:
+        str: Formatted string.
+    """
+    if isinstance(value, list):
+        value = "|".join(value)
+    value = str(value).strip()
+    return f'"{value}"' if "," in value or " " in value else value
+
+
+def set_durability(mode):
+    """
+    Sets how much of each write is flushed to disk before returning.
+
+    Args:
+        mode (str): One of "always", "close" or "none".
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: If the mode is not recognised.
+    """
+    global DURABILITY
+    if mode not in DURABILITY_MODES:
+        raise ValueError(f'Unknown durability mode "{mode}", expected one of {", ".join(DURABILITY_MODES)}.')
+    DURABILITY = mode
+
+
+def durability_from_environment():
+    """
+    Sets the durability mode from CINEMA_DURABILITY, if it is set.
+
+    Returns:
+        str: The durability mode in effect.
+
+    Raises:
+        ValueError: If the variable names an unknown mode.
+    """
+    mode = os.environ.get(DURABILITY_ENV, "").strip().lower()
+    if mode:
+        set_durability(mode)
+    return DURABILITY
+
+
+def _fsync_directory(directory):
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def atomic_write(filename, content):
+    """
+    Replaces the contents of a file without ever leaving it partially written.
+
+    Args:
+        filename (str): Path to the file.
+        content (str): The complete new contents.
+
+    Returns:
+        None
+
+    Raises:
+        OSError: If the temporary file cannot be written or renamed.
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    fd, temp_path = tempfile.mkstemp(prefix="." + os.path.basename(filename) + ".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+            f.flush()
+            if DURABILITY != "none":
+                os.fsync(f.fileno())
+        try:
+            os.chmod(temp_path, stat.S_IMODE(os.stat(filename).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(temp_path, filename)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    if DURABILITY == "always":
+        _fsync_directory(directory)
+
+
+def append_text(filename, text):
+    """
+    Appends text to a file, fsyncing it when DURABILITY is "always".
+
+    Args:
+        filename (str): Path to the file.
+        text (str): Text to be appended.
+
+    Returns:
+        None
+    """
+    with open(filename, "a", encoding="utf-8") as f:
+        f.write(text)
+        if DURABILITY == "always":
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def file_signature(filename):
+    """
+    Retrieves the modification time, size and inode of a file, used to detect changes made outside this process.
+
+    Args:
+        filename (str): Path to the file.
+
+    Returns:
+        tuple: (modification time in nanoseconds, size in bytes, inode).
+    """
+    stat = os.stat(filename)
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+class Table:
+    """
+    In-memory copy of a table file with a hash index on the primary key.
+
+    Attributes:
+        filename (str): Path to the table file.
+        lines (list): Raw lines of the file, newline characters included.
+        records (list): Parsed fields of each line, in the same order as lines.
+        index (dict): Maps a primary key to the position of its first line.
+        signature (tuple): File signature at the time the table was loaded or last written.
+        parsed (dict): Results of load_parsed, keyed by parse function. Cleared whenever the table is written.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        with open(filename, "r", encoding="utf-8") as f:
+            stat = os.fstat(f.fileno())
+            self.lines = f.readlines()
+        self.signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        self.parsed = {}
+        self.records = [[i.strip() for i in split_line(line)] for line in self.lines]
+        count_rows(len(self.records))
+        self.reindex()
+
+    def reindex(self):
+        """
+        Rebuilds the primary-key index from the parsed records.
+
+        Returns:
+            None
+        """
+        self.index = {}
+        for position, record in enumerate(self.records):
+            self.index.setdefault(record[0], position)
+
+    def extend(self, signature):
+        """
+        Reads only the lines another process appended since the table was loaded.
+
+        Args:
+            signature (tuple): Current signature of the file.
+
+        Returns:
+            bool: True if the table is up to date, False if the file was replaced, truncated or changed in place and must be read again.
+        """
+        size = self.signature[1]
+        if signature[2] != self.signature[2] or signature[1] <= size or not self.lines or not self.lines[-1].endswith("\n"):
+            return False
+        last_line = self.lines[-1].encode("utf-8")
+        # Allow for the line having been written with "\r\n" on Windows.
+        start = max(0, size - len(last_line) - 1)
+        with open(self.filename, "rb") as f:
+            stat = os.fstat(f.fileno())
+            f.seek(start)
+            data = f.read(stat.st_size - start)
+        old, new = data[:size - start], data[size - start:]
+        # The last line read before must still be in place, or the file was rewritten rather than appended to.
+        if stat.st_ino != self.signature[2] or not old.replace(b"\r\n", b"\n").endswith(last_line) or not new.endswith(b"\n"):
+            return False
+        new_lines = new.decode("utf-8").replace("\r\n", "\n").splitlines(keepends=True)
+        count_rows(len(new_lines))
+        self.parsed = {}
+        for line in new_lines:
+            record = [i.strip() for i in split_line(line)]
+            self.lines.append(line)
+            self.records.append(record)
+            self.index.setdefault(record[0], len(self.records) - 1)
+            self.added(record)
+        self.signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        return True
+
+    def added(self, record):
+        """
+        Called after an entry is appended or updated. Subclasses override this to maintain secondary indexes.
+
+        Args:
+            record (list): Parsed fields of the entry.
+
+        Returns:
+            None
+        """
+
+    def removed(self, record):
+        """
+        Called after an entry is removed or before it is updated. Subclasses override this to maintain secondary indexes.
+
+        Args:
+            record (list): Parsed fields of the entry.
+
+        Returns:
+            None
+        """
+
+    def header(self):
+        """
+        Retrieves the header row of the table.
+
+        Returns:
+            list: Field names from the first line.
+        """
+        first_line = self.lines[0] if self.lines else ""
+        return [detail.strip() for detail in first_line.split(",")]
+
+    def get(self, entry_id):
+        """
+        Retrieves a specific entry by primary key.
+
+        Args:
+            entry_id (str): ID of the entry to be retrieved.
+
+        Returns:
+            list or None: Copy of the matching entry's fields, or None if not found.
+        """
+        position = self.index.get(entry_id)
+        if position is None:
+            return None
+        return list(self.records[position])
+
+    def rows(self):
+        """
+        Retrieves every entry below the header row.
+
+        Returns:
+            list: Copies of the parsed fields of each non-blank entry.
+        """
+        return [list(record) for record, line in zip(self.records[1:], self.lines[1:]) if line.strip()]
+
+
+_tables = OrderedDict()
+
+
+def _table_key(filename):
+    return os.path.abspath(filename)
+
+
+def load_table(filename, table_class=Table):
+    """
+    Retrieves the in-memory table for a file, reading it again only if the file changed since it was cached.
+
+    A cached table of a subclass of table_class is reused as it is, so loading a file as a plain Table does not
+    throw away the secondary indexes of a subclass such as BookingTable.
+
+    Args:
+        filename (str): Path to the table file.
+        table_class (type, optional): Table subclass to load the file with. Defaults to Table.
+
+    Returns:
+        Table: The cached table.
+
+    Raises:
+        FileNotFoundError: If the table file does not exist.
+    """
+    key = _table_key(filename)
+    table = _tables.get(key)
+    if table is not None and isinstance(table, table_class):
+        signature = file_signature(filename)
+        if table.signature == signature or table.extend(signature):
+            _tables.move_to_end(key)
+            return table
+    table = table_class(filename)
+    _tables[key] = table
+    _tables.move_to_end(key)
+    _evict()
+    return table
+
+
+def _evict():
+    """
+    Drops least recently used tables after a table is loaded, always keeping the one just loaded.
+
+    Tables no larger than CACHE_LIMIT share CACHE_LIMIT bytes between them. A table larger than CACHE_LIMIT by
+    itself is not charged against them, and is only dropped to make room for another table at least as large.
+    """
+    entries = list(_tables.items())
+    newest = entries[-1][1].signature[1]
+    small = sum(table.signature[1] for _, table in entries if table.signature[1] <= CACHE_LIMIT)
+    for key, table in entries[:-1]:
+        size = table.signature[1]
+        if size <= CACHE_LIMIT:
+            if small > CACHE_LIMIT:
+                del _tables[key]
+                small -= size
+        elif size <= newest:
+            del _tables[key]
+
+
+def load_parsed(filename, parse, table_class=Table):
+    """
+    Retrieves parse(table) for a table file, reusing the previous result until the file changes.
+
+    The result is shared between callers and must not be modified.
+
+    Args:
+        filename (str): Path to the table file.
+        parse (callable): Function building the result from a Table.
+        table_class (type, optional): Table subclass to load the file with. Defaults to Table.
+
+    Returns:
+        object: Whatever parse returns.
+
+    Raises:
+        FileNotFoundError: If the table file does not exist.
+    """
+    table = load_table(filename, table_class)
+    if parse not in table.parsed:
+        table.parsed[parse] = parse(table)
+    return table.parsed[parse]
+
+
+def invalidate_table(filename):
+    """
+    Drops the cached copy of a table so that the next lookup reads the file again.
+
+    Args:
+        filename (str): Path to the table file.
+
+    Returns:
+        None
+    """
+    _tables.pop(_table_key(filename), None)
+
+
+def _written(table, expected_size):
+    """
+    Records the file signature after a write, or drops the table if someone else wrote to the file meanwhile.
+    """
+    table.parsed = {}
+    signature = file_signature(table.filename)
+    if signature[1] == expected_size:
+        table.signature = signature
+    else:
+        invalidate_table(table.filename)
+
+
+def append_row(filename, line, table_class=Table):
+    """
+    Appends a line to a table file and adds it to the in-memory index.
+
+    Args:
+        filename (str): Path to the table file.
+        line (str): Formatted line without trailing newline.
+        table_class (type, optional): Table subclass the file is loaded with. Defaults to Table.
+
+    Returns:
+        None
+
+    Raises:
+        FileNotFoundError: If the table file does not exist.
+    """
+    table = load_table(filename, table_class)
+    text = line + "\n"
+    if table.lines and not table.lines[-1].endswith("\n"):
+        table.lines[-1] += "\n"
+        text = "\n" + text
+    append_text(filename, text)
+    table.lines.append(line + "\n")
+    record = [i.strip() for i in split_line(line)]
+    count_rows(1)
+    table.records.append(record)
+    table.index.setdefault(record[0], len(table.records) - 1)
+    table.added(record)
+    _written(table, table.signature[1] + len(text.encode("utf-8")))
+
+
+def rewrite_table(table):
+    """
+    Writes the in-memory lines of a table back to its file.
+
+    Args:
+        table (Table): The table to be written.
+
+    Returns:
+        None
+    """
+    content = "".join(table.lines)
+    atomic_write(table.filename, content)
+    _written(table, len(content.encode("utf-8")))
+
+
+def update_row(filename, entry_id, detail_index, value, table_class=Table):
+    """
+    Replaces one field of every line with the given primary key and writes the table back.
+
+    Args:
+        filename (str): Path to the table file.
+        entry_id (str): ID of the entry to be updated.
+        detail_index (int): Index of the field within the entry to be updated.
+        value (str): Already formatted field value.
+        table_class (type, optional): Table subclass the file is loaded with. Defaults to Table.
+
+    Returns:
+        None
+
+    Raises:
+        FileNotFoundError: If the table file does not exist.
+    """
+    table = load_table(filename, table_class)
+    for position, record in enumerate(table.records):
+        if record[0] != entry_id:
+            continue
+        fields = split_raw_line(table.lines[position])
+        fields[detail_index] = value
+        table.removed(record)
+        table.lines[position] = ", ".join(fields) + "\n"
+        table.records[position] = [i.strip() for i in split_line(table.lines[position])]
+        table.added(table.records[position])
+    table.reindex()
+    rewrite_table(table)
+
+
+def remove_row(filename, entry_id, table_class=Table):
+    """
+    Removes every line with the given primary key and writes the table back.
+
+    Args:
+        filename (str): Path to the table file.
+        entry_id (str): ID of the entry to be removed.
+        table_class (type, optional): Table subclass the file is loaded with. Defaults to Table.
+
+    Returns:
+        None
+
+    Raises:
+        FileNotFoundError: If the table file does not exist.
+    """
+    table = load_table(filename, table_class)
+    kept = []
+    for position, record in enumerate(table.records):
+        if record[0] == entry_id:
+            table.removed(record)
+        else:
+            kept.append(position)
+    table.lines = [table.lines[position] for position in kept]
+    table.records = [table.records[position] for position in kept]
+    table.reindex()
+    rewrite_table(table)
@@ -0,0 +1,153 @@
+#------------------------- TERMINAL --------------------------------------------------
+# Console helpers shared by the main menu and the role menus: colored messages,
+# clearing the screen, and input prompts that repeat until the value is valid.
+from datetime import datetime
+import os
+
+RED = "\033[91m"
+GREEN = "\033[92m"
+BLUE = "\033[94m"
+RESET = "\033[0m"
+
+
+def color_error_message(message):
+    """
+    Wraps a string with ANSI escape codes to display it in red.
+
+    Args:
+        message (str): The error message to be colorized.
+
+    Returns:
+        colored_message (str): The error message wrapped with red color and reset codes.
+    """
+    colored_message = RED + message + RESET
+    return colored_message
+
+
+def color_completion_message(message):
+    """
+    Wraps a string with ANSI escape codes to display it in green.
+
+    Args:
+        message (str): The completion message to be colorized.
+
+    Returns:
+        colored_message (str): The completion message wrapped with green color and reset codes.
+    """
+    colored_message = GREEN + message + RESET
+    return colored_message
+
+
+def color_confirmation_message(message):
+    """
+    Wraps a string with ANSI escape codes to display it in blue.
+
+    Args:
+        message (str): The confirmation message to be colorized.
+
+    Returns:
+        colored_message (str): The confirmation message wrapped with blue color and reset codes.
+    """
+    colored_message = BLUE + message + RESET
+    return colored_message
+
+
+def clear_terminal():
+    """Clears the terminal screen.
+
+    Returns:
+        None
+    """
+    if os.name == "nt":
+        _ = os.system("cls")
+    else:
+        print("\033[H\033[2J\033[3J", end="", flush=True)
+
+
+def validate_yes_no(prompt):
+    """
+    Ensures that input is either Y or N.
+
+    Args:
+        prompt (str): Input prompt shown to the user.
+
+    Returns:
+        str: "Y or "N" entered by the user.
+    """
+    while True:
+        value = input(prompt).upper().strip()
+        if value in ("Y", "N"):
+            return value
+        print(color_error_message("Invalid input: please enter 'Y' or 'N'."))
+
+
+def validate_int(prompt):
+    """
+    Ensures that input is an integer.
+
+    Args:
+        prompt (str): Input prompt shown to the user.
+
+    Returns:
+        int: Integer entered by the user.
+    """
+    while True:
+        try:
+            value = int(input(prompt).strip())
+            return value
+        except ValueError:
+            print(color_error_message("Invalid input: please enter an integer."))
+
+
+def validate_float(prompt):
+    """
+    Ensures that input is a float and rounds it to two decimal places.
+
+    Args:
+        prompt (str): Input prompt shown to the user.
+
+    Returns:
+        float: Float entered by the user, rounded to two decimal places.
+    """
+    while True:
+        try:
+            value = round(float(input(prompt).strip()), 2)
+            return value
+        except ValueError:
+            print(color_error_message("Invalid input: please enter a float to 2 decimal places (e.g., 0.00)."))
+
+
+def validate_date(prompt):
+    """
+    Ensures that input is a date formatted as DD-MM-YYYY.
+
+    Args:
+        prompt (str): Input prompt shown to the user.
+
+    Returns:
+        str: Date entered by the user, formatted as DD-MM-YYYY.
+    """
+    while True:
+        try:
+            value = datetime.strptime(input(prompt).strip(), "%d-%m-%Y")
+            return value.strftime("%d-%m-%Y")
+        except ValueError:
+            print(color_error_message("Invalid input: please enter a date in the format DD-MM-YYYY (e.g., 31-12-2000)."))
+
+
+def validate_time(prompt):
+    """
+    Ensures that input is a time formatted as HHMM.
+
+    Args:
+        prompt (str): Input prompt shown to the user.
+
+    Returns:
+        str: Time entered by the user, formatted as HHMM.
+    """
+    while True:
+        try:
+            value = datetime.strptime(input(prompt).strip(), "%H%M")
+            return value.strftime("%H%M")
+        except ValueError:
+            print(color_error_message("Invalid input: please enter a time in the format HHMM (e.g., 2359)."))
@@ -0,0 +1,66 @@
+import asyncio
+import json
+import os
+import shutil
+
+import pytest
+
+import booking_server
+import storage
+from services import BookingService
+
+DATABASE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "Database")
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "_tables", storage.OrderedDict())
+    database_dir = tmp_path / "Database"
+    shutil.copytree(DATABASE_DIR, database_dir, ignore=shutil.ignore_patterns("*.lock", "*.sock", "seat_holds.txt"))
+    return database_dir
+
+
+async def request(address, op, args):
+    reader, writer = await asyncio.open_unix_connection(address)
+    writer.write((json.dumps({"op": op, "args": args}) + "\n").encode("utf-8"))
+    await writer.drain()
+    response = json.loads(await reader.readline())
+    writer.close()
+    return response
+
+
+async def with_server(database_dir, client):
+    address = str(database_dir / "booking.sock")
+    server = asyncio.create_task(booking_server.serve("unix:" + address, BookingService(str(database_dir), holder="server")))
+    while not os.path.exists(address):
+        await asyncio.sleep(0.01)
+    try:
+        return await client(address)
+    finally:
+        server.cancel()
+        await asyncio.gather(server, return_exceptions=True)
+
+
+def test_two_terminals_booking_the_same_seat(database):
+    async def client(address):
+        booking = {"showtime_id": "ST0001", "seats": ["G15"], "normal": 1, "discounted": 0}
+        return await asyncio.gather(request(address, "book", dict(booking, customer_id="C0001")),
+                                    request(address, "book", dict(booking, customer_id="C0002")))
+
+    responses = asyncio.run(with_server(database, client))
+    assert sorted(response["ok"] for response in responses) == [False, True]
+    booked, = [response["result"] for response in responses if response["ok"]]
+    refused, = [response for response in responses if not response["ok"]]
+    assert refused["error"] == "SeatTakenError"
+    assert refused["seats"] == ["G15"]
+    lines = [line for line in (database / "movie_bookings.txt").read_text(encoding="utf-8").splitlines() if "G15" in line]
+    assert lines == [f'{booked["booking_id"]}, ST0001, {booked["customer_id"]}, G15, 1|0']
+
+
+def test_arguments_of_the_wrong_type_get_an_error_response(database):
+    async def client(address):
+        return await request(address, "quote", {"showtime_id": "ST0001", "seats": [1], "normal": 1, "discounted": 0})
+
+    response = asyncio.run(with_server(database, client))
+    assert response["ok"] is False
+    assert response["error"] == "InvalidRequestError"
@@ -0,0 +1,93 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+import bookings
+import storage
+from bookings import BookingTable, TOMBSTONE, load_bookings, compact_bookings, cancel_booking_entry
+from seating import seat_mask
+
+CODE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEADER = "booking_id, showtime_id, customer_id, seat_ids, normal_discounted_tickets\n"
+LIVE = ["B0001, ST0001, C0001, A01|A02, 2|0\n",
+        "B0003,ST0001,  C0003, A05, 0|1\n",
+        'B0004, ST0002, C0001, "B01|B02", 1|1\n']
+DEAD = ["B0002, ST0001, C0002, A03|A04, 2|0\n",
+        "B0005, ST0002, C0004, B03, 1|0\n"]
+
+
+@pytest.fixture
+def bookings_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "_tables", storage.OrderedDict())
+    bookings = tmp_path / "movie_bookings.txt"
+    lines = [HEADER, LIVE[0], DEAD[0], LIVE[1], f'{TOMBSTONE}, B0002\n', DEAD[1], LIVE[2], f'{TOMBSTONE}, B0005\n']
+    bookings.write_text("".join(lines), encoding="utf-8")
+    return bookings
+
+
+def test_tombstone_hides_the_booking_from_every_index(bookings_file):
+    table = load_bookings(str(bookings_file))
+    assert sorted(table.live) == ["B0001", "B0003", "B0004"]
+    assert table.get("B0002") is None
+    assert [table.records[p][0] for p in table.by_showtime["ST0001"]] == ["B0001", "B0003"]
+    assert table.seats["ST0001"] == seat_mask(["A01", "A02", "A05"])
+    assert table.seats["ST0002"] == seat_mask(["B01", "B02"])
+    assert table.dead == 4
+    assert table.dead_ratio() == pytest.approx(4 / 7)
+
+
+def test_cancelling_frees_the_seats(bookings_file, monkeypatch):
+    monkeypatch.setattr(bookings, "COMPACT_RATIO", 1.0)
+    cancel_booking_entry(str(bookings_file), "B0001")
+    table = load_bookings(str(bookings_file))
+    assert "B0001" not in table.live
+    assert table.seats["ST0001"] == seat_mask(["A05"])
+
+
+def test_compaction_keeps_live_rows_byte_for_byte(bookings_file):
+    compact_bookings(str(bookings_file))
+    assert bookings_file.read_bytes() == "".join([HEADER] + LIVE).encode("utf-8")
+    table = load_bookings(str(bookings_file))
+    assert table.dead == 0
+    assert [record[0] for record in table.rows()] == ["B0001", "B0003", "B0004"]
+
+
+APPEND = """
+import sys
+sys.path.insert(0, sys.argv[1])
+from locking import file_lock
+from bookings import add_booking
+with file_lock(sys.argv[2]):
+    add_booking(sys.argv[2], "B0006", "ST0002", "C0005", ["B04"], "1|0")
+"""
+
+
+def test_booking_appended_during_compaction_is_kept(bookings_file, monkeypatch):
+    compacting = threading.Event()
+    resume = threading.Event()
+    compact = BookingTable.compact
+
+    def slow_compact(table):
+        compacting.set()
+        resume.wait(10)
+        compact(table)
+
+    monkeypatch.setattr(BookingTable, "compact", slow_compact)
+    compaction = threading.Thread(target=compact_bookings, args=(str(bookings_file),))
+    compaction.start()
+    assert compacting.wait(10)
+    terminal = subprocess.Popen([sys.executable, "-c", APPEND, CODE_DIR, str(bookings_file)])
+    try:
+        time.sleep(0.5)
+        assert terminal.poll() is None
+    finally:
+        resume.set()
+        compaction.join(10)
+        terminal.wait(10)
+    assert terminal.returncode == 0
+    assert bookings_file.read_bytes() == "".join([HEADER] + LIVE + ["B0006, ST0002, C0005, B04, 1|0\n"]).encode("utf-8")
+    assert load_bookings(str(bookings_file)).seats["ST0002"] == seat_mask(["B01", "B02", "B04"])
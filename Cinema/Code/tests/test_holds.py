@@ -0,0 +1,71 @@
+import builtins
+import os
+import shutil
+
+import pytest
+
+import role_clerk
+import storage
+from holds import HOLD_SECONDS, held_seats, place_hold, release_hold
+from seating import seat_mask
+from services import BookingService, SeatTakenError
+
+DATABASE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "Database")
+NOW = 1_800_000_000.0
+
+
+@pytest.fixture
+def holds_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "_tables", storage.OrderedDict())
+    return str(tmp_path / "seat_holds.txt")
+
+
+def test_held_seat_is_refused_to_another_holder(holds_file):
+    assert place_hold(holds_file, "ST0001", "kiosk-1", ["A01", "A02"], NOW + HOLD_SECONDS, now=NOW) == []
+    assert place_hold(holds_file, "ST0001", "kiosk-2", ["A02", "A03"], NOW + HOLD_SECONDS, now=NOW) == ["A02"]
+    assert held_seats(holds_file, "ST0001", "kiosk-2", now=NOW) == seat_mask(["A01", "A02"])
+    assert held_seats(holds_file, "ST0001", "kiosk-1", now=NOW) == 0
+    assert held_seats(holds_file, "ST0002", "kiosk-2", now=NOW) == 0
+
+
+def test_release_frees_the_seats(holds_file):
+    place_hold(holds_file, "ST0001", "kiosk-1", ["A01"], NOW + HOLD_SECONDS, now=NOW)
+    release_hold(holds_file, "ST0001", "kiosk-1", now=NOW)
+    assert held_seats(holds_file, "ST0001", "kiosk-2", now=NOW) == 0
+    assert place_hold(holds_file, "ST0001", "kiosk-2", ["A01"], NOW + HOLD_SECONDS, now=NOW) == []
+
+
+def test_hold_lapses_after_its_time(holds_file):
+    place_hold(holds_file, "ST0001", "kiosk-1", ["A01"], NOW + HOLD_SECONDS, now=NOW)
+    assert held_seats(holds_file, "ST0001", "kiosk-2", now=NOW + HOLD_SECONDS - 1) == seat_mask(["A01"])
+    later = NOW + HOLD_SECONDS + 1
+    assert held_seats(holds_file, "ST0001", "kiosk-2", now=later) == 0
+    assert place_hold(holds_file, "ST0001", "kiosk-2", ["A01"], later + HOLD_SECONDS, now=later) == []
+    with open(holds_file, encoding="utf-8") as f:
+        assert [line.split(",")[1].strip() for line in f.readlines()[1:]] == ["kiosk-2"]
+
+
+def failing_book(error):
+    def book(*args, **kwargs):
+        raise error
+    return book
+
+
+@pytest.mark.parametrize("answers, book", [
+    (["ST0001", "C0001", "G15", "1|0", "Y"], failing_book(OSError(28, "No space left on device"))),
+    (["ST0001", "C0001", "G15", "1|0", "Y"], failing_book(SeatTakenError("Already taken: G15", ["G15"]))),
+    (["ST0001", "C0001", "G15", "1|0", "N"], None),
+], ids=["save-fails", "seat-taken", "not-confirmed"])
+def test_clerk_releases_the_hold_when_no_booking_is_saved(answers, book, tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "_tables", storage.OrderedDict())
+    shutil.copytree(DATABASE_DIR, tmp_path / "Cinema" / "Database", ignore=shutil.ignore_patterns("*.lock", "*.sock", "seat_holds.txt"))
+    monkeypatch.chdir(tmp_path)
+    service = BookingService("Cinema/Database", holder="clerk-1")
+    if book is not None:
+        monkeypatch.setattr(service, "book", book)
+    monkeypatch.setattr(role_clerk, "booking_service", service)
+    replies = iter(answers)
+    monkeypatch.setattr(builtins, "input", lambda prompt="": next(replies))
+    role_clerk.book_ticket()
+    assert os.path.exists(service.holds_file)
+    assert held_seats(service.holds_file, "ST0001", "clerk-2") == 0
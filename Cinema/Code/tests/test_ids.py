@@ -0,0 +1,68 @@
+import os
+import shutil
+
+import pytest
+
+import ids
+import storage
+from services import ShowtimeService
+
+DATABASE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "Database")
+
+
+@pytest.fixture
+def counter_writes(monkeypatch):
+    writes = []
+    real_atomic_write = ids.atomic_write
+
+    def counting_atomic_write(filename, content):
+        writes.append((os.path.basename(filename), content))
+        real_atomic_write(filename, content)
+
+    monkeypatch.setattr(ids, "atomic_write", counting_atomic_write)
+    monkeypatch.setattr(ids, "_blocks", {})
+    return writes
+
+
+def test_block_of_ids_costs_one_counter_write(tmp_path, counter_writes):
+    counter = tmp_path / "COUNTER_movie_id.txt"
+    counter.write_text("7", encoding="utf-8")
+    block = ids.IdBlock(str(counter), block_size=3)
+    block.reserve(5)
+    assert [block.take() for _ in range(5)] == [7, 8, 9, 10, 11]
+    assert counter_writes == [("COUNTER_movie_id.txt", "12")]
+
+
+def test_unused_ids_are_handed_back(tmp_path, counter_writes):
+    counter = tmp_path / "COUNTER_movie_id.txt"
+    counter.write_text("7", encoding="utf-8")
+    block = ids.id_block(str(counter), block_size=10)
+    assert block.take() == 7
+    assert block.take() == 8
+    ids.release_id_blocks()
+    assert counter.read_text(encoding="utf-8") == "9"
+    assert block.take() == 9
+
+
+def test_unused_ids_are_skipped_once_another_terminal_reserved_after_them(tmp_path, counter_writes):
+    counter = tmp_path / "COUNTER_movie_id.txt"
+    counter.write_text("7", encoding="utf-8")
+    block = ids.IdBlock(str(counter), block_size=10)
+    assert block.take() == 7
+    assert ids.reserve_ids(str(counter)) == 17
+    block.release()
+    assert counter.read_text(encoding="utf-8") == "18"
+
+
+def test_adding_showtimes_writes_the_counter_once_per_block(tmp_path, monkeypatch, counter_writes):
+    monkeypatch.setattr(storage, "_tables", storage.OrderedDict())
+    database_dir = tmp_path / "Database"
+    shutil.copytree(DATABASE_DIR, database_dir, ignore=shutil.ignore_patterns("*.lock", "*.sock", "seat_holds.txt"))
+    first = int((database_dir / "COUNTER_showtime_id.txt").read_text(encoding="utf-8"))
+    service = ShowtimeService(str(database_dir))
+    added = [service.add(service.plan("M001", "AUD01", "01-01-2099", start_time)).showtime_id
+             for start_time in ("0900", "1300", "1700")]
+    assert added == [f'ST{number:04}' for number in range(first, first + 3)]
+    assert counter_writes == [("COUNTER_showtime_id.txt", str(first + 10))]
+    ids.release_id_blocks()
+    assert (database_dir / "COUNTER_showtime_id.txt").read_text(encoding="utf-8") == str(first + 3)
@@ -0,0 +1,44 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+CODE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROLE_MODULES = ["role_customer", "role_clerk", "role_manager", "role_technician"]
+# Generous enough for a slow CI machine; a role that starts reading tables at import blows well past it.
+IMPORT_BUDGET_SECONDS = 0.5
+
+PROBE = """
+import builtins, json, sys, time
+sys.path.insert(0, sys.argv[1])
+real_input = builtins.input
+started = time.perf_counter()
+__import__(sys.argv[2])
+print(json.dumps({"seconds": time.perf_counter() - started,
+                  "roles": sorted(name for name in sys.modules if name.startswith("role_")),
+                  "input_replaced": builtins.input is not real_input}))
+"""
+
+
+def import_in_fresh_process(module_name, cwd):
+    result = subprocess.run([sys.executable, "-c", PROBE, CODE_DIR, module_name], cwd=cwd,
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+@pytest.mark.parametrize("module_name", ROLE_MODULES)
+def test_role_imports_within_budget(module_name, tmp_path):
+    probe = import_in_fresh_process(module_name, tmp_path)
+    assert probe["seconds"] < IMPORT_BUDGET_SECONDS
+    assert probe["roles"] == [module_name]
+    assert not probe["input_replaced"]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_main_menu_imports_no_role(tmp_path):
+    probe = import_in_fresh_process("cinema_compiled", tmp_path)
+    assert probe["seconds"] < IMPORT_BUDGET_SECONDS
+    assert probe["roles"] == []
+    assert not probe["input_replaced"]
@@ -0,0 +1,46 @@
+import builtins
+
+import perfstats
+
+
+def test_timed_swaps_input_only_during_the_call(monkeypatch):
+    monkeypatch.setattr(builtins, "input", lambda prompt="": "yes")
+    real_input = builtins.input
+    seen = []
+
+    @perfstats.timed
+    def inner():
+        seen.append(builtins.input)
+        return input()
+
+    @perfstats.timed
+    def outer():
+        seen.append(builtins.input)
+        return inner()
+
+    assert builtins.input is real_input
+    assert outer() == "yes"
+    assert seen == [perfstats._waiting_input, perfstats._waiting_input]
+    assert builtins.input is real_input
+
+
+def test_timed_leaves_input_waits_out_of_the_histogram(monkeypatch):
+    clock = [0.0]
+    monkeypatch.setattr(perfstats.time, "perf_counter", lambda: clock[0])
+    monkeypatch.setattr(perfstats, "slow_threshold", lambda: float("inf"))
+
+    def slow_typist(prompt=""):
+        clock[0] += 30.0
+        return "1"
+
+    monkeypatch.setattr(builtins, "input", slow_typist)
+
+    @perfstats.timed
+    def action():
+        clock[0] += 0.002
+        return input()
+
+    action()
+    histogram = perfstats._histograms[f'{action.__module__}.{action.__name__}']
+    assert histogram.count == 1
+    assert abs(histogram.maximum - 0.002) < 1e-9
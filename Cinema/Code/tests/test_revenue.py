@@ -0,0 +1,44 @@
+import os
+import shutil
+
+import pytest
+
+import bookings
+import storage
+from bookings import rebuild_revenue_summary
+from services import BookingService
+from storage import update_row, remove_row
+
+DATABASE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "Database")
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "_tables", storage.OrderedDict())
+    monkeypatch.setattr(bookings, "COMPACT_RATIO", 1.0)
+    database_dir = tmp_path / "Database"
+    shutil.copytree(DATABASE_DIR, database_dir, ignore=shutil.ignore_patterns("*.lock", "*.sock", "seat_holds.txt"))
+    service = BookingService(str(database_dir), holder="clerk-1")
+    assert rebuild_revenue_summary(service.bookings_file) == []
+    return service
+
+
+def totals(service):
+    summary = service.revenue()
+    return summary.normal_tickets, summary.discounted_tickets, round(summary.normal_revenue, 2), round(summary.discounted_revenue, 2)
+
+
+@pytest.mark.parametrize("change_showtime", [
+    lambda showtimes_file: update_row(showtimes_file, "ST0001", 6, "30.00"),
+    lambda showtimes_file: remove_row(showtimes_file, "ST0001"),
+], ids=["repriced", "deleted"])
+def test_cancel_then_rebuild_finds_no_mismatch(service, change_showtime):
+    before = totals(service)
+    kept = service.book("ST0002", "C0002", ["H01"], 1)
+    cancelled = service.book("ST0001", "C0001", ["G14", "G15"], 1, 1)
+    change_showtime(service.showtimes_file)
+    service.cancel(cancelled.booking_id)
+    kept_price = float(service.showtime("ST0002")[6])
+    assert totals(service) == (before[0] + 1, before[1], round(before[2] + kept_price, 2), before[3])
+    assert rebuild_revenue_summary(service.bookings_file) == []
+    assert totals(service) == (before[0] + 1, before[1], round(before[2] + kept_price, 2), before[3])
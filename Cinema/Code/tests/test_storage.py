@@ -0,0 +1,85 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import storage
+from bookings import BookingTable, load_bookings
+
+CODE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "_tables", storage.OrderedDict())
+    monkeypatch.setattr(storage, "CACHE_LIMIT", 300 * 1024)
+    bookings = tmp_path / "movie_bookings.txt"
+    lines = ["booking_id, showtime_id, customer_id, seat_ids, normal_discounted_tickets\n"]
+    lines += [f'B{number:05}, ST{number % 500:04}, C0001, A{number % 20 + 1:02}, 1|0\n' for number in range(1, 12000)]
+    bookings.write_text("".join(lines), encoding="utf-8")
+    showtimes = tmp_path / "movie_showtimes.txt"
+    showtimes.write_text("showtime_id, movie_id\nST0001, M001\n", encoding="utf-8")
+    return bookings, showtimes
+
+
+def test_small_table_lookup_keeps_bookings_larger_than_limit(database):
+    bookings, showtimes = database
+    assert bookings.stat().st_size > storage.CACHE_LIMIT
+    table = load_bookings(str(bookings))
+    storage.load_table(str(showtimes))
+    assert load_bookings(str(bookings)) is table
+
+
+def test_small_tables_share_limit_without_dropping_bookings(database, tmp_path):
+    bookings, showtimes = database
+    table = load_bookings(str(bookings))
+    others = []
+    for number in range(5):
+        other = tmp_path / f'table_{number}.txt'
+        other.write_text("id, value\n" + "".join(f'{i}, {"x" * 80}\n' for i in range(1000)), encoding="utf-8")
+        storage.load_table(str(other))
+        others.append(storage._table_key(str(other)))
+    assert load_bookings(str(bookings)) is table
+    small = sum(storage._tables[key].signature[1] for key in others if key in storage._tables)
+    assert small <= storage.CACHE_LIMIT
+    assert others[-1] in storage._tables
+
+
+def test_appended_booking_is_read_without_reloading(database):
+    bookings, _ = database
+    table = load_bookings(str(bookings))
+    with open(bookings, "a", encoding="utf-8") as f:
+        f.write("B99999, ST0001, C0002, T01, 1|0\nCANCELLED, B00001\n")
+    assert load_bookings(str(bookings)) is table
+    assert table.get("B99999") is not None
+    assert table.get("B00001") is None
+    storage.invalidate_table(str(bookings))
+    reloaded = storage.load_table(str(bookings), BookingTable)
+    assert reloaded.seats == table.seats and reloaded.live == table.live
+
+
+def test_durability_is_read_from_the_environment(monkeypatch):
+    monkeypatch.setattr(storage, "DURABILITY", "close")
+    monkeypatch.setenv(storage.DURABILITY_ENV, "None")
+    assert storage.durability_from_environment() == "none"
+    assert storage.DURABILITY == "none"
+
+
+def test_unknown_durability_mode_is_refused(monkeypatch):
+    monkeypatch.setattr(storage, "DURABILITY", "close")
+    monkeypatch.setenv(storage.DURABILITY_ENV, "sometimes")
+    with pytest.raises(ValueError, match="sometimes"):
+        storage.durability_from_environment()
+    with pytest.raises(ValueError):
+        storage.set_durability("fsync")
+    assert storage.DURABILITY == "close"
+
+
+def test_unknown_durability_mode_stops_the_program(tmp_path):
+    environment = dict(os.environ, **{storage.DURABILITY_ENV: "sometimes"})
+    result = subprocess.run([sys.executable, os.path.join(CODE_DIR, "cinema_compiled.py")], cwd=tmp_path, env=environment,
+                            input="", capture_output=True, text=True)
+    assert result.returncode != 0
+    assert "sometimes" in result.stderr
+    assert list(tmp_path.iterdir()) == []